@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from typing import Protocol
 
@@ -53,8 +54,10 @@ class PlaceholderScreen:
 
 
 class App:
-    def __init__(self, window_size: tuple[int, int]) -> None:
+    def __init__(self, window_size: tuple[int, int], frame_source: str | None = None) -> None:
         settings = load_settings()
+        self.frame_source = frame_source
+        self.target_fps = settings.target_fps
         self.window_options = WindowOptions(
             webcam_view_mode=settings.webcam_view_mode,
             scoreboard_mode=settings.scoreboard_mode,
@@ -83,7 +86,9 @@ class App:
 
     def _show_calibration(self) -> None:
         self.manager.current = CalibrationScreen(
-            window_size=self.window_size, on_back=self._show_menu
+            window_size=self.window_size,
+            on_back=self._show_menu,
+            frame_source=self.frame_source,
         )
 
     def _show_play(self) -> None:
@@ -93,6 +98,7 @@ class App:
             window_size=self.window_size,
             on_back=self._show_menu,
             on_pause=self._show_pause,
+            frame_source=self.frame_source,
         )
         self.manager.current = self.play_screen
 
@@ -124,6 +130,7 @@ class App:
             window_size=self.window_size,
             on_back=self._show_menu,
             on_pause=self._show_pause,
+            frame_source=self.frame_source,
         )
         self.manager.current = self.play_screen
 
@@ -144,7 +151,9 @@ class App:
         if self.play_screen is not None:
             self.play_screen.stop_camera()
         self.manager.current = CalibrationScreen(
-            window_size=self.window_size, on_back=self._show_pause
+            window_size=self.window_size,
+            on_back=self._show_pause,
+            frame_source=self.frame_source,
         )
 
     def _resolve_window_size(self, requested: tuple[int, int]) -> tuple[int, int]:
@@ -179,6 +188,9 @@ class App:
             self.manager.update(dt)
             self.manager.render(self.screen)
             pygame.display.flip()
-            self.clock.tick(60)
+            on_frame_presented = getattr(self.manager.current, "on_frame_presented", None)
+            if on_frame_presented is not None:
+                on_frame_presented(time.perf_counter())
+            self.clock.tick(self.target_fps)
 
         return 0
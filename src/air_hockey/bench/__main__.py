@@ -0,0 +1,57 @@
+"""Run every benchmark suite: `python -m air_hockey.bench`.
+
+Writes one JSON document keyed by suite. Store a run with `--output` and pass
+it back with `--baseline` to fail on regressions beyond `--threshold`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from air_hockey.bench import ai, physics, vision
+from air_hockey.bench.common import DEFAULT_THRESHOLD, compare, load_results, write_results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m air_hockey.bench", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="physics runs per case; the fastest is kept"
+    )
+    parser.add_argument(
+        "--vision-frames", type=int, default=60, help="frames per vision configuration; 0 skips"
+    )
+    parser.add_argument("--output", type=Path, default=None, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, default=None, help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    results = {
+        "physics": physics.run(args.ticks, args.seed, repeat=args.repeat),
+        "ai": ai.run(args.ticks, seed=args.seed),
+    }
+    if args.vision_frames > 0:
+        results["vision"] = vision.run(frames=args.vision_frames, seed=args.seed)
+    print(json.dumps(results, indent=2))
+    if args.output is not None:
+        write_results(args.output, results)
+    if args.baseline is None:
+        return 0
+
+    baseline = load_results(args.baseline)
+    regressions = []
+    for suite, entries in results.items():
+        regressions.extend(compare(entries, baseline.get(suite, []), args.threshold))
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
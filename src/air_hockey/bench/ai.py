@@ -0,0 +1,150 @@
+"""Per-tick cost benchmark for the CPU opponent.
+
+Run with `python -m air_hockey.bench.ai`. Tick cost is the controller's own
+thread CPU time. Every difficulty runs `--repeats` times and the bench exits
+non-zero if the median of the per-repeat p99 exceeds the controller budget, or
+if `--baseline` is given and a case regressed beyond `--threshold`. Ticks whose
+wall-clock time exceeded the budget while their CPU time did not were preempted;
+they are reported as `preempted` and `wall_max_us` but do not fail the run. The
+garbage collector is paused while sampling so the numbers reflect controller
+work, not GC pauses.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from air_hockey.bench.common import (
+    DEFAULT_THRESHOLD,
+    compare,
+    load_results,
+    percentile,
+    summarize,
+    write_results,
+)
+from air_hockey.engine.physics import PhysicsWorld
+from air_hockey.game.ai import DEFAULT_BUDGET_US, AiController, Difficulty
+from air_hockey.game.field import FieldSpec
+
+TIME_STEP = 1.0 / 120.0
+
+
+def _sample(
+    difficulty: Difficulty, ticks: int, budget_us: float, seed: int
+) -> tuple[list[int], list[int], list[AiController]]:
+    """Per-tick CPU and wall-clock cost of both controllers over one seeded rally."""
+    rng = random.Random(seed)
+    field = FieldSpec()
+    world = PhysicsWorld(field, puck_damping=0.2, max_puck_speed=4.0, continuous_collision=True)
+    controllers = [
+        AiController(field, left=True, difficulty=difficulty, budget_us=budget_us, seed=seed),
+        AiController(field, left=False, difficulty=difficulty, budget_us=budget_us, seed=seed + 1),
+    ]
+    cpu: list[int] = []
+    wall: list[int] = []
+    clock = time.perf_counter_ns
+    gc.collect()
+    gc.disable()
+    try:
+        for tick in range(ticks):
+            puck = world.entities.puck
+            if tick % 240 == 0 or abs(puck.x) > field.width / 2.0:
+                puck.position = (rng.uniform(-0.8, 0.8), rng.uniform(-0.4, 0.4))
+                puck.linearVelocity = (rng.uniform(-4.0, 4.0), rng.uniform(-4.0, 4.0))
+            positions = []
+            for controller in controllers:
+                start = clock()
+                positions.append(controller.update(world, TIME_STEP))
+                wall.append(clock() - start)
+                cpu.append(controller.last_tick_ns)
+            world.set_mallet_positions(positions[0], positions[1], TIME_STEP, max_speed=2.0)
+            world.step(TIME_STEP)
+    finally:
+        gc.enable()
+    return cpu, wall, controllers
+
+
+def run_case(
+    difficulty: Difficulty, ticks: int, budget_us: float, seed: int, repeats: int = 3
+) -> dict[str, object]:
+    budget_ns = budget_us * 1000.0
+    cpu: list[int] = []
+    wall: list[int] = []
+    controllers: list[AiController] = []
+    repeat_p99: list[float] = []
+    for repeat in range(max(1, repeats)):
+        cpu_samples, wall_samples, used = _sample(difficulty, ticks, budget_us, seed + 2 * repeat)
+        repeat_p99.append(percentile(sorted(cpu_samples), 0.99) / 1000.0)
+        cpu.extend(cpu_samples)
+        wall.extend(wall_samples)
+        controllers.extend(used)
+
+    result = summarize(f"ai_{difficulty.value}", cpu)
+    result.update(
+        difficulty=difficulty.value,
+        budget_us=budget_us,
+        repeats=len(repeat_p99),
+        gate_p99_us=statistics.median(repeat_p99),
+        wall_max_us=max(wall) / 1000.0,
+        preempted=sum(
+            1 for used, elapsed in zip(cpu, wall) if elapsed > budget_ns >= used
+        ),
+        plans=sum(controller.plan_count for controller in controllers),
+        overruns=sum(controller.overruns for controller in controllers),
+        truncated=sum(controller.truncated for controller in controllers),
+    )
+    return result
+
+
+def run(
+    ticks: int = 20000, budget_us: float = DEFAULT_BUDGET_US, seed: int = 1, repeats: int = 3
+) -> list[dict[str, object]]:
+    return [run_case(level, ticks, budget_us, seed, repeats) for level in Difficulty]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--budget-us", type=float, default=DEFAULT_BUDGET_US)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=None, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, default=None, help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    results = run(args.ticks, args.budget_us, args.seed, args.repeats)
+    print(json.dumps(results, indent=2))
+    if args.output is not None:
+        write_results(args.output, {"ai": results})
+    failed = [result for result in results if result["gate_p99_us"] > args.budget_us]
+    for result in failed:
+        print(
+            f"OVER BUDGET {result['case']}: p99 {result['gate_p99_us']:.1f} us"
+            f" > {args.budget_us:g} us",
+            file=sys.stderr,
+        )
+    for result in results:
+        if result["preempted"]:
+            print(
+                f"PREEMPTED {result['case']}: {result['preempted']} ticks over budget on the"
+                f" wall clock only (max {result['wall_max_us']:.1f} us)",
+                file=sys.stderr,
+            )
+    if args.baseline is not None:
+        regressions = compare(results, load_results(args.baseline).get("ai", []), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        failed.extend(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
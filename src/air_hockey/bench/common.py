@@ -0,0 +1,104 @@
+"""Shared timing, summary and baseline helpers for the benchmark suites."""
+
+from __future__ import annotations
+
+import gc
+import json
+import time
+from pathlib import Path
+from typing import Callable, Iterable
+
+DEFAULT_THRESHOLD = 0.2
+# Tail latencies of microsecond-scale samples move with scheduler noise, so they are
+# compared only when both runs took several repeats, and against a wider threshold.
+DEFAULT_TAIL_THRESHOLD = 1.0
+MIN_TAIL_REPEATS = 3
+# Lower-is-better and higher-is-better metrics checked against a baseline.
+COST_METRICS = ("p50_us", "cpu_us")
+TAIL_METRICS = ("p99_us",)
+RATE_METRICS = ("ticks_per_second", "frames_per_second", "hit_rate")
+
+
+def percentile(sorted_values: list[int], fraction: float) -> int:
+    index = min(len(sorted_values) - 1, int(fraction * (len(sorted_values) - 1) + 0.5))
+    return sorted_values[index]
+
+
+def measure(step: Callable[[], None], iterations: int, warmup: int = 200) -> list[int]:
+    """Time `iterations` calls of `step` in nanoseconds with the GC paused."""
+    for _ in range(warmup):
+        step()
+    samples = [0] * iterations
+    clock = time.perf_counter_ns
+    gc.collect()
+    gc.disable()
+    try:
+        for index in range(iterations):
+            start = clock()
+            step()
+            samples[index] = clock() - start
+    finally:
+        gc.enable()
+    return samples
+
+
+def summarize(case: str, samples: list[int], ticks_per_sample: int = 1) -> dict[str, object]:
+    """Per-sample percentiles in microseconds plus simulated ticks per wall-clock second."""
+    ordered = sorted(samples)
+    total_ns = sum(ordered)
+    return {
+        "case": case,
+        "samples": len(ordered),
+        "ticks_per_second": len(ordered) * ticks_per_sample * 1e9 / total_ns if total_ns else 0.0,
+        "mean_us": total_ns / len(ordered) / 1000.0,
+        "p50_us": percentile(ordered, 0.5) / 1000.0,
+        "p95_us": percentile(ordered, 0.95) / 1000.0,
+        "p99_us": percentile(ordered, 0.99) / 1000.0,
+        "p999_us": percentile(ordered, 0.999) / 1000.0,
+        "max_us": ordered[-1] / 1000.0,
+    }
+
+
+def write_results(path: Path, results: dict[str, list[dict[str, object]]]) -> None:
+    path.write_text(json.dumps(results, indent=2))
+
+
+def load_results(path: Path) -> dict[str, list[dict[str, object]]]:
+    return json.loads(path.read_text())
+
+
+def compare(
+    current: Iterable[dict[str, object]],
+    baseline: Iterable[dict[str, object]],
+    threshold: float = DEFAULT_THRESHOLD,
+    tail_threshold: float = DEFAULT_TAIL_THRESHOLD,
+) -> list[str]:
+    """Describe every metric that regressed by more than `threshold` (a fraction).
+
+    Tail metrics use `tail_threshold` and are skipped unless both entries report
+    at least `MIN_TAIL_REPEATS` repeats.
+    """
+    reference = {entry["case"]: entry for entry in baseline}
+    regressions = []
+    for entry in current:
+        old = reference.get(entry["case"])
+        if old is None:
+            continue
+        limits = {key: threshold for key in COST_METRICS}
+        if min(entry.get("repeats", 1), old.get("repeats", 1)) >= MIN_TAIL_REPEATS:
+            limits.update((key, tail_threshold) for key in TAIL_METRICS)
+        for key, limit in limits.items():
+            if key in entry and key in old and old[key] > 0:
+                change = entry[key] / old[key] - 1.0
+                if change > limit:
+                    regressions.append(
+                        f"{entry['case']}: {key} {old[key]:.2f} -> {entry[key]:.2f} (+{change:.0%})"
+                    )
+        for key in RATE_METRICS:
+            if key in entry and key in old and old[key] > 0:
+                change = 1.0 - entry[key] / old[key]
+                if change > threshold:
+                    regressions.append(
+                        f"{entry['case']}: {key} {old[key]:,.0f} -> {entry[key]:,.0f} (-{change:.0%})"
+                    )
+    return regressions
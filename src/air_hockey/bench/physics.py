@@ -0,0 +1,193 @@
+"""Tick-cost benchmark for the physics step and the play screen substep loop.
+
+Run with `python -m air_hockey.bench.physics`. Prints JSON; with `--baseline`
+it exits non-zero when any case regresses beyond `--threshold` against a
+stored result file (write one with `--output`). The play screen case runs on
+default `Settings()`, not the user's saved profile, so results do not depend on
+the machine's configuration.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import sys
+from pathlib import Path
+from typing import Callable
+
+from air_hockey.bench.common import (
+    DEFAULT_THRESHOLD,
+    compare,
+    load_results,
+    measure,
+    summarize,
+    write_results,
+)
+from air_hockey.config.settings import Settings
+from air_hockey.engine.physics import PhysicsWorld
+from air_hockey.game.field import FieldSpec
+
+TIME_STEP = 1.0 / 120.0
+FRAME_TIME = 1.0 / 60.0
+
+
+def _open_world(continuous: bool, seed: int) -> Callable[[], None]:
+    """Puck crossing an open table with parked mallets."""
+    rng = random.Random(seed)
+    world = PhysicsWorld(
+        FieldSpec(), puck_damping=0.2, max_puck_speed=4.0, continuous_collision=continuous
+    )
+    world.entities.mallet_left.position = (-0.8, 0.35)
+    world.entities.mallet_right.position = (0.8, -0.35)
+    puck = world.entities.puck
+    half_width = world.field.width / 2.0
+
+    def step() -> None:
+        if abs(puck.x) > half_width or puck.vx * puck.vx + puck.vy * puck.vy < 0.01:
+            puck.position = (rng.uniform(-0.5, 0.5), rng.uniform(-0.3, 0.3))
+            puck.linearVelocity = (rng.uniform(-3.0, 3.0), rng.uniform(-3.0, 3.0))
+        world.step(TIME_STEP)
+        world.contacts.clear()
+
+    return step
+
+
+def _wall_heavy(seed: int) -> Callable[[], None]:
+    """Fast puck bouncing mostly off the long walls, mallets out of the way."""
+    world = PhysicsWorld(
+        FieldSpec(),
+        puck_restitution=1.0,
+        puck_damping=0.0,
+        max_puck_speed=0.0,
+        continuous_collision=True,
+    )
+    world.entities.mallet_left.position = (-0.95, 0.4)
+    world.entities.mallet_right.position = (0.95, -0.4)
+    puck = world.entities.puck
+    puck.linearVelocity = (1.5, 12.0 + seed % 3)
+
+    def step() -> None:
+        if abs(puck.x) > 0.6:
+            puck.vx = -math.copysign(1.5, puck.x)
+        world.step(TIME_STEP)
+        world.contacts.clear()
+
+    return step
+
+
+def _collision_heavy(seed: int) -> Callable[[], None]:
+    """Both mallets sweeping through the puck's area so most ticks resolve a contact."""
+    rng = random.Random(seed)
+    world = PhysicsWorld(FieldSpec(), puck_damping=0.5, max_puck_speed=4.0, continuous_collision=True)
+    puck = world.entities.puck
+    tick = 0
+
+    def step() -> None:
+        nonlocal tick
+        tick += 1
+        phase = tick * 0.08
+        if abs(puck.x) > 0.35 or abs(puck.y) > 0.3:
+            puck.position = (rng.uniform(-0.1, 0.1), rng.uniform(-0.1, 0.1))
+            puck.linearVelocity = (rng.uniform(-1.0, 1.0), rng.uniform(-1.0, 1.0))
+        left = (-0.12 + 0.1 * math.sin(phase), 0.15 * math.cos(phase * 1.3))
+        right = (0.12 + 0.1 * math.cos(phase * 0.9), 0.15 * math.sin(phase * 1.1))
+        world.set_mallet_positions(left, right, TIME_STEP, max_speed=2.0)
+        world.step(TIME_STEP)
+        world.contacts.clear()
+
+    return step
+
+
+def _play_screen(seed: int) -> Callable[[], None]:
+    """`PlayScreen.update` for one 60 Hz frame (two substeps), camera off, default settings."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import pygame
+
+    from air_hockey.game.ai import AiController, Difficulty
+    from air_hockey.ui.screens.play import PlayScreen
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    screen = PlayScreen(
+        (1280, 720),
+        on_back=lambda: None,
+        on_pause=lambda: None,
+        use_camera=False,
+        settings=Settings(),
+    )
+    screen.use_camera_control = False
+    screen.ai_controller = AiController(
+        screen.field, left=False, difficulty=Difficulty.HARD, budget_us=None, seed=seed
+    )
+
+    def step() -> None:
+        screen.update(FRAME_TIME)
+
+    return step
+
+
+CASES: dict[str, tuple[Callable[[int], Callable[[], None]], int]] = {
+    "step_discrete": (lambda seed: _open_world(False, seed), 1),
+    "step_continuous": (lambda seed: _open_world(True, seed), 1),
+    "wall_heavy": (_wall_heavy, 1),
+    "collision_heavy": (_collision_heavy, 1),
+    "play_update": (_play_screen, round(FRAME_TIME / TIME_STEP)),
+}
+
+
+def run(
+    ticks: int = 20000,
+    seed: int = 1,
+    cases: list[str] | None = None,
+    repeat: int = 3,
+) -> list[dict[str, object]]:
+    """Run each case `repeat` times and keep the fastest run, which is the least noisy.
+
+    `p99_us` is the median of the per-run p99 rather than the fastest run's.
+    """
+    results = []
+    for name in cases or list(CASES):
+        factory, ticks_per_sample = CASES[name]
+        step = factory(seed)
+        runs = [
+            summarize(name, measure(step, max(1, ticks // ticks_per_sample)), ticks_per_sample)
+            for _ in range(max(1, repeat))
+        ]
+        result = max(runs, key=lambda summary: summary["ticks_per_second"])
+        result["p99_us"] = statistics.median(summary["p99_us"] for summary in runs)
+        result["repeats"] = len(runs)
+        results.append(result)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case; the fastest is kept")
+    parser.add_argument("--case", action="append", choices=list(CASES), dest="cases")
+    parser.add_argument("--output", type=Path, default=None, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, default=None, help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    results = run(args.ticks, args.seed, args.cases, args.repeat)
+    print(json.dumps(results, indent=2))
+    if args.output is not None:
+        write_results(args.output, {"physics": results})
+    if args.baseline is not None:
+        regressions = compare(results, load_results(args.baseline).get("physics", []), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
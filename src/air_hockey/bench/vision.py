@@ -0,0 +1,297 @@
+"""Throughput, latency and hit-rate sweep for the vision detectors.
+
+Run with `python -m air_hockey.bench.vision`. Every configuration of resolution,
+`detection_scale` and `hand_process_every` (pose) or `min_contour_area` (ball
+detectors, optionally with and without region-of-interest tracking via `--roi`) replays
+the same clip and reports frames per second, per-call
+p50/p95/p99, process CPU time per frame and the fraction of annotated targets
+found within `--tolerance` of their ground truth. Without `--clip` a synthetic
+scene with exact ground truth is rendered. With `--baseline` it exits non-zero
+when a configuration regresses beyond `--threshold`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import itertools
+import json
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
+
+import cv2
+import numpy as np
+
+from air_hockey.bench.common import (
+    DEFAULT_THRESHOLD,
+    compare,
+    load_results,
+    summarize,
+    write_results,
+)
+from air_hockey.engine.frame_sources import SyntheticSource, load_image_sequence
+from air_hockey.engine.roi import RoiTracker
+from air_hockey.engine.vision import HSV_PRESETS, BallTracker, MotionMasker
+
+if TYPE_CHECKING:
+    from air_hockey.engine.hand_tracking import HandTracker
+
+Point = tuple[int, int]
+Clip = tuple[list[np.ndarray], list[list[Point]]]
+
+DETECTORS = ("hand", "ball", "ball_masked")
+DEFAULT_RESOLUTIONS = ((640, 480), (320, 240))
+DEFAULT_SCALES = (1.0, 0.5)
+DEFAULT_PROCESS_EVERY = (1, 2)
+DEFAULT_MIN_AREAS = (0.0, 100.0, 400.0)
+# Hit tolerance as a fraction of the frame width.
+DEFAULT_TOLERANCE = 0.04
+
+
+def synthetic_clip(
+    frames: int, mode: str, width: int = 640, height: int = 480, seed: int = 1
+) -> Clip:
+    source = SyntheticSource(width=width, height=height, fps=30.0, mode=mode, seed=seed)
+    images, truth = [], []
+    for index in range(frames):
+        image, points = source.render(index)
+        images.append(image)
+        truth.append(points)
+    return images, truth
+
+
+def load_clip(path: Path, truth_path: Optional[Path], frames: int) -> Clip:
+    """Frames from a video, image directory or `.npz`, with optional JSON annotations.
+
+    The annotation file holds `{"frames": [[[x, y], ...], ...]}` in source pixels,
+    one (possibly empty) list of target points per frame.
+    """
+    if path.is_dir() or path.suffix == ".npz":
+        images = load_image_sequence(path)[:frames]
+    else:
+        capture = cv2.VideoCapture(str(path))
+        images = []
+        while len(images) < frames:
+            ok, image = capture.read()
+            if not ok:
+                break
+            images.append(image)
+        capture.release()
+    if not images:
+        raise ValueError(f"no frames in {path}")
+    truth: list[list[Point]] = [[] for _ in images]
+    if truth_path is not None:
+        annotated = json.loads(truth_path.read_text())["frames"]
+        for index, points in enumerate(annotated[: len(images)]):
+            truth[index] = [(int(x), int(y)) for x, y in points]
+    return images, truth
+
+
+def resize_clip(clip: Clip, size: tuple[int, int]) -> Clip:
+    images, truth = clip
+    height, width = images[0].shape[:2]
+    if (width, height) == size:
+        return clip
+    sx, sy = size[0] / width, size[1] / height
+    resized = [cv2.resize(image, size, interpolation=cv2.INTER_AREA) for image in images]
+    scaled = [[(int(x * sx), int(y * sy)) for x, y in points] for points in truth]
+    return resized, scaled
+
+
+def count_hits(found: list[Optional[Point]], truth: list[Point], tolerance_px: float) -> int:
+    """Targets in `truth` matched one-to-one by a found point within `tolerance_px`."""
+    remaining = list(truth)
+    hits = 0
+    limit = tolerance_px * tolerance_px
+    for point in found:
+        if point is None or not remaining:
+            continue
+        distances = [(point[0] - x) ** 2 + (point[1] - y) ** 2 for x, y in remaining]
+        best = min(range(len(remaining)), key=distances.__getitem__)
+        if distances[best] <= limit:
+            hits += 1
+            remaining.pop(best)
+    return hits
+
+
+def _ball_detector(
+    min_area: float, masked: bool, roi: bool = False
+) -> Callable[[np.ndarray], list[Optional[Point]]]:
+    tracker = BallTracker(
+        HSV_PRESETS["orange"],
+        min_area=min_area,
+        masker=MotionMasker() if masked else None,
+        roi=RoiTracker() if roi else None,
+    )
+    return lambda frame: [tracker.detect(frame).center]
+
+
+def _hand_detector(
+    scale: float, process_every: int
+) -> tuple["HandTracker", Callable[[np.ndarray], list[Optional[Point]]]]:
+    from air_hockey.engine.hand_tracking import HandTracker
+
+    tracker = HandTracker(process_every=process_every)
+
+    def detect(frame: np.ndarray) -> list[Optional[Point]]:
+        positions = tracker.detect(frame, scale=scale)
+        return [positions.left, positions.right]
+
+    return tracker, detect
+
+
+def run_case(
+    case: str,
+    detect: Callable[[np.ndarray], list[Optional[Point]]],
+    clip: Clip,
+    tolerance: float,
+) -> dict[str, object]:
+    images, truth = clip
+    tolerance_px = tolerance * images[0].shape[1]
+    samples = [0] * len(images)
+    found: list[list[Optional[Point]]] = [[] for _ in images]
+    clock = time.perf_counter_ns
+    gc.collect()
+    gc.disable()
+    cpu_start = time.process_time_ns()
+    try:
+        for index, image in enumerate(images):
+            start = clock()
+            found[index] = detect(image)
+            samples[index] = clock() - start
+    finally:
+        cpu_ns = time.process_time_ns() - cpu_start
+        gc.enable()
+
+    targets = sum(len(points) for points in truth)
+    hits = sum(count_hits(points, expected, tolerance_px) for points, expected in zip(found, truth))
+    result = summarize(case, samples)
+    result["frames_per_second"] = result.pop("ticks_per_second")
+    result.update(
+        cpu_us=cpu_ns / len(images) / 1000.0,
+        targets=targets,
+        hit_rate=hits / targets if targets else 0.0,
+    )
+    return result
+
+
+def run(
+    frames: int = 120,
+    detectors: tuple[str, ...] = DETECTORS,
+    resolutions: tuple[tuple[int, int], ...] = DEFAULT_RESOLUTIONS,
+    scales: tuple[float, ...] = DEFAULT_SCALES,
+    process_every: tuple[int, ...] = DEFAULT_PROCESS_EVERY,
+    min_areas: tuple[float, ...] = DEFAULT_MIN_AREAS,
+    clip: Optional[Clip] = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+    seed: int = 1,
+    rois: tuple[bool, ...] = (False,),
+) -> list[dict[str, object]]:
+    """Sweep each detector over its own parameters; pose is skipped without mediapipe.
+
+    `rois` adds region-of-interest tracking as a sweep axis of the ball detectors; those
+    cases end in `_roi`.
+    """
+    from air_hockey.engine import hand_tracking
+
+    results = []
+    for detector in detectors:
+        if detector == "hand" and hand_tracking.mp is None:
+            print("skipping hand: mediapipe is not available", file=sys.stderr)
+            continue
+        base = clip or synthetic_clip(
+            frames, "skeleton" if detector == "hand" else "balls", seed=seed
+        )
+        for width, height in resolutions:
+            scaled_clip = resize_clip(base, (width, height))
+            prefix = f"{detector}_{width}x{height}"
+            if detector == "hand":
+                for scale, every in itertools.product(scales, process_every):
+                    tracker, detect = _hand_detector(scale, every)
+                    try:
+                        result = run_case(
+                            f"{prefix}_s{scale:g}_e{every}", detect, scaled_clip, tolerance
+                        )
+                    finally:
+                        tracker.close()
+                    result.update(
+                        detector=detector,
+                        width=width,
+                        height=height,
+                        scale=scale,
+                        process_every=every,
+                    )
+                    results.append(result)
+                continue
+            for min_area, roi in itertools.product(min_areas, rois):
+                detect = _ball_detector(min_area, masked=detector == "ball_masked", roi=roi)
+                case = f"{prefix}_a{min_area:g}" + ("_roi" if roi else "")
+                result = run_case(case, detect, scaled_clip, tolerance)
+                result.update(
+                    detector=detector,
+                    width=width,
+                    height=height,
+                    min_contour_area=min_area,
+                    roi=roi,
+                )
+                results.append(result)
+    return results
+
+
+def _resolution(text: str) -> tuple[int, int]:
+    width, _, height = text.partition("x")
+    return int(width), int(height)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=120, help="frames per configuration")
+    parser.add_argument("--detector", action="append", choices=DETECTORS, dest="detectors")
+    parser.add_argument(
+        "--resolution", action="append", type=_resolution, dest="resolutions", help="WxH"
+    )
+    parser.add_argument("--scale", action="append", type=float, dest="scales")
+    parser.add_argument("--process-every", action="append", type=int, dest="process_every")
+    parser.add_argument("--min-area", action="append", type=float, dest="min_areas")
+    parser.add_argument("--clip", type=Path, default=None, help="video, image directory or .npz")
+    parser.add_argument("--truth", type=Path, default=None, help="ground-truth JSON for --clip")
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE, help="hit radius as a fraction of width"
+    )
+    parser.add_argument(
+        "--roi", action="store_true", help="also run ball cases with region-of-interest tracking"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", type=Path, default=None, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, default=None, help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    clip = load_clip(args.clip, args.truth, args.frames) if args.clip is not None else None
+    results = run(
+        frames=args.frames,
+        detectors=tuple(args.detectors or DETECTORS),
+        resolutions=tuple(args.resolutions or DEFAULT_RESOLUTIONS),
+        scales=tuple(args.scales or DEFAULT_SCALES),
+        process_every=tuple(args.process_every or DEFAULT_PROCESS_EVERY),
+        min_areas=tuple(args.min_areas or DEFAULT_MIN_AREAS),
+        clip=clip,
+        tolerance=args.tolerance,
+        seed=args.seed,
+        rois=(False, True) if args.roi else (False,),
+    )
+    print(json.dumps(results, indent=2))
+    if args.output is not None:
+        write_results(args.output, {"vision": results})
+    if args.baseline is not None:
+        regressions = compare(results, load_results(args.baseline).get("vision", []), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -31,6 +31,10 @@ def _settings_path() -> Path:
     return get_user_data_dir() / "settings.json"
 
 
+def _camera_probe_path() -> Path:
+    return get_user_data_dir() / "camera_probe.json"
+
+
 def load_calibration() -> CalibrationData:
     path = _calibration_path()
     if not path.exists():
@@ -65,3 +69,27 @@ def save_settings(settings: Settings) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     payload = {"settings": settings.to_dict()}
     path.write_text(json.dumps(payload, indent=2))
+
+
+def _load_camera_probes() -> dict[str, dict[str, object]]:
+    path = _camera_probe_path()
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text())
+    except json.JSONDecodeError:
+        return {}
+    probes = data.get("probes", {})
+    return probes if isinstance(probes, dict) else {}
+
+
+def load_camera_probe(key: str) -> dict[str, object] | None:
+    return _load_camera_probes().get(key)
+
+
+def save_camera_probe(key: str, probe: dict[str, object]) -> None:
+    probes = _load_camera_probes()
+    probes[key] = probe
+    path = _camera_probe_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"probes": probes}, indent=2))
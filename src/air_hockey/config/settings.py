@@ -30,6 +30,25 @@ class Settings:
     min_contour_area: float = 200.0
     max_jump_px: float = 80.0
     hand_process_every: int = 2
+    cpu_opponent: str = "off"
+    cpu_side: str = "right"
+    max_catchup_steps: int = 4
+    overrun_policy: str = "drop"
+    pose_backend: str = "inline"
+    pose_model_path: str = ""
+    flow_interpolation: bool = True
+    camera_profile: str = "default"
+    camera_exposure_lock: bool = False
+    frame_source: str = "camera"
+    camera_window_fps: float = 30.0
+    show_latency: bool = False
+    adaptive_quality: bool = False
+    target_fps: float = 60.0
+    quality_min_scale: float = 0.5
+    quality_max_scale: float = 1.0
+    quality_max_process_every: int = 3
+    quality_min_complexity: int = 1
+    quality_max_complexity: int = 1
 
     def to_dict(self) -> dict[str, object]:
         return {
@@ -54,6 +73,25 @@ class Settings:
             "min_contour_area": self.min_contour_area,
             "max_jump_px": self.max_jump_px,
             "hand_process_every": self.hand_process_every,
+            "cpu_opponent": self.cpu_opponent,
+            "cpu_side": self.cpu_side,
+            "max_catchup_steps": self.max_catchup_steps,
+            "overrun_policy": self.overrun_policy,
+            "pose_backend": self.pose_backend,
+            "pose_model_path": self.pose_model_path,
+            "flow_interpolation": self.flow_interpolation,
+            "camera_profile": self.camera_profile,
+            "camera_exposure_lock": self.camera_exposure_lock,
+            "frame_source": self.frame_source,
+            "camera_window_fps": self.camera_window_fps,
+            "show_latency": self.show_latency,
+            "adaptive_quality": self.adaptive_quality,
+            "target_fps": self.target_fps,
+            "quality_min_scale": self.quality_min_scale,
+            "quality_max_scale": self.quality_max_scale,
+            "quality_max_process_every": self.quality_max_process_every,
+            "quality_min_complexity": self.quality_min_complexity,
+            "quality_max_complexity": self.quality_max_complexity,
         }
 
     @classmethod
@@ -85,4 +123,31 @@ class Settings:
             min_contour_area=float(data.get("min_contour_area", defaults.min_contour_area)),
             max_jump_px=float(data.get("max_jump_px", defaults.max_jump_px)),
             hand_process_every=int(data.get("hand_process_every", defaults.hand_process_every)),
+            cpu_opponent=str(data.get("cpu_opponent", defaults.cpu_opponent)),
+            cpu_side=str(data.get("cpu_side", defaults.cpu_side)),
+            max_catchup_steps=int(data.get("max_catchup_steps", defaults.max_catchup_steps)),
+            overrun_policy=str(data.get("overrun_policy", defaults.overrun_policy)),
+            pose_backend=str(data.get("pose_backend", defaults.pose_backend)),
+            pose_model_path=str(data.get("pose_model_path", defaults.pose_model_path)),
+            flow_interpolation=bool(data.get("flow_interpolation", defaults.flow_interpolation)),
+            camera_profile=str(data.get("camera_profile", defaults.camera_profile)),
+            camera_exposure_lock=bool(
+                data.get("camera_exposure_lock", defaults.camera_exposure_lock)
+            ),
+            frame_source=str(data.get("frame_source", defaults.frame_source)),
+            camera_window_fps=float(data.get("camera_window_fps", defaults.camera_window_fps)),
+            show_latency=bool(data.get("show_latency", defaults.show_latency)),
+            adaptive_quality=bool(data.get("adaptive_quality", defaults.adaptive_quality)),
+            target_fps=float(data.get("target_fps", defaults.target_fps)),
+            quality_min_scale=float(data.get("quality_min_scale", defaults.quality_min_scale)),
+            quality_max_scale=float(data.get("quality_max_scale", defaults.quality_max_scale)),
+            quality_max_process_every=int(
+                data.get("quality_max_process_every", defaults.quality_max_process_every)
+            ),
+            quality_min_complexity=int(
+                data.get("quality_min_complexity", defaults.quality_min_complexity)
+            ),
+            quality_max_complexity=int(
+                data.get("quality_max_complexity", defaults.quality_max_complexity)
+            ),
         )
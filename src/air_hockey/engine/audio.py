@@ -66,13 +66,19 @@ class AudioManager:
         self._movement_channel = None
         self.sounds = self._load_sounds()
 
-    def play_wall(self) -> None:
+    def play_wall(self, volume: float = 1.0) -> None:
         if self.enabled and self.sounds.puck_hit_wall:
-            self.sounds.puck_hit_wall.play()
+            self._play_at(self.sounds.puck_hit_wall, volume)
 
-    def play_mallet(self) -> None:
+    def play_mallet(self, volume: float = 1.0) -> None:
         if self.enabled and self.sounds.puck_hit_mallet:
-            self.sounds.puck_hit_mallet.play()
+            self._play_at(self.sounds.puck_hit_mallet, volume)
+
+    @staticmethod
+    def _play_at(sound: pygame.mixer.Sound, volume: float) -> None:
+        channel = sound.play()
+        if channel is not None:
+            channel.set_volume(min(max(volume, 0.0), 1.0))
 
     def play_goal(self) -> None:
         if self.enabled and self.sounds.goal:
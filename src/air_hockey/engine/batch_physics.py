@@ -0,0 +1,246 @@
+"""Vectorized physics for stepping many tables at once (offline sweeps and bots)."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from air_hockey.engine.physics import PhysicsWorld
+from air_hockey.game.entities import MalletSpec, PuckSpec
+from air_hockey.game.field import FieldSpec
+
+LEFT = 0
+RIGHT = 1
+
+
+class BatchPhysicsWorld:
+    """Struct-of-arrays mirror of `PhysicsWorld` holding `count` independent tables.
+
+    Puck arrays have shape (N, 2) / (N,); mallet arrays have shape (N, 2, 2) / (N, 2)
+    where the second axis is (left, right). `step` follows the exact ordering of
+    `PhysicsWorld.step`. Callbacks are replaced by per-table hit counters.
+    """
+
+    def __init__(
+        self,
+        field: FieldSpec,
+        count: int,
+        puck_restitution: float | None = None,
+        puck_damping: float | None = None,
+        max_puck_speed: float | None = None,
+    ) -> None:
+        if count <= 0:
+            raise ValueError("count must be positive")
+        self.field = field
+        self.count = count
+        puck_spec = PuckSpec()
+        mallet_spec = MalletSpec()
+
+        self.puck_position = np.zeros((count, 2))
+        self.puck_velocity = np.zeros((count, 2))
+        self.puck_radius = np.full(count, puck_spec.radius)
+        self.puck_mass = np.full(
+            count, PhysicsWorld._circle_mass(puck_spec.radius, puck_spec.density)
+        )
+        self.puck_restitution = np.full(
+            count, puck_restitution if puck_restitution is not None else puck_spec.restitution
+        )
+        self.puck_damping = np.full(
+            count, puck_damping if puck_damping is not None else puck_spec.linear_damping
+        )
+        self.max_puck_speed = np.full(count, max_puck_speed or 0.0)
+
+        self.mallet_position = np.zeros((count, 2, 2))
+        self.mallet_position[:, LEFT, 0] = -field.width * 0.25
+        self.mallet_position[:, RIGHT, 0] = field.width * 0.25
+        self.mallet_velocity = np.zeros((count, 2, 2))
+        self.mallet_radius = np.full((count, 2), mallet_spec.radius)
+        self.mallet_mass = np.full(
+            (count, 2), PhysicsWorld._circle_mass(mallet_spec.radius, mallet_spec.density)
+        )
+        self.mallet_restitution = np.full((count, 2), mallet_spec.restitution)
+        self.mallet_damping = np.full((count, 2), mallet_spec.linear_damping)
+
+        self.wall_hits = np.zeros(count, dtype=np.int64)
+        self.mallet_hits = np.zeros(count, dtype=np.int64)
+
+    @classmethod
+    def from_worlds(cls, worlds: Sequence[PhysicsWorld]) -> "BatchPhysicsWorld":
+        if not worlds:
+            raise ValueError("at least one world is required")
+        field = worlds[0].field
+        if any(world.field != field for world in worlds):
+            raise ValueError("all worlds must share the same FieldSpec")
+        batch = cls(field, len(worlds))
+        for index, world in enumerate(worlds):
+            batch.load_world(index, world)
+        return batch
+
+    def load_world(self, index: int, world: PhysicsWorld) -> None:
+        puck = world.entities.puck
+        self.puck_position[index] = puck.position
+        self.puck_velocity[index] = puck.linearVelocity
+        self.puck_radius[index] = puck.radius
+        self.puck_mass[index] = puck.mass
+        self.puck_restitution[index] = puck.restitution
+        self.puck_damping[index] = puck.damping
+        self.max_puck_speed[index] = world.max_puck_speed or 0.0
+        for side, mallet in ((LEFT, world.entities.mallet_left), (RIGHT, world.entities.mallet_right)):
+            self.mallet_position[index, side] = mallet.position
+            self.mallet_velocity[index, side] = mallet.linearVelocity
+            self.mallet_radius[index, side] = mallet.radius
+            self.mallet_mass[index, side] = mallet.mass
+            self.mallet_restitution[index, side] = mallet.restitution
+            self.mallet_damping[index, side] = mallet.damping
+
+    def step(self, time_step: float) -> None:
+        self._apply_damping(self.puck_velocity, self.puck_damping, time_step)
+        self.puck_position += self.puck_velocity * time_step
+
+        self._apply_damping(self.mallet_velocity, self.mallet_damping, time_step)
+        self.mallet_position += self.mallet_velocity * time_step
+
+        self._resolve_puck_walls()
+        self._resolve_puck_mallet_collision(LEFT)
+        self._resolve_puck_mallet_collision(RIGHT)
+        self._clamp_puck_speed()
+
+    def update_puck_settings(
+        self,
+        restitution: float | np.ndarray,
+        damping: float | np.ndarray,
+        max_speed: float | np.ndarray,
+    ) -> None:
+        self.max_puck_speed[:] = np.maximum(0.0, max_speed)
+        self.puck_damping[:] = np.maximum(0.0, damping)
+        self.puck_restitution[:] = restitution
+
+    def set_mallet_positions(
+        self,
+        left_pos: np.ndarray,
+        right_pos: np.ndarray,
+        time_step: float,
+        teleport: bool = False,
+        max_speed: float | None = None,
+    ) -> None:
+        targets = np.stack(
+            (
+                np.broadcast_to(left_pos, (self.count, 2)),
+                np.broadcast_to(right_pos, (self.count, 2)),
+            ),
+            axis=1,
+        )
+        if teleport:
+            self.mallet_velocity[:] = 0.0
+            self.mallet_position[:] = targets
+            return
+
+        velocity = (targets - self.mallet_position) / time_step
+        if max_speed and max_speed > 0:
+            speed_sq = np.einsum("ijk,ijk->ij", velocity, velocity)
+            too_fast = speed_sq > max_speed * max_speed
+            scale = np.ones_like(speed_sq)
+            scale[too_fast] = max_speed / np.sqrt(speed_sq[too_fast])
+            velocity *= scale[..., None]
+        self.mallet_velocity[:] = velocity
+
+    def reset_pucks(self, mask: np.ndarray, positions: np.ndarray) -> None:
+        self.puck_position[mask] = np.broadcast_to(positions, self.puck_position.shape)[mask]
+        self.puck_velocity[mask] = 0.0
+
+    def puck_speed(self) -> np.ndarray:
+        return np.hypot(self.puck_velocity[:, 0], self.puck_velocity[:, 1])
+
+    @staticmethod
+    def _apply_damping(velocity: np.ndarray, damping: np.ndarray, time_step: float) -> None:
+        decay = np.where(damping > 0, np.maximum(0.0, 1.0 - damping * time_step), 1.0)
+        velocity *= decay[..., None]
+
+    def _resolve_puck_walls(self) -> None:
+        half_width = self.field.width / 2.0
+        half_height = self.field.height / 2.0
+        goal_half = self.field.goal_height / 2.0
+        x = self.puck_position[:, 0]
+        y = self.puck_position[:, 1]
+        vx = self.puck_velocity[:, 0]
+        vy = self.puck_velocity[:, 1]
+        radius = self.puck_radius
+
+        hit_low = y - radius < -half_height
+        hit_high = ~hit_low & (y + radius > half_height)
+        y[hit_low] = -half_height + radius[hit_low]
+        y[hit_high] = half_height - radius[hit_high]
+        vy[hit_low] = self._away_from_wall(vy[hit_low], 1.0)
+        vy[hit_high] = self._away_from_wall(vy[hit_high], -1.0)
+
+        outside_goal = np.abs(y) >= goal_half
+        hit_left = outside_goal & (x - radius < -half_width)
+        hit_right = outside_goal & ~hit_left & (x + radius > half_width)
+        x[hit_left] = -half_width + radius[hit_left]
+        x[hit_right] = half_width - radius[hit_right]
+        vx[hit_left] = self._away_from_wall(vx[hit_left], 1.0)
+        vx[hit_right] = self._away_from_wall(vx[hit_right], -1.0)
+
+        hit_wall = hit_low | hit_high | hit_left | hit_right
+        restitution = np.clip(self.puck_restitution[hit_wall], 0.0, 1.0)
+        self.puck_velocity[hit_wall] *= restitution[:, None]
+        self.wall_hits += hit_wall
+
+    @staticmethod
+    def _away_from_wall(component: np.ndarray, direction: float) -> np.ndarray:
+        magnitude = np.abs(component)
+        return direction * np.where(magnitude > 0.0, magnitude, 0.1)
+
+    def _resolve_puck_mallet_collision(self, side: int) -> None:
+        mallet_position = self.mallet_position[:, side]
+        mallet_velocity = self.mallet_velocity[:, side]
+        delta = self.puck_position - mallet_position
+        distance_sq = np.einsum("ij,ij->i", delta, delta)
+        min_dist = self.puck_radius + self.mallet_radius[:, side]
+        touching = distance_sq < min_dist * min_dist
+        if not touching.any():
+            return
+
+        idx = np.flatnonzero(touching)
+        delta = delta[idx]
+        min_dist = min_dist[idx]
+        distance = np.where(distance_sq[idx] > 0, np.sqrt(distance_sq[idx]), min_dist)
+        normal = delta / distance[:, None]
+        self.puck_position[idx] += normal * (min_dist - distance)[:, None]
+
+        relative = self.puck_velocity[idx] - mallet_velocity[idx]
+        vel_along_normal = np.einsum("ij,ij->i", relative, normal)
+        approaching = vel_along_normal <= 0
+        if not approaching.any():
+            return
+        idx = idx[approaching]
+        normal = normal[approaching]
+        vel_along_normal = vel_along_normal[approaching]
+
+        restitution = np.clip(
+            (self.puck_restitution[idx] + self.mallet_restitution[idx, side]) * 0.5, 0.0, 1.0
+        )
+        puck_mass = self.puck_mass[idx]
+        mallet_mass = self.mallet_mass[idx, side]
+        inv_mass_puck = np.divide(1.0, puck_mass, out=np.zeros_like(puck_mass), where=puck_mass > 0)
+        inv_mass_mallet = np.divide(
+            1.0, mallet_mass, out=np.zeros_like(mallet_mass), where=mallet_mass > 0
+        )
+        inv_mass_sum = inv_mass_puck + inv_mass_mallet
+        impulse = -(1.0 + restitution) * vel_along_normal
+        impulse /= np.where(inv_mass_sum > 0, inv_mass_sum, 1.0)
+        impulse_vec = normal * impulse[:, None]
+
+        self.puck_velocity[idx] += impulse_vec * inv_mass_puck[:, None]
+        self.mallet_velocity[idx, side] -= impulse_vec * inv_mass_mallet[:, None]
+        self.mallet_hits[idx] += 1
+
+    def _clamp_puck_speed(self) -> None:
+        max_speed = self.max_puck_speed
+        speed_sq = np.einsum("ij,ij->i", self.puck_velocity, self.puck_velocity)
+        too_fast = (max_speed > 0.0) & (speed_sq > max_speed * max_speed)
+        if not too_fast.any():
+            return
+        scale = max_speed[too_fast] / np.sqrt(speed_sq[too_fast])
+        self.puck_velocity[too_fast] *= scale[:, None]
@@ -1,38 +1,184 @@
-"""Camera capture in a background thread."""
+"""Threaded frame sources and webcam capture."""
 
 from __future__ import annotations
 
 import threading
 import time
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 import cv2
+import numpy as np
+
+if TYPE_CHECKING:
+    from air_hockey.config.settings import Settings
+
+DEFAULT_RING_SIZE = 3
 
 
 @dataclass
 class CameraFrame:
     frame: object
     timestamp: float
+    sequence: int = 0
 
 
-class CameraCapture:
-    def __init__(self, device_index: int = 0) -> None:
-        self.device_index = device_index
-        self._capture: Optional[cv2.VideoCapture] = None
+@dataclass(frozen=True)
+class CaptureProfile:
+    """Requested capture mode; zero / empty fields leave the driver default alone."""
+
+    width: int = 0
+    height: int = 0
+    fps: float = 0.0
+    fourcc: str = ""
+    buffer_size: int = 0
+    exposure_lock: bool = False
+
+
+CAPTURE_PROFILES: dict[str, CaptureProfile] = {
+    "driver": CaptureProfile(),
+    "default": CaptureProfile(buffer_size=1),
+    "low_latency": CaptureProfile(width=640, height=480, fps=60.0, fourcc="MJPG", buffer_size=1),
+    "hd": CaptureProfile(width=1280, height=720, fps=60.0, fourcc="MJPG", buffer_size=1),
+}
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """What the device actually granted after a profile was applied."""
+
+    backend: str
+    width: int
+    height: int
+    fps: float
+    fourcc: str
+    buffer_size: int
+
+    def to_dict(self) -> dict[str, object]:
+        return asdict(self)
+
+    def describe(self) -> str:
+        """Short human-readable form, e.g. `1280x720 @ 60 fps MJPG (V4L2)`."""
+        text = f"{self.width}x{self.height} @ {self.fps:g} fps"
+        if self.fourcc:
+            text += f" {self.fourcc}"
+        if self.backend:
+            text += f" ({self.backend})"
+        return text
+
+    @classmethod
+    def from_dict(cls, data: dict[str, object]) -> "ProbeResult":
+        return cls(
+            backend=str(data.get("backend", "")),
+            width=int(data.get("width", 0)),
+            height=int(data.get("height", 0)),
+            fps=float(data.get("fps", 0.0)),
+            fourcc=str(data.get("fourcc", "")),
+            buffer_size=int(data.get("buffer_size", 0)),
+        )
+
+
+def _decode_fourcc(value: float) -> str:
+    code = int(value)
+    text = "".join(chr((code >> (8 * index)) & 0xFF) for index in range(4))
+    return text if text.isprintable() and text.strip() else ""
+
+
+def apply_profile(capture: cv2.VideoCapture, profile: CaptureProfile) -> None:
+    """Request `profile` from an open capture. The pixel format goes first because
+    many V4L2 drivers only offer high frame rates for MJPG."""
+    if profile.fourcc:
+        capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*profile.fourcc))
+    if profile.width and profile.height:
+        capture.set(cv2.CAP_PROP_FRAME_WIDTH, profile.width)
+        capture.set(cv2.CAP_PROP_FRAME_HEIGHT, profile.height)
+    if profile.fps:
+        capture.set(cv2.CAP_PROP_FPS, profile.fps)
+    if profile.buffer_size:
+        capture.set(cv2.CAP_PROP_BUFFERSIZE, profile.buffer_size)
+    if profile.exposure_lock:
+        exposure = capture.get(cv2.CAP_PROP_EXPOSURE)
+        # V4L2 uses 0.25 for manual exposure and 0.75 for auto; other backends use 0 / 1.
+        manual = 0.25 if _backend_name(capture) == "V4L2" else 0.0
+        capture.set(cv2.CAP_PROP_AUTO_EXPOSURE, manual)
+        capture.set(cv2.CAP_PROP_EXPOSURE, exposure)
+
+
+def _backend_name(capture: cv2.VideoCapture) -> str:
+    try:
+        return capture.getBackendName()
+    except cv2.error:
+        return ""
+
+
+def probe_capture(capture: cv2.VideoCapture) -> ProbeResult:
+    return ProbeResult(
+        backend=_backend_name(capture),
+        width=int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        height=int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        fps=float(capture.get(cv2.CAP_PROP_FPS)),
+        fourcc=_decode_fourcc(capture.get(cv2.CAP_PROP_FOURCC)),
+        buffer_size=int(capture.get(cv2.CAP_PROP_BUFFERSIZE)),
+    )
+
+
+@dataclass(frozen=True)
+class CaptureStats:
+    captured: int
+    consumed: int
+    dropped: int
+
+
+class FrameSource:
+    """Produces frames on a background thread into a preallocated ring.
+
+    Subclasses implement `_open`, `_read` and `_close`; everything else (ring
+    management, sequencing, pacing, stats) lives here. `timestamp` is
+    `time.perf_counter()` at the end of the read and `sequence` increases by one
+    per produced frame. The producer never writes into the slot most recently
+    handed to the consumer, so a returned frame stays intact until the next
+    `get_latest` / `wait_for_next` call. `dropped` counts frames that were
+    replaced before any consumer saw them.
+
+    With `fps > 0` frames are released no faster than that rate; `fps = 0` lets
+    `_read` set the pace (a camera blocks until the sensor delivers). A source
+    that runs out of frames sets `exhausted` and stops producing.
+    """
+
+    def __init__(self, ring_size: int = DEFAULT_RING_SIZE, fps: float = 0.0) -> None:
+        self.ring_size = max(3, ring_size)
+        self.fps = fps
+        self.exhausted = False
         self._thread: Optional[threading.Thread] = None
         self._running = False
         self._lock = threading.Lock()
-        self._latest: Optional[CameraFrame] = None
+        self._new_frame = threading.Condition(self._lock)
+        self._buffers: list[Optional[np.ndarray]] = [None] * self.ring_size
+        self._frames = [CameraFrame(frame=None, timestamp=0.0) for _ in range(self.ring_size)]
+        self._latest_slot = -1
+        self._reader_slot = -1
+        self._sequence = 0
+        self._last_consumed = 0
+        self.captured = 0
+        self.consumed = 0
+        self.dropped = 0
+
+    def _open(self) -> bool:
+        raise NotImplementedError
+
+    def _read(self, buffer: Optional[np.ndarray]) -> tuple[bool, Optional[np.ndarray]]:
+        """Fill `buffer` (or allocate when None) with the next frame."""
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        pass
 
     def start(self) -> bool:
         if self._running:
             return True
-        self._capture = cv2.VideoCapture(self.device_index)
-        if not self._capture.isOpened():
-            self._capture.release()
-            self._capture = None
+        if not self._open():
             return False
+        self.exhausted = False
         self._running = True
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
@@ -40,22 +186,177 @@ class CameraCapture:
 
     def stop(self) -> None:
         self._running = False
+        with self._new_frame:
+            self._new_frame.notify_all()
         if self._thread:
             self._thread.join(timeout=1.0)
         self._thread = None
-        if self._capture:
-            self._capture.release()
-        self._capture = None
+        self._close()
+
+    @property
+    def running(self) -> bool:
+        return self._running
 
     def get_latest(self) -> Optional[CameraFrame]:
         with self._lock:
-            return self._latest
+            return self._hand_out()
+
+    def wait_for_next(self, after_seq: int, timeout: float | None = None) -> Optional[CameraFrame]:
+        """Block until a frame newer than `after_seq` exists; None on timeout or stop."""
+        with self._new_frame:
+            ready = self._new_frame.wait_for(
+                lambda: self._sequence > after_seq or not self._running, timeout=timeout
+            )
+            if not ready or self._sequence <= after_seq:
+                return None
+            return self._hand_out()
+
+    def stats(self) -> CaptureStats:
+        with self._lock:
+            return CaptureStats(captured=self.captured, consumed=self.consumed, dropped=self.dropped)
+
+    def _hand_out(self) -> Optional[CameraFrame]:
+        if self._latest_slot < 0:
+            return None
+        frame = self._frames[self._latest_slot]
+        self._reader_slot = self._latest_slot
+        if frame.sequence != self._last_consumed:
+            self._last_consumed = frame.sequence
+            self.consumed += 1
+        return frame
+
+    def _next_slot(self) -> int:
+        slot = (self._latest_slot + 1) % self.ring_size
+        while slot == self._reader_slot or slot == self._latest_slot:
+            slot = (slot + 1) % self.ring_size
+        return slot
 
     def _run(self) -> None:
-        while self._running and self._capture is not None:
-            ok, frame = self._capture.read()
-            if ok:
-                with self._lock:
-                    self._latest = CameraFrame(frame=frame, timestamp=time.time())
-            else:
+        interval = 1.0 / self.fps if self.fps > 0 else 0.0
+        deadline = time.perf_counter()
+        while self._running:
+            with self._lock:
+                slot = self._next_slot()
+            ok, image = self._read(self._buffers[slot])
+            if not ok or image is None:
+                if self.exhausted:
+                    break
                 time.sleep(0.01)
+                continue
+            if interval:
+                deadline += interval
+                delay = deadline - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # Fell behind (slow consumer machine); do not burst to catch up.
+                    deadline = time.perf_counter()
+            timestamp = time.perf_counter()
+            self._buffers[slot] = image
+            with self._new_frame:
+                if self._sequence and self._sequence != self._last_consumed:
+                    self.dropped += 1
+                self._sequence += 1
+                self.captured += 1
+                frame = self._frames[slot]
+                frame.frame = image
+                frame.timestamp = timestamp
+                frame.sequence = self._sequence
+                self._latest_slot = slot
+                self._new_frame.notify_all()
+        with self._new_frame:
+            self._running = self._running and not self.exhausted
+            self._new_frame.notify_all()
+
+
+class CameraCapture(FrameSource):
+    """Frame source backed by `cv2.VideoCapture` on a device index or URL.
+
+    `profile` is applied right after the device opens and the granted mode is
+    stored in `probe`. A `cached_probe` from an earlier run seeds `probe` so the
+    expected resolution and fps are known before the device opens: the frame
+    ring is allocated at that size up front, so the first reads decode straight
+    into it. `on_probe` is called whenever a fresh probe differs from the cache.
+    """
+
+    def __init__(
+        self,
+        device_index: Union[int, str] = 0,
+        ring_size: int = DEFAULT_RING_SIZE,
+        profile: Optional[CaptureProfile] = None,
+        cached_probe: Optional[ProbeResult] = None,
+        on_probe: Optional[Callable[[ProbeResult], None]] = None,
+    ) -> None:
+        super().__init__(ring_size=ring_size)
+        self.device_index = device_index
+        self.profile = profile or CaptureProfile()
+        self.on_probe = on_probe
+        self.probe: Optional[ProbeResult] = cached_probe
+        self._capture: Optional[cv2.VideoCapture] = None
+
+    def _open(self) -> bool:
+        self._capture = cv2.VideoCapture(self.device_index)
+        if not self._capture.isOpened():
+            self._capture.release()
+            self._capture = None
+            return False
+        self._allocate_ring(self.probe)
+        self._configure()
+        return True
+
+    def _read(self, buffer: Optional[np.ndarray]) -> tuple[bool, Optional[np.ndarray]]:
+        capture = self._capture
+        if capture is None:
+            return False, None
+        return capture.read(buffer) if buffer is not None else capture.read()
+
+    def _close(self) -> None:
+        if self._capture:
+            self._capture.release()
+        self._capture = None
+
+    def _configure(self) -> None:
+        apply_profile(self._capture, self.profile)
+        probe = probe_capture(self._capture)
+        if probe != self.probe:
+            if self.on_probe is not None:
+                self.on_probe(probe)
+            self._allocate_ring(probe)
+        self.probe = probe
+
+    def _allocate_ring(self, probe: Optional[ProbeResult]) -> None:
+        if probe is None or probe.width <= 0 or probe.height <= 0:
+            self._buffers = [None] * self.ring_size
+            return
+        shape = (probe.height, probe.width, 3)
+        self._buffers = [
+            buffer if buffer is not None and buffer.shape == shape else np.empty(shape, np.uint8)
+            for buffer in self._buffers
+        ]
+
+
+def _probe_key(settings: "Settings", device_index: Union[int, str]) -> str:
+    return f"{device_index}:{settings.camera_profile}"
+
+
+def load_probe(settings: "Settings", device_index: Union[int, str] = 0) -> Optional[ProbeResult]:
+    """Mode the device granted for the current profile the last time it was opened."""
+    from air_hockey.config.io import load_camera_probe
+
+    cached = load_camera_probe(_probe_key(settings, device_index))
+    return ProbeResult.from_dict(cached) if cached is not None else None
+
+
+def create_camera(settings: "Settings", device_index: Union[int, str] = 0) -> CameraCapture:
+    """Camera configured from `settings`, with the probe cached per device and profile."""
+    from air_hockey.config.io import save_camera_probe
+
+    base = CAPTURE_PROFILES.get(settings.camera_profile, CAPTURE_PROFILES["default"])
+    profile = CaptureProfile(**{**asdict(base), "exposure_lock": settings.camera_exposure_lock})
+    key = _probe_key(settings, device_index)
+    return CameraCapture(
+        device_index,
+        profile=profile,
+        cached_probe=load_probe(settings, device_index),
+        on_probe=lambda probe: save_camera_probe(key, probe.to_dict()),
+    )
@@ -0,0 +1,97 @@
+"""Swept (continuous) collision tests for moving circles."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+Vec2 = tuple[float, float]
+
+
+@dataclass(frozen=True)
+class Segment:
+    start: Vec2
+    end: Vec2
+
+
+@dataclass(frozen=True)
+class SweepHit:
+    time: float
+    normal: Vec2
+
+
+def circle_circle_toi(
+    position: Vec2,
+    velocity: Vec2,
+    other_position: Vec2,
+    other_velocity: Vec2,
+    radius_sum: float,
+    max_time: float,
+) -> Optional[float]:
+    """First time in [0, max_time] at which two linearly moving circles touch.
+
+    Returns None when they are already overlapping (left to the discrete
+    resolver), separating, or do not meet within the window.
+    """
+    dx = position[0] - other_position[0]
+    dy = position[1] - other_position[1]
+    wx = velocity[0] - other_velocity[0]
+    wy = velocity[1] - other_velocity[1]
+    c = dx * dx + dy * dy - radius_sum * radius_sum
+    if c <= 0.0:
+        return None
+    b = dx * wx + dy * wy
+    if b >= 0.0:
+        return None
+    a = wx * wx + wy * wy
+    disc = b * b - a * c
+    if disc < 0.0:
+        return None
+    t = (-b - disc ** 0.5) / a
+    if t < 0.0 or t > max_time:
+        return None
+    return t
+
+
+def circle_segment_toi(
+    position: Vec2,
+    velocity: Vec2,
+    radius: float,
+    segment: Segment,
+    max_time: float,
+) -> Optional[SweepHit]:
+    """First contact of a moving circle with a static segment (face or endpoints)."""
+    ax, ay = segment.start
+    bx, by = segment.end
+    ex = bx - ax
+    ey = by - ay
+    length_sq = ex * ex + ey * ey
+    best: Optional[SweepHit] = None
+
+    if length_sq > 0.0:
+        length = length_sq ** 0.5
+        nx = -ey / length
+        ny = ex / length
+        dist = (position[0] - ax) * nx + (position[1] - ay) * ny
+        if dist < 0.0:
+            nx, ny, dist = -nx, -ny, -dist
+        approach = velocity[0] * nx + velocity[1] * ny
+        if dist > radius and approach < 0.0:
+            t = (dist - radius) / -approach
+            if t <= max_time:
+                cx = position[0] + velocity[0] * t
+                cy = position[1] + velocity[1] * t
+                s = ((cx - ax) * ex + (cy - ay) * ey) / length_sq
+                if 0.0 <= s <= 1.0:
+                    best = SweepHit(time=t, normal=(nx, ny))
+
+    for point in (segment.start, segment.end):
+        limit = best.time if best is not None else max_time
+        t = circle_circle_toi(position, velocity, point, (0.0, 0.0), radius, limit)
+        if t is None:
+            continue
+        cx = position[0] + velocity[0] * t - point[0]
+        cy = position[1] + velocity[1] * t - point[1]
+        dist = (cx * cx + cy * cy) ** 0.5 or radius
+        best = SweepHit(time=t, normal=(cx / dist, cy / dist))
+    return best
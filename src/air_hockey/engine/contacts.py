@@ -0,0 +1,87 @@
+"""Preallocated contact event buffer filled by the physics step."""
+
+from __future__ import annotations
+
+from enum import IntEnum
+from itertools import islice
+from typing import Iterator
+
+
+class ContactKind(IntEnum):
+    WALL = 0
+    MALLET_LEFT = 1
+    MALLET_RIGHT = 2
+
+
+class ContactEvent:
+    """One puck contact: point, normal (pointing at the puck), impulse magnitude and tick."""
+
+    __slots__ = ("kind", "x", "y", "nx", "ny", "impulse", "tick")
+
+    def __init__(self) -> None:
+        self.kind = ContactKind.WALL
+        self.x = 0.0
+        self.y = 0.0
+        self.nx = 0.0
+        self.ny = 0.0
+        self.impulse = 0.0
+        self.tick = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"ContactEvent(kind={self.kind.name}, point=({self.x:.3f}, {self.y:.3f}), "
+            f"normal=({self.nx:.3f}, {self.ny:.3f}), impulse={self.impulse:.5f}, tick={self.tick})"
+        )
+
+
+class ContactBuffer:
+    """Fixed-capacity event ring written by physics and drained once per rendered frame.
+
+    Slots are reused, so consumers must copy any values they want to keep past
+    the next `step`. Events recorded while the buffer is full are counted in
+    `dropped` instead of growing the buffer.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self._events = [ContactEvent() for _ in range(capacity)]
+        self.capacity = capacity
+        self.count = 0
+        self.dropped = 0
+
+    def record(
+        self,
+        kind: ContactKind,
+        x: float,
+        y: float,
+        nx: float,
+        ny: float,
+        impulse: float,
+        tick: int,
+    ) -> None:
+        if self.count >= self.capacity:
+            self.dropped += 1
+            return
+        event = self._events[self.count]
+        event.kind = kind
+        event.x = x
+        event.y = y
+        event.nx = nx
+        event.ny = ny
+        event.impulse = impulse
+        event.tick = tick
+        self.count += 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[ContactEvent]:
+        return islice(self._events, self.count)
+
+    def drain(self) -> Iterator[ContactEvent]:
+        """Iterate pending events and mark the buffer empty."""
+        count = self.count
+        self.count = 0
+        return islice(self._events, count)
+
+    def clear(self) -> None:
+        self.count = 0
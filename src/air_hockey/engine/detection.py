@@ -0,0 +1,131 @@
+"""Pose detection stage that runs once per new camera frame."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+
+from air_hockey.engine.camera import CameraFrame
+from air_hockey.engine.frame_cache import FrameCache
+from air_hockey.engine.hand_tracking import HandTracker
+
+if TYPE_CHECKING:
+    from air_hockey.engine.pose_live import LiveStreamHandTracker
+    from air_hockey.engine.pose_worker import ProcessHandTracker
+    from air_hockey.engine.two_player import TwoPlayerTracker
+
+    Tracker = Union[HandTracker, ProcessHandTracker, LiveStreamHandTracker, TwoPlayerTracker]
+
+
+@dataclass(frozen=True)
+class WristSample:
+    """Filtered wrist pixels in the mirrored frame, stamped with the source frame."""
+
+    left: Optional[tuple[int, int]]
+    right: Optional[tuple[int, int]]
+    frame_size: tuple[int, int]
+    sequence: int
+    timestamp: float
+
+
+EMPTY_SAMPLE = WristSample(left=None, right=None, frame_size=(0, 0), sequence=-1, timestamp=0.0)
+POSE_BACKENDS = ("inline", "process", "live_stream", "two_player")
+
+
+def create_hand_tracker(
+    backend: str = "inline",
+    process_every: int = 1,
+    model_path: str = "",
+    flow: bool = False,
+) -> "Tracker":
+    """`HandTracker` on the calling thread, `ProcessHandTracker` for `backend="process"`,
+    `LiveStreamHandTracker` (needs the `model_path` landmarker) for `"live_stream"` or
+    `TwoPlayerTracker` (one wrist per player) for `"two_player"`. `flow` enables optical-flow
+    interpolation of skipped frames on the inline and two-player trackers."""
+    if backend == "two_player":
+        from air_hockey.engine.two_player import TwoPlayerTracker
+
+        return TwoPlayerTracker(process_every=process_every, flow=flow)
+    if backend == "live_stream":
+        from air_hockey.engine.pose_live import LiveStreamHandTracker
+
+        return LiveStreamHandTracker(model_path=model_path, process_every=process_every)
+    if backend == "process":
+        from air_hockey.engine.pose_worker import ProcessHandTracker
+
+        return ProcessHandTracker(process_every=process_every)
+    return HandTracker(process_every=process_every, flow=flow)
+
+
+def apply_jump_filter(
+    previous: tuple[int, int] | None, current: tuple[int, int] | None, max_jump_px: float
+) -> tuple[int, int] | None:
+    if current is None:
+        return previous
+    if previous is None:
+        return current
+    dx = current[0] - previous[0]
+    dy = current[1] - previous[1]
+    if (dx * dx + dy * dy) ** 0.5 > max_jump_px:
+        return previous
+    return current
+
+
+class DetectionStage:
+    """Runs the tracker at most once per camera frame and publishes the result.
+
+    `poll` is cheap when the camera has not delivered a new frame (the sequence
+    number is unchanged). Physics substeps and renderers read `latest` without
+    ever triggering inference themselves. With an asynchronous tracker the sample
+    timestamp is that of the frame the positions were computed from. The mirrored
+    frame comes from `frames`, which screens share with their previews.
+    """
+
+    def __init__(
+        self,
+        tracker: "Tracker",
+        scale: float = 1.0,
+        max_jump_px: float = 80.0,
+        frames: Optional[FrameCache] = None,
+    ) -> None:
+        self.tracker = tracker
+        self.frames = frames if frames is not None else FrameCache()
+        self.scale = scale
+        self.max_jump_px = max_jump_px
+        self.latest = EMPTY_SAMPLE
+        self.frame_bgr: Optional[np.ndarray] = None
+        self.processed = 0
+        self.repeated = 0
+
+    def poll(self, frame: Optional[CameraFrame]) -> bool:
+        """Process `frame` if it is new; return True when `latest` changed."""
+        if frame is None:
+            return False
+        if frame.sequence == self.latest.sequence:
+            self.repeated += 1
+            return False
+        self.frames.update(frame)
+        frame_bgr = self.frames.flipped_bgr()
+        positions = self.tracker.detect(
+            frame_bgr, scale=self.scale, frame_id=frame.sequence, timestamp=frame.timestamp
+        )
+        previous = self.latest
+        self.latest = WristSample(
+            left=apply_jump_filter(previous.left, positions.left, self.max_jump_px),
+            right=apply_jump_filter(previous.right, positions.right, self.max_jump_px),
+            frame_size=(frame_bgr.shape[1], frame_bgr.shape[0]),
+            sequence=frame.sequence,
+            timestamp=positions.timestamp if positions.frame_id >= 0 else frame.timestamp,
+        )
+        self.frame_bgr = frame_bgr
+        self.processed += 1
+        return True
+
+    def reset(self) -> None:
+        self.latest = EMPTY_SAMPLE
+        self.frame_bgr = None
+
+    def close(self) -> None:
+        self.tracker.close()
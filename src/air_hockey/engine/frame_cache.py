@@ -0,0 +1,132 @@
+"""Per-frame cache of derived camera images, computed at most once per sequence."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import cv2
+import numpy as np
+import pygame
+
+from air_hockey.engine.camera import CameraFrame
+
+
+class FrameCache:
+    """Lazily derives the mirrored images every consumer of a camera frame needs.
+
+    `update` switches to a new frame (by sequence number) and invalidates the
+    derivatives; each accessor computes its image on first use and returns the
+    same array until the next new frame. Output buffers are reused across frames,
+    so callers must copy anything they keep past the next `update`. Previews are
+    resized before flipping and converting, so the full-resolution frame is only
+    read once for them.
+    """
+
+    def __init__(self) -> None:
+        self.sequence = -1
+        self.timestamp = 0.0
+        self._source: Optional[np.ndarray] = None
+        self._flipped: Optional[np.ndarray] = None
+        self._flipped_valid = False
+        self._hsv: Optional[np.ndarray] = None
+        self._hsv_valid = False
+        self._rgb: dict[tuple[int, int], np.ndarray] = {}
+        self._rgb_valid: set[tuple[int, int]] = set()
+        self._resized: dict[tuple[int, int], np.ndarray] = {}
+        # Surfaces alias the `_rgb` buffers, which therefore must never be replaced.
+        self._surfaces: dict[tuple[int, int], pygame.Surface] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def update(self, frame: Optional[CameraFrame]) -> bool:
+        """Point the cache at `frame`; return True when it is a new frame."""
+        if frame is None or frame.frame is None or frame.sequence == self.sequence:
+            return False
+        self.sequence = frame.sequence
+        self.timestamp = frame.timestamp
+        self._source = frame.frame
+        self._flipped_valid = False
+        self._hsv_valid = False
+        self._rgb_valid.clear()
+        return True
+
+    @property
+    def available(self) -> bool:
+        return self._source is not None
+
+    @property
+    def frame_size(self) -> tuple[int, int]:
+        if self._source is None:
+            return (0, 0)
+        return (self._source.shape[1], self._source.shape[0])
+
+    def scaled_size(self, width: int) -> tuple[int, int]:
+        """(`width`, height) keeping the frame's aspect ratio."""
+        frame_width, frame_height = self.frame_size
+        return (width, max(1, int(width * frame_height / max(1, frame_width))))
+
+    def flipped_bgr(self) -> Optional[np.ndarray]:
+        """Full-resolution mirrored BGR frame."""
+        if self._source is None:
+            return None
+        if self._flipped_valid:
+            self.hits += 1
+            return self._flipped
+        self.misses += 1
+        if self._flipped is None or self._flipped.shape != self._source.shape:
+            self._flipped = np.empty_like(self._source)
+        cv2.flip(self._source, 1, dst=self._flipped)
+        self._flipped_valid = True
+        return self._flipped
+
+    def hsv(self) -> Optional[np.ndarray]:
+        """Full-resolution mirrored HSV frame for the color detectors."""
+        flipped = self.flipped_bgr()
+        if flipped is None:
+            return None
+        if self._hsv_valid:
+            self.hits += 1
+            return self._hsv
+        self.misses += 1
+        if self._hsv is None or self._hsv.shape != flipped.shape:
+            self._hsv = np.empty_like(flipped)
+        cv2.cvtColor(flipped, cv2.COLOR_BGR2HSV, dst=self._hsv)
+        self._hsv_valid = True
+        return self._hsv
+
+    def rgb(self, size: tuple[int, int]) -> Optional[np.ndarray]:
+        """Mirrored RGB preview of the frame downscaled to `size` (width, height)."""
+        if self._source is None:
+            return None
+        buffer = self._rgb.get(size)
+        if buffer is not None and size in self._rgb_valid:
+            self.hits += 1
+            return buffer
+        self.misses += 1
+        if buffer is None:
+            buffer = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            self._rgb[size] = buffer
+            self._resized[size] = np.empty_like(buffer)
+        resized = self._resized[size]
+        # Linear is ~30x cheaper than INTER_AREA at preview sizes and looks the same there.
+        cv2.resize(self._source, size, dst=resized, interpolation=cv2.INTER_LINEAR)
+        cv2.cvtColor(resized, cv2.COLOR_BGR2RGB, dst=resized)
+        cv2.flip(resized, 1, dst=buffer)
+        self._rgb_valid.add(size)
+        return buffer
+
+    def preview_surface(self, size: tuple[int, int]) -> Optional[pygame.Surface]:
+        """`rgb(size)` as a pygame Surface that shares the RGB buffer.
+
+        The Surface is created once per size and aliases the persistent buffer,
+        so refreshing it is the single resize/flip/convert pass in `rgb` with no
+        Surface allocation or pixel copy; an unchanged frame costs nothing.
+        """
+        rgb = self.rgb(size)
+        if rgb is None:
+            return None
+        surface = self._surfaces.get(size)
+        if surface is None:
+            surface = pygame.image.frombuffer(rgb, size, "RGB")
+            self._surfaces[size] = surface
+        return surface
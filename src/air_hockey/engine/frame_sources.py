@@ -0,0 +1,315 @@
+"""Offline frame sources (video file, image sequence, synthetic) and the source factory."""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+import cv2
+import numpy as np
+
+from air_hockey.engine.camera import DEFAULT_RING_SIZE, FrameSource, create_camera
+
+if TYPE_CHECKING:
+    from air_hockey.config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".bmp")
+SYNTHETIC_MODES = ("balls", "skeleton")
+DEFAULT_SEQUENCE_FPS = 30.0
+TRUTH_HISTORY = 256
+
+
+class VideoFileSource(FrameSource):
+    """Plays a video file at its native frame rate (`realtime`) or as fast as it decodes."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        realtime: bool = True,
+        loop: bool = True,
+        ring_size: int = DEFAULT_RING_SIZE,
+    ) -> None:
+        super().__init__(ring_size=ring_size)
+        self.path = Path(path)
+        self.realtime = realtime
+        self.loop = loop
+        self._capture: Optional[cv2.VideoCapture] = None
+
+    def _open(self) -> bool:
+        capture = cv2.VideoCapture(str(self.path))
+        if not capture.isOpened():
+            capture.release()
+            return False
+        self._capture = capture
+        native_fps = capture.get(cv2.CAP_PROP_FPS)
+        self.fps = (native_fps if native_fps > 0 else DEFAULT_SEQUENCE_FPS) if self.realtime else 0.0
+        return True
+
+    def _read(self, buffer: Optional[np.ndarray]) -> tuple[bool, Optional[np.ndarray]]:
+        capture = self._capture
+        if capture is None:
+            return False, None
+        ok, image = capture.read(buffer) if buffer is not None else capture.read()
+        if ok:
+            return ok, image
+        if not self.loop:
+            self.exhausted = True
+            return False, None
+        capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        ok, image = capture.read(buffer) if buffer is not None else capture.read()
+        if not ok:
+            self.exhausted = True
+        return ok, image
+
+    def _close(self) -> None:
+        if self._capture is not None:
+            self._capture.release()
+        self._capture = None
+
+
+def load_image_sequence(path: str | Path) -> list[np.ndarray]:
+    """BGR frames from a directory of images (sorted by name) or an `.npz` archive.
+
+    An archive holding a `frames` array of shape (N, H, W, 3) is used as is; any
+    other archive contributes one frame per array, in key order.
+    """
+    path = Path(path)
+    if path.suffix == ".npz":
+        with np.load(path) as archive:
+            if "frames" in archive.files:
+                return [np.ascontiguousarray(frame) for frame in archive["frames"]]
+            return [np.ascontiguousarray(archive[key]) for key in sorted(archive.files)]
+    frames = []
+    for image_path in sorted(path.iterdir()):
+        if image_path.suffix.lower() not in IMAGE_SUFFIXES:
+            continue
+        image = cv2.imread(str(image_path), cv2.IMREAD_COLOR)
+        if image is not None:
+            frames.append(image)
+    return frames
+
+
+class ImageSequenceSource(FrameSource):
+    """Replays pre-decoded frames from a directory or `.npz` at `fps` (0 = unpaced).
+
+    Everything is decoded in `start` so disk and codec jitter never reach the
+    consumer; the frames are copied into the ring like a camera would fill it.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        fps: float = DEFAULT_SEQUENCE_FPS,
+        loop: bool = True,
+        ring_size: int = DEFAULT_RING_SIZE,
+    ) -> None:
+        super().__init__(ring_size=ring_size, fps=fps)
+        self.path = Path(path)
+        self.loop = loop
+        self._sequence_frames: list[np.ndarray] = []
+        self._index = 0
+
+    def _open(self) -> bool:
+        if not self.path.exists():
+            return False
+        self._sequence_frames = load_image_sequence(self.path)
+        self._index = 0
+        return bool(self._sequence_frames)
+
+    def _read(self, buffer: Optional[np.ndarray]) -> tuple[bool, Optional[np.ndarray]]:
+        if self._index >= len(self._sequence_frames):
+            if not self.loop or not self._sequence_frames:
+                self.exhausted = True
+                return False, None
+            self._index = 0
+        source = self._sequence_frames[self._index]
+        self._index += 1
+        if buffer is None or buffer.shape != source.shape:
+            return True, source.copy()
+        np.copyto(buffer, source)
+        return True, buffer
+
+    def _close(self) -> None:
+        self._sequence_frames = []
+
+
+class SyntheticSource(FrameSource):
+    """Renders a deterministic moving scene with known ground truth.
+
+    `balls` mode draws orange discs on Lissajous paths (for the ball detector);
+    `skeleton` mode draws a stick figure whose wrists sweep across the frame (for
+    pose tracking). `truth(sequence)` returns the object centres (balls) or the
+    (left, right) wrist pixels (skeleton) in the raw, unmirrored frame.
+    """
+
+    def __init__(
+        self,
+        width: int = 640,
+        height: int = 480,
+        fps: float = 60.0,
+        mode: str = "balls",
+        balls: int = 1,
+        seed: int = 0,
+        ring_size: int = DEFAULT_RING_SIZE,
+    ) -> None:
+        super().__init__(ring_size=ring_size, fps=fps)
+        if mode not in SYNTHETIC_MODES:
+            raise ValueError(f"unknown synthetic mode {mode!r}")
+        self.width = width
+        self.height = height
+        self.mode = mode
+        rng = np.random.default_rng(seed)
+        self._paths = [
+            (rng.uniform(0.3, 1.2), rng.uniform(0.3, 1.2), rng.uniform(0.0, math.tau))
+            for _ in range(max(1, balls))
+        ]
+        self._background = np.full((height, width, 3), 40, dtype=np.uint8)
+        self._frame_index = 0
+        self._truth: deque[tuple[int, list[tuple[int, int]]]] = deque(maxlen=TRUTH_HISTORY)
+
+    def truth(self, sequence: int) -> Optional[list[tuple[int, int]]]:
+        """Ground truth for a frame `sequence`, if it is still in the recent history."""
+        with self._lock:
+            for frame_sequence, points in reversed(self._truth):
+                if frame_sequence == sequence:
+                    return points
+        return None
+
+    def render(
+        self, index: int, buffer: Optional[np.ndarray] = None
+    ) -> tuple[np.ndarray, list[tuple[int, int]]]:
+        """Draw frame `index` into `buffer` and return it with its ground truth."""
+        if buffer is None or buffer.shape != self._background.shape:
+            buffer = self._background.copy()
+        else:
+            np.copyto(buffer, self._background)
+        t = index / (self.fps if self.fps > 0 else 60.0)
+        if self.mode == "skeleton":
+            return buffer, self._draw_skeleton(buffer, t)
+        return buffer, self._draw_balls(buffer, t)
+
+    def _draw_balls(self, image: np.ndarray, t: float) -> list[tuple[int, int]]:
+        radius = max(4, self.height // 24)
+        points = []
+        for fx, fy, phase in self._paths:
+            x = int((0.5 + 0.4 * math.sin(fx * math.tau * t + phase)) * self.width)
+            y = int((0.5 + 0.4 * math.sin(fy * math.tau * t + 2.0 * phase)) * self.height)
+            cv2.circle(image, (x, y), radius, (0, 140, 255), -1)
+            points.append((x, y))
+        return points
+
+    def _draw_skeleton(self, image: np.ndarray, t: float) -> list[tuple[int, int]]:
+        w, h = self.width, self.height
+        thickness = max(2, h // 40)
+        skin = (150, 180, 220)
+        neck = (w // 2, int(h * 0.3))
+        hip = (w // 2, int(h * 0.75))
+        shoulders = ((int(w * 0.4), int(h * 0.35)), (int(w * 0.6), int(h * 0.35)))
+        wrists = []
+        for side, (fx, fy, phase) in zip((-1, 1), self._paths * 2):
+            shoulder = shoulders[0 if side < 0 else 1]
+            angle = 0.6 * math.sin(fx * math.tau * t + phase)
+            reach = 0.25 + 0.08 * math.sin(fy * math.tau * t + phase)
+            wrist = (
+                int(shoulder[0] + side * reach * w * math.cos(angle)),
+                int(shoulder[1] + reach * h * math.sin(angle)),
+            )
+            elbow = ((shoulder[0] + wrist[0]) // 2, (shoulder[1] + wrist[1]) // 2 + h // 30)
+            cv2.line(image, shoulder, elbow, skin, thickness)
+            cv2.line(image, elbow, wrist, skin, thickness)
+            cv2.circle(image, wrist, thickness * 2, skin, -1)
+            wrists.append(wrist)
+        cv2.line(image, shoulders[0], shoulders[1], skin, thickness)
+        cv2.line(image, neck, hip, skin, thickness)
+        cv2.circle(image, (w // 2, int(h * 0.2)), h // 12, skin, -1)
+        # Person's left wrist is on the image right in the raw camera view.
+        return [wrists[1], wrists[0]]
+
+    def _open(self) -> bool:
+        self._frame_index = 0
+        self._truth.clear()
+        return True
+
+    def _read(self, buffer: Optional[np.ndarray]) -> tuple[bool, Optional[np.ndarray]]:
+        image, points = self.render(self._frame_index, buffer)
+        self._frame_index += 1
+        # The base class assigns sequence numbers one per successful read.
+        with self._lock:
+            self._truth.append((self._sequence + 1, points))
+        return True, image
+
+
+def _parse_synthetic(argument: str) -> dict[str, object]:
+    """`WxH@FPS[,mode]` with every part optional, e.g. `320x240@120,skeleton`."""
+    options: dict[str, object] = {}
+    for part in filter(None, argument.split(",")):
+        if part in SYNTHETIC_MODES:
+            options["mode"] = part
+            continue
+        size, _, fps = part.partition("@")
+        try:
+            if size:
+                width, _, height = size.partition("x")
+                options["width"] = int(width)
+                options["height"] = int(height)
+            if fps:
+                options["fps"] = float(fps)
+        except ValueError:
+            raise ValueError(f"bad synthetic option {part!r}, expected WxH@FPS") from None
+        if min(options.get("width", 1), options.get("height", 1), options.get("fps", 1)) <= 0:
+            raise ValueError(f"bad synthetic option {part!r}, sizes and fps must be positive")
+    return options
+
+
+def validate_frame_source(spec: str) -> str:
+    """Return `spec` unchanged, or raise ValueError naming what is wrong with it."""
+    kind, _, argument = spec.partition(":")
+    if kind == "synthetic":
+        _parse_synthetic(argument)
+    elif kind in ("video", "video-fast", "images"):
+        if not argument:
+            raise ValueError(f"frame source {kind!r} needs a path, e.g. {kind}:clip.mp4")
+    elif kind != "camera":
+        raise ValueError(
+            f"unknown frame source {spec!r}; expected camera[:index], video:PATH, "
+            "video-fast:PATH, images:PATH or synthetic[:WxH@FPS[,skeleton]]"
+        )
+    return spec
+
+
+def camera_device(spec: str) -> Optional[Union[int, str]]:
+    """Device index (or URL) of a `camera[:index]` spec; None for other sources."""
+    kind, _, argument = (spec or "camera").partition(":")
+    if kind != "camera":
+        return None
+    return int(argument) if argument.isdigit() else argument or 0
+
+
+def create_frame_source(settings: "Settings", spec: Optional[str] = None) -> FrameSource:
+    """Frame source for `spec` (default `settings.frame_source`).
+
+    Specs are `camera[:index]`, `video:PATH`, `video-fast:PATH`, `images:PATH`
+    and `synthetic[:WxH@FPS[,skeleton]]`. An invalid explicit `spec` raises
+    ValueError; an invalid setting is logged and replaced by the camera.
+    """
+    if not spec:
+        spec = settings.frame_source or "camera"
+        try:
+            validate_frame_source(spec)
+        except ValueError as exc:
+            logger.warning("Ignoring frame_source setting (%s); using the camera.", exc)
+            spec = "camera"
+    validate_frame_source(spec)
+    kind, _, argument = spec.partition(":")
+    if kind == "camera":
+        return create_camera(settings, camera_device(spec))
+    if kind in ("video", "video-fast"):
+        return VideoFileSource(argument, realtime=kind == "video")
+    if kind == "images":
+        return ImageSequenceSource(argument)
+    return SyntheticSource(**_parse_synthetic(argument))
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 
 import cv2
+
+from air_hockey.engine.optical_flow import WristFlow
+
 try:
     import mediapipe as mp
 except Exception as exc:  # pragma: no cover - runtime dependency check
@@ -19,10 +23,17 @@ else:
 class HandPositions:
     left: Optional[tuple[int, int]]
     right: Optional[tuple[int, int]]
+    frame_id: int = -1
+    timestamp: float = 0.0
 
 
 class HandTracker:
-    def __init__(self, process_every: int = 1) -> None:
+    def __init__(
+        self,
+        process_every: int = 1,
+        model_complexity: int = 1,
+        flow: bool = False,
+    ) -> None:
         if mp is None:
             raise RuntimeError(
                 "mediapipe is not available. Install mediapipe for Python 3.11/3.12 "
@@ -36,51 +47,205 @@ class HandTracker:
         self.process_every = max(1, process_every)
         self._frame_index = 0
         self._last_positions = HandPositions(left=None, right=None)
-        self._pose = mp.solutions.pose.Pose(
-            model_complexity=1,
+        self.model_complexity = model_complexity
+        self._pose = self._create_pose(model_complexity)
+        self._loader = PoseLoader(self._create_pose)
+        # Moves the wrists on skipped frames; re-anchored by every inference.
+        self._flow = WristFlow() if flow else None
+
+    @staticmethod
+    def _create_pose(model_complexity: int):
+        return mp.solutions.pose.Pose(
+            model_complexity=model_complexity,
             min_detection_confidence=0.5,
             min_tracking_confidence=0.5,
         )
 
-    def detect(self, frame_bgr: cv2.Mat, scale: float = 1.0) -> HandPositions:
+    def set_model_complexity(self, model_complexity: int) -> bool:
+        """Load another Pose graph in the background; `detect` swaps it in once built.
+
+        Building a graph can include MediaPipe's first-use download of the lite
+        or heavy model, so it never runs on the caller's thread. Returns False for
+        a complexity whose graph already failed to build; the current graph stays.
+        """
+        if model_complexity == self.model_complexity:
+            self._loader.cancel()
+            return True
+        return self._loader.request(model_complexity)
+
+    def detect(
+        self,
+        frame_bgr: cv2.Mat,
+        scale: float = 1.0,
+        frame_id: int = -1,
+        timestamp: float = 0.0,
+    ) -> HandPositions:
+        self._swap_loaded_pose()
         self._frame_index += 1
         if self._frame_index % self.process_every != 0:
-            return self._last_positions
+            if self._flow is None:
+                return self._last_positions
+            left_pos, right_pos = self._flow.track(frame_bgr)
+            return HandPositions(
+                left=left_pos, right=right_pos, frame_id=frame_id, timestamp=timestamp
+            )
         frame = frame_bgr
         if scale < 1.0:
-            new_w = max(1, int(frame_bgr.shape[1] * scale))
-            new_h = max(1, int(frame_bgr.shape[0] * scale))
-            frame = cv2.resize(frame_bgr, (new_w, new_h), interpolation=cv2.INTER_AREA)
+            new_size = scaled_size(frame_bgr.shape[1], frame_bgr.shape[0], scale)
+            frame = cv2.resize(frame_bgr, new_size, interpolation=cv2.INTER_AREA)
         rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         results = self._pose.process(rgb)
 
-        left_pos = None
-        right_pos = None
-        if results.pose_landmarks:
-            left_pos = self._wrist_position(
-                results.pose_landmarks, frame.shape[1], frame.shape[0], left=False
-            )
-            right_pos = self._wrist_position(
-                results.pose_landmarks, frame.shape[1], frame.shape[0], left=True
-            )
-            if scale < 1.0:
-                if left_pos is not None:
-                    left_pos = (int(left_pos[0] / scale), int(left_pos[1] / scale))
-                if right_pos is not None:
-                    right_pos = (int(right_pos[0] / scale), int(right_pos[1] / scale))
-        self._last_positions = HandPositions(left=left_pos, right=right_pos)
+        height, width = frame.shape[:2]
+        left_pos, right_pos = wrist_positions(results.pose_landmarks, width, height)
+        if scale < 1.0:
+            left_pos = unscale_position(left_pos, scale)
+            right_pos = unscale_position(right_pos, scale)
+        if self._flow is not None:
+            self._flow.anchor(frame_bgr, left_pos, right_pos)
+        self._last_positions = HandPositions(
+            left=left_pos, right=right_pos, frame_id=frame_id, timestamp=timestamp
+        )
         return self._last_positions
 
-    @staticmethod
-    def _wrist_position(landmarks, width: int, height: int, left: bool) -> Optional[tuple[int, int]]:
-        idx = (
-            mp.solutions.pose.PoseLandmark.LEFT_WRIST
-            if left
-            else mp.solutions.pose.PoseLandmark.RIGHT_WRIST
-        )
-        landmark = landmarks.landmark[idx]
-        if landmark.visibility < 0.5:
+    def close(self) -> None:
+        self._loader.close()
+        self._pose.close()
+
+    def _swap_loaded_pose(self) -> None:
+        loaded = self._loader.take()
+        if loaded is None:
+            return
+        self.model_complexity, (pose,) = loaded
+        self._pose.close()
+        self._pose = pose
+
+
+class PoseLoader:
+    """Builds replacement Pose graphs on a daemon thread for a tracker to swap in.
+
+    `request` records the wanted complexity and starts the build thread if it
+    is idle; a request made during a build is served right after it, and only
+    the newest finished graphs are kept for `take`. Complexities whose build
+    raised (typically a failed model download) are remembered in `failed` and
+    refused from then on.
+    """
+
+    def __init__(self, build: Callable[[int], object], count: int = 1) -> None:
+        self.build = build
+        self.count = count
+        self.failed: set[int] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._wanted: Optional[int] = None
+        self._ready: Optional[tuple[int, list]] = None
+        # Bumped by `cancel` so a build already running is discarded when it finishes.
+        self._generation = 0
+
+    def request(self, model_complexity: int) -> bool:
+        if model_complexity in self.failed:
+            return False
+        with self._lock:
+            self._wanted = model_complexity
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="air-hockey-pose-loader", daemon=True
+                )
+                self._thread.start()
+        return True
+
+    def take(self) -> Optional[tuple[int, list]]:
+        """(complexity, graphs) once a build has finished, else None."""
+        if self._ready is None:
             return None
-        x = int(landmark.x * width)
-        y = int(landmark.y * height)
-        return (x, y)
+        with self._lock:
+            ready, self._ready = self._ready, None
+        return ready
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._wanted = None
+            self._generation += 1
+            ready, self._ready = self._ready, None
+        _close_all(ready)
+
+    def close(self, timeout: float = 1.0) -> None:
+        self.cancel()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+        self.cancel()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                wanted, self._wanted = self._wanted, None
+                generation = self._generation
+                if wanted is None:
+                    self._thread = None
+                    return
+            graphs: list = []
+            try:
+                for _ in range(self.count):
+                    graphs.append(self.build(wanted))
+            except Exception:
+                self.failed.add(wanted)
+                _close_all((wanted, graphs))
+                continue
+            with self._lock:
+                if generation == self._generation:
+                    stale, self._ready = self._ready, (wanted, graphs)
+                else:
+                    stale = (wanted, graphs)
+            _close_all(stale)
+
+
+def _close_all(loaded: Optional[tuple[int, list]]) -> None:
+    if loaded is None:
+        return
+    for graph in loaded[1]:
+        graph.close()
+
+
+def wrist_positions(
+    landmarks, width: int, height: int
+) -> tuple[Optional[tuple[int, int]], Optional[tuple[int, int]]]:
+    """Screen-left and screen-right wrist pixels from pose landmarks of a mirrored frame.
+
+    Accepts a Solutions landmark list proto or a Tasks list of landmarks.
+    """
+    if not landmarks:
+        return None, None
+    points = getattr(landmarks, "landmark", landmarks)
+    return (
+        _wrist_position(points, width, height, left=False),
+        _wrist_position(points, width, height, left=True),
+    )
+
+
+def scaled_size(width: int, height: int, scale: float) -> tuple[int, int]:
+    if scale >= 1.0:
+        return width, height
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def unscale_position(
+    position: Optional[tuple[int, int]], scale: float
+) -> Optional[tuple[int, int]]:
+    if position is None:
+        return None
+    return (int(position[0] / scale), int(position[1] / scale))
+
+
+def _wrist_position(points, width: int, height: int, left: bool) -> Optional[tuple[int, int]]:
+    idx = (
+        mp.solutions.pose.PoseLandmark.LEFT_WRIST
+        if left
+        else mp.solutions.pose.PoseLandmark.RIGHT_WRIST
+    )
+    landmark = points[idx]
+    if landmark.visibility is not None and landmark.visibility < 0.5:
+        return None
+    x = int(landmark.x * width)
+    y = int(landmark.y * height)
+    return (x, y)
@@ -0,0 +1,91 @@
+"""Motion-to-display latency histograms keyed by pipeline stage."""
+
+from __future__ import annotations
+
+import bisect
+import math
+
+# Every stage records the age of the same camera frame (now - capture timestamp)
+# when that stage finishes, so consecutive stages show how much each one adds.
+STAGES = ("capture", "detect", "filter", "physics", "display")
+
+MIN_LATENCY_S = 1e-4
+MAX_LATENCY_S = 2.0
+BUCKET_RATIO = 1.1
+
+
+def _bucket_edges() -> list[float]:
+    count = int(math.log(MAX_LATENCY_S / MIN_LATENCY_S) / math.log(BUCKET_RATIO)) + 1
+    return [MIN_LATENCY_S * BUCKET_RATIO**index for index in range(count + 1)]
+
+
+_EDGES = _bucket_edges()
+
+
+class LatencyHistogram:
+    """Log-spaced histogram (10% wide buckets, 0.1 ms to 2 s) with O(1) memory."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(_EDGES) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        seconds = max(0.0, seconds)
+        self.counts[bisect.bisect_left(_EDGES, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """Upper edge of the bucket holding the `fraction` quantile (never above `max`)."""
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(fraction * self.count))
+        running = 0
+        for index, bucket in enumerate(self.counts):
+            running += bucket
+            if running >= target:
+                edge = _EDGES[index] if index < len(_EDGES) else self.max
+                return min(edge, self.max)
+        return self.max
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(_EDGES) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class LatencyTracker:
+    def __init__(self, stages: tuple[str, ...] = STAGES) -> None:
+        self.stages = stages
+        self.histograms = {stage: LatencyHistogram() for stage in stages}
+
+    def record(self, stage: str, captured_at: float, now: float) -> None:
+        """Record the age at `now` of data captured at `captured_at` (same clock)."""
+        self.histograms[stage].record(now - captured_at)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Per-stage count, mean, p50, p95, p99 and max in milliseconds."""
+        result = {}
+        for stage, histogram in self.histograms.items():
+            result[stage] = {
+                "count": histogram.count,
+                "mean_ms": histogram.mean * 1000.0,
+                "p50_ms": histogram.percentile(0.5) * 1000.0,
+                "p95_ms": histogram.percentile(0.95) * 1000.0,
+                "p99_ms": histogram.percentile(0.99) * 1000.0,
+                "max_ms": histogram.max * 1000.0,
+            }
+        return result
+
+    def reset(self) -> None:
+        for histogram in self.histograms.values():
+            histogram.reset()
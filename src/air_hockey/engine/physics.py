@@ -3,20 +3,99 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Optional
+from itertools import islice
 
+from air_hockey.engine.collision import Segment, circle_circle_toi, circle_segment_toi
+from air_hockey.engine.contacts import ContactBuffer, ContactKind
+from air_hockey.engine.trajectory import MAX_BOUNCES, TrajectoryPrediction, predict_trajectory
 from air_hockey.game.entities import MalletSpec, PuckSpec
 from air_hockey.game.field import FieldSpec
 
 
-@dataclass
+CONTACT_SLOP = 1e-7
+MAX_SWEPT_CONTACTS = 4
+
+
 class Body:
-    position: tuple[float, float]
-    linearVelocity: tuple[float, float]
-    radius: float
-    mass: float
-    restitution: float
-    damping: float = 0.0
+    """Circular body updated in place through scalar slots.
+
+    `position` / `linearVelocity` remain available as tuple properties for
+    rendering and game code; the step loop works on `x`, `y`, `vx`, `vy`.
+    """
+
+    __slots__ = (
+        "x",
+        "y",
+        "vx",
+        "vy",
+        "radius",
+        "damping",
+        "_mass",
+        "inv_mass",
+        "_restitution",
+        "clamped_restitution",
+    )
+
+    def __init__(
+        self,
+        position: tuple[float, float],
+        linearVelocity: tuple[float, float],
+        radius: float,
+        mass: float,
+        restitution: float,
+        damping: float = 0.0,
+    ) -> None:
+        self.x = float(position[0])
+        self.y = float(position[1])
+        self.vx = float(linearVelocity[0])
+        self.vy = float(linearVelocity[1])
+        self.radius = radius
+        self.damping = damping
+        self.mass = mass
+        self.restitution = restitution
+
+    @property
+    def position(self) -> tuple[float, float]:
+        return (self.x, self.y)
+
+    @position.setter
+    def position(self, value: tuple[float, float]) -> None:
+        self.x = float(value[0])
+        self.y = float(value[1])
+
+    @property
+    def linearVelocity(self) -> tuple[float, float]:
+        return (self.vx, self.vy)
+
+    @linearVelocity.setter
+    def linearVelocity(self, value: tuple[float, float]) -> None:
+        self.vx = float(value[0])
+        self.vy = float(value[1])
+
+    @property
+    def mass(self) -> float:
+        return self._mass
+
+    @mass.setter
+    def mass(self, value: float) -> None:
+        self._mass = value
+        self.inv_mass = 1.0 / value if value > 0 else 0.0
+
+    @property
+    def restitution(self) -> float:
+        return self._restitution
+
+    @restitution.setter
+    def restitution(self, value: float) -> None:
+        self._restitution = value
+        self.clamped_restitution = max(0.0, min(1.0, value))
+
+    def __repr__(self) -> str:
+        return (
+            f"Body(position={self.position}, linearVelocity={self.linearVelocity}, "
+            f"radius={self.radius}, mass={self._mass}, restitution={self._restitution}, "
+            f"damping={self.damping})"
+        )
 
 
 @dataclass
@@ -30,19 +109,25 @@ class PhysicsWorld:
     def __init__(
         self,
         field: FieldSpec,
-        on_puck_wall: Optional[Callable[[], None]] = None,
-        on_puck_mallet: Optional[Callable[[], None]] = None,
         puck_restitution: float | None = None,
         puck_damping: float | None = None,
         max_puck_speed: float | None = None,
+        continuous_collision: bool = False,
+        contact_capacity: int = 64,
     ) -> None:
         self.field = field
-        self.on_puck_wall = on_puck_wall
-        self.on_puck_mallet = on_puck_mallet
         self.puck_restitution = puck_restitution
         self.puck_damping = puck_damping
         self.max_puck_speed = max_puck_speed
+        self.continuous_collision = continuous_collision
         self.entities = self._create_entities()
+        self.wall_segments = self._build_wall_segments()
+        self._half_width = field.width / 2.0
+        self._half_height = field.height / 2.0
+        self._goal_half = field.goal_height / 2.0
+        self.contacts = ContactBuffer(contact_capacity)
+        self.tick = 0
+        self._refresh_contact_constants()
 
     def _create_entities(self) -> PhysicsEntities:
         puck_spec = PuckSpec()
@@ -75,22 +160,181 @@ class PhysicsWorld:
         )
         return PhysicsEntities(puck=puck, mallet_left=mallet_left, mallet_right=mallet_right)
 
+    def _build_wall_segments(self) -> tuple[Segment, ...]:
+        half_width = self.field.width / 2.0
+        half_height = self.field.height / 2.0
+        goal_half = self.field.goal_height / 2.0
+        return (
+            Segment((-half_width, -half_height), (half_width, -half_height)),
+            Segment((-half_width, half_height), (half_width, half_height)),
+            Segment((-half_width, -half_height), (-half_width, -goal_half)),
+            Segment((-half_width, goal_half), (-half_width, half_height)),
+            Segment((half_width, -half_height), (half_width, -goal_half)),
+            Segment((half_width, goal_half), (half_width, half_height)),
+        )
+
+    def _refresh_contact_constants(self) -> None:
+        """Precompute per-pair collision constants; call after changing body materials."""
+        puck = self.entities.puck
+        self._mallet_constants = {}
+        for mallet, kind in (
+            (self.entities.mallet_left, ContactKind.MALLET_LEFT),
+            (self.entities.mallet_right, ContactKind.MALLET_RIGHT),
+        ):
+            restitution = max(0.0, min(1.0, (puck.restitution + mallet.restitution) * 0.5))
+            inv_mass_sum = puck.inv_mass + mallet.inv_mass
+            self._mallet_constants[id(mallet)] = (
+                restitution,
+                1.0 / inv_mass_sum if inv_mass_sum > 0 else 1.0,
+                kind,
+            )
+
     def step(self, time_step: float) -> None:
+        """Advance one tick; contacts are appended to `self.contacts` for consumers to drain."""
+        self.tick += 1
         puck = self.entities.puck
+        mallet_left = self.entities.mallet_left
+        mallet_right = self.entities.mallet_right
         self._apply_damping(puck, time_step)
-        self._integrate_body(puck, time_step)
-
-        self._apply_damping(self.entities.mallet_left, time_step)
-        self._apply_damping(self.entities.mallet_right, time_step)
-        self._integrate_body(self.entities.mallet_left, time_step)
-        self._integrate_body(self.entities.mallet_right, time_step)
+        self._apply_damping(mallet_left, time_step)
+        self._apply_damping(mallet_right, time_step)
+        first_event = len(self.contacts)
+        before_vx = puck.vx
+        before_vy = puck.vy
+
+        if self.continuous_collision:
+            self._advance_swept(time_step)
+        else:
+            self._integrate_body(puck, time_step)
+            self._integrate_body(mallet_left, time_step)
+            self._integrate_body(mallet_right, time_step)
 
         self._resolve_puck_walls(puck)
-        self._resolve_puck_mallet_collision(puck, self.entities.mallet_left)
-        self._resolve_puck_mallet_collision(puck, self.entities.mallet_right)
+        self._resolve_puck_mallet_collision(puck, mallet_left)
+        self._resolve_puck_mallet_collision(puck, mallet_right)
+
+        if self.max_puck_speed and self._clamp_puck_speed():
+            self._limit_mallet_impulses(first_event, before_vx, before_vy)
 
-        if self.max_puck_speed:
-            self._clamp_puck_speed()
+    def _limit_mallet_impulses(self, first_event: int, before_vx: float, before_vy: float) -> None:
+        """Cap this step's mallet impulses at the puck's velocity change after the speed clamp.
+
+        A mallet pushing a clamped puck hits it again every step, but the puck
+        barely changes speed, so the recorded impulse must not say otherwise.
+        """
+        puck = self.entities.puck
+        dvx = puck.vx - before_vx
+        dvy = puck.vy - before_vy
+        limit = puck.mass * (dvx * dvx + dvy * dvy) ** 0.5
+        for event in islice(self.contacts, first_event, None):
+            if event.kind != ContactKind.WALL and event.impulse > limit:
+                event.impulse = limit
+
+    def _advance_swept(self, time_step: float) -> None:
+        """Integrate one tick, stopping at each time of impact inside the tick."""
+        puck = self.entities.puck
+        mallet_left = self.entities.mallet_left
+        mallet_right = self.entities.mallet_right
+        remaining = time_step
+        for _ in range(MAX_SWEPT_CONTACTS):
+            contact_time = remaining
+            contact_normal: tuple[float, float] | None = None
+            contact_mallet: Body | None = None
+            if self._may_reach_walls(puck, remaining):
+                for segment in self.wall_segments:
+                    hit = circle_segment_toi(
+                        puck.position, puck.linearVelocity, puck.radius, segment, contact_time
+                    )
+                    if hit is not None:
+                        contact_time = hit.time
+                        contact_normal = hit.normal
+            for mallet in (mallet_left, mallet_right):
+                if not self._may_reach_mallet(puck, mallet, contact_time):
+                    continue
+                t = circle_circle_toi(
+                    puck.position,
+                    puck.linearVelocity,
+                    mallet.position,
+                    mallet.linearVelocity,
+                    puck.radius + mallet.radius,
+                    contact_time,
+                )
+                if t is not None:
+                    contact_time = t
+                    contact_normal = None
+                    contact_mallet = mallet
+            if contact_normal is None and contact_mallet is None:
+                break
+
+            self._integrate_body(puck, contact_time)
+            self._integrate_body(mallet_left, contact_time)
+            self._integrate_body(mallet_right, contact_time)
+            remaining -= contact_time
+
+            if contact_mallet is None:
+                nx, ny = contact_normal
+                self._reflect_off_wall(puck, nx, ny)
+            else:
+                dx = puck.x - contact_mallet.x
+                dy = puck.y - contact_mallet.y
+                distance = (dx * dx + dy * dy) ** 0.5 or 1.0
+                nx = dx / distance
+                ny = dy / distance
+                self._apply_mallet_impulse(puck, contact_mallet, nx, ny)
+            puck.x += nx * CONTACT_SLOP
+            puck.y += ny * CONTACT_SLOP
+
+        self._integrate_body(puck, remaining)
+        self._integrate_body(mallet_left, remaining)
+        self._integrate_body(mallet_right, remaining)
+
+    def _may_reach_walls(self, puck: Body, time_step: float) -> bool:
+        radius = puck.radius
+        end_x = puck.x + puck.vx * time_step
+        end_y = puck.y + puck.vy * time_step
+        x_limit = self._half_width - radius
+        y_limit = self._half_height - radius
+        return not (
+            -x_limit < min(puck.x, end_x)
+            and max(puck.x, end_x) < x_limit
+            and -y_limit < min(puck.y, end_y)
+            and max(puck.y, end_y) < y_limit
+        )
+
+    @staticmethod
+    def _may_reach_mallet(puck: Body, mallet: Body, time_step: float) -> bool:
+        dx = puck.x - mallet.x
+        dy = puck.y - mallet.y
+        wx = puck.vx - mallet.vx
+        wy = puck.vy - mallet.vy
+        reach = puck.radius + mallet.radius + (wx * wx + wy * wy) ** 0.5 * time_step
+        return dx * dx + dy * dy <= reach * reach
+
+    def _reflect_off_wall(self, puck: Body, nx: float, ny: float) -> None:
+        vel_along_normal = puck.vx * nx + puck.vy * ny
+        if vel_along_normal >= 0.0:
+            return
+        restitution = puck.clamped_restitution
+        old_vx = puck.vx
+        old_vy = puck.vy
+        puck.vx = (old_vx - 2.0 * vel_along_normal * nx) * restitution
+        puck.vy = (old_vy - 2.0 * vel_along_normal * ny) * restitution
+        self._record_wall_contact(puck, nx, ny, old_vx, old_vy)
+
+    def _record_wall_contact(
+        self, puck: Body, nx: float, ny: float, old_vx: float, old_vy: float
+    ) -> None:
+        dvx = puck.vx - old_vx
+        dvy = puck.vy - old_vy
+        self.contacts.record(
+            ContactKind.WALL,
+            puck.x - nx * puck.radius,
+            puck.y - ny * puck.radius,
+            nx,
+            ny,
+            puck.mass * (dvx * dvx + dvy * dvy) ** 0.5,
+            self.tick,
+        )
 
     def update_puck_settings(
         self, restitution: float, damping: float, max_speed: float
@@ -99,6 +343,30 @@ class PhysicsWorld:
         puck = self.entities.puck
         puck.damping = max(0.0, damping)
         puck.restitution = restitution
+        self._refresh_contact_constants()
+
+    def predict_trajectory(
+        self, horizon_s: float, time_step: float | None = None, max_bounces: int = MAX_BOUNCES
+    ) -> TrajectoryPrediction:
+        """Closed-form puck path over `horizon_s` (walls, goals, damping; mallets ignored)."""
+        puck = self.entities.puck
+        return predict_trajectory(
+            self.field,
+            puck.position,
+            puck.linearVelocity,
+            puck.radius,
+            puck.restitution,
+            puck.damping,
+            horizon_s,
+            max_speed=self.max_puck_speed,
+            time_step=time_step,
+            max_bounces=max_bounces,
+        )
+
+    def time_to_reach_x(
+        self, x: float, horizon_s: float = 3.0, time_step: float | None = None
+    ) -> float | None:
+        return self.predict_trajectory(horizon_s, time_step=time_step).time_to_reach_x(x)
 
     def set_mallet_positions(
         self,
@@ -108,28 +376,22 @@ class PhysicsWorld:
         teleport: bool = False,
         max_speed: float | None = None,
     ) -> None:
+        left_body = self.entities.mallet_left
+        right_body = self.entities.mallet_right
         if teleport:
-            self.entities.mallet_left.linearVelocity = (0.0, 0.0)
-            self.entities.mallet_right.linearVelocity = (0.0, 0.0)
-            self.entities.mallet_left.position = left_pos
-            self.entities.mallet_right.position = right_pos
+            left_body.vx = left_body.vy = 0.0
+            right_body.vx = right_body.vy = 0.0
+            left_body.position = left_pos
+            right_body.position = right_pos
             return
 
-        left_body = self.entities.mallet_left
-        right_body = self.entities.mallet_right
-        left_vel = (
-            (left_pos[0] - left_body.position[0]) / time_step,
-            (left_pos[1] - left_body.position[1]) / time_step,
-        )
-        right_vel = (
-            (right_pos[0] - right_body.position[0]) / time_step,
-            (right_pos[1] - right_body.position[1]) / time_step,
-        )
+        left_body.vx = (left_pos[0] - left_body.x) / time_step
+        left_body.vy = (left_pos[1] - left_body.y) / time_step
+        right_body.vx = (right_pos[0] - right_body.x) / time_step
+        right_body.vy = (right_pos[1] - right_body.y) / time_step
         if max_speed and max_speed > 0:
-            left_vel = self._clamp_velocity(left_vel, max_speed)
-            right_vel = self._clamp_velocity(right_vel, max_speed)
-        left_body.linearVelocity = left_vel
-        right_body.linearVelocity = right_vel
+            self._clamp_body_speed(left_body, max_speed)
+            self._clamp_body_speed(right_body, max_speed)
 
     @staticmethod
     def _circle_mass(radius: float, density: float) -> float:
@@ -137,57 +399,57 @@ class PhysicsWorld:
 
     @staticmethod
     def _integrate_body(body: Body, time_step: float) -> None:
-        vx, vy = body.linearVelocity
-        body.position = (
-            body.position[0] + vx * time_step,
-            body.position[1] + vy * time_step,
-        )
+        body.x += body.vx * time_step
+        body.y += body.vy * time_step
 
     @staticmethod
     def _apply_damping(body: Body, time_step: float) -> None:
         if body.damping <= 0:
             return
         decay = max(0.0, 1.0 - body.damping * time_step)
-        body.linearVelocity = (body.linearVelocity[0] * decay, body.linearVelocity[1] * decay)
+        body.vx *= decay
+        body.vy *= decay
 
     def _resolve_puck_walls(self, puck: Body) -> None:
-        half_width = self.field.width / 2.0
-        half_height = self.field.height / 2.0
-        goal_half = self.field.goal_height / 2.0
-        x, y = puck.position
-        vx, vy = puck.linearVelocity
+        half_width = self._half_width
+        half_height = self._half_height
         radius = puck.radius
-        hit_wall = False
-
-        if y - radius < -half_height:
-            y = -half_height + radius
-            vy = abs(vy) if abs(vy) > 0.0 else 0.1
-            hit_wall = True
-        elif y + radius > half_height:
-            y = half_height - radius
-            vy = -abs(vy) if abs(vy) > 0.0 else -0.1
-            hit_wall = True
-
-        if abs(y) >= goal_half:
-            if x - radius < -half_width:
-                x = -half_width + radius
-                vx = abs(vx) if abs(vx) > 0.0 else 0.1
-                hit_wall = True
-            elif x + radius > half_width:
-                x = half_width - radius
-                vx = -abs(vx) if abs(vx) > 0.0 else -0.1
-                hit_wall = True
-
-        if hit_wall:
-            restitution = max(0.0, min(1.0, puck.restitution))
-            puck.position = (x, y)
-            puck.linearVelocity = (vx * restitution, vy * restitution)
-            if self.on_puck_wall:
-                self.on_puck_wall()
+        old_vx = puck.vx
+        old_vy = puck.vy
+        nx = 0.0
+        ny = 0.0
+
+        if puck.y - radius < -half_height:
+            puck.y = -half_height + radius
+            puck.vy = abs(puck.vy) if abs(puck.vy) > 0.0 else 0.1
+            ny = 1.0
+        elif puck.y + radius > half_height:
+            puck.y = half_height - radius
+            puck.vy = -abs(puck.vy) if abs(puck.vy) > 0.0 else -0.1
+            ny = -1.0
+
+        if abs(puck.y) >= self._goal_half:
+            if puck.x - radius < -half_width:
+                puck.x = -half_width + radius
+                puck.vx = abs(puck.vx) if abs(puck.vx) > 0.0 else 0.1
+                nx = 1.0
+            elif puck.x + radius > half_width:
+                puck.x = half_width - radius
+                puck.vx = -abs(puck.vx) if abs(puck.vx) > 0.0 else -0.1
+                nx = -1.0
+
+        if nx != 0.0 or ny != 0.0:
+            restitution = puck.clamped_restitution
+            puck.vx *= restitution
+            puck.vy *= restitution
+            if nx != 0.0 and ny != 0.0:
+                nx *= 0.7071067811865476
+                ny *= 0.7071067811865476
+            self._record_wall_contact(puck, nx, ny, old_vx, old_vy)
 
     def _resolve_puck_mallet_collision(self, puck: Body, mallet: Body) -> None:
-        dx = puck.position[0] - mallet.position[0]
-        dy = puck.position[1] - mallet.position[1]
+        dx = puck.x - mallet.x
+        dy = puck.y - mallet.y
         distance_sq = dx * dx + dy * dy
         min_dist = puck.radius + mallet.radius
         if distance_sq >= min_dist * min_dist:
@@ -198,52 +460,47 @@ class PhysicsWorld:
         ny = dy / distance
 
         penetration = min_dist - distance
-        puck.position = (
-            puck.position[0] + nx * penetration,
-            puck.position[1] + ny * penetration,
-        )
+        puck.x += nx * penetration
+        puck.y += ny * penetration
+        self._apply_mallet_impulse(puck, mallet, nx, ny)
 
-        rvx = puck.linearVelocity[0] - mallet.linearVelocity[0]
-        rvy = puck.linearVelocity[1] - mallet.linearVelocity[1]
-        vel_along_normal = rvx * nx + rvy * ny
+    def _apply_mallet_impulse(self, puck: Body, mallet: Body, nx: float, ny: float) -> None:
+        vel_along_normal = (puck.vx - mallet.vx) * nx + (puck.vy - mallet.vy) * ny
         if vel_along_normal > 0:
             return
 
-        restitution = max(0.0, min(1.0, (puck.restitution + mallet.restitution) * 0.5))
-        inv_mass_puck = 1.0 / puck.mass if puck.mass > 0 else 0.0
-        inv_mass_mallet = 1.0 / mallet.mass if mallet.mass > 0 else 0.0
-        impulse = -(1.0 + restitution) * vel_along_normal
-        impulse /= inv_mass_puck + inv_mass_mallet if (inv_mass_puck + inv_mass_mallet) > 0 else 1.0
+        restitution, effective_mass, kind = self._mallet_constants[id(mallet)]
+        impulse = -(1.0 + restitution) * vel_along_normal * effective_mass
         imp_x = impulse * nx
         imp_y = impulse * ny
 
-        puck.linearVelocity = (
-            puck.linearVelocity[0] + imp_x * inv_mass_puck,
-            puck.linearVelocity[1] + imp_y * inv_mass_puck,
-        )
-        mallet.linearVelocity = (
-            mallet.linearVelocity[0] - imp_x * inv_mass_mallet,
-            mallet.linearVelocity[1] - imp_y * inv_mass_mallet,
+        puck.vx += imp_x * puck.inv_mass
+        puck.vy += imp_y * puck.inv_mass
+        mallet.vx -= imp_x * mallet.inv_mass
+        mallet.vy -= imp_y * mallet.inv_mass
+        self.contacts.record(
+            kind,
+            puck.x - nx * puck.radius,
+            puck.y - ny * puck.radius,
+            nx,
+            ny,
+            abs(impulse),
+            self.tick,
         )
-        if self.on_puck_mallet:
-            self.on_puck_mallet()
 
-    def _clamp_puck_speed(self) -> None:
-        puck = self.entities.puck
-        vx, vy = puck.linearVelocity
-        speed_sq = vx * vx + vy * vy
+    def _clamp_puck_speed(self) -> bool:
         max_speed = self.max_puck_speed or 0.0
         if max_speed <= 0.0:
-            return
-        if speed_sq > max_speed * max_speed:
-            scale = max_speed / (speed_sq ** 0.5)
-            puck.linearVelocity = (vx * scale, vy * scale)
+            return False
+        return self._clamp_body_speed(self.entities.puck, max_speed)
 
     @staticmethod
-    def _clamp_velocity(velocity: tuple[float, float], max_speed: float) -> tuple[float, float]:
-        vx, vy = velocity
-        speed_sq = vx * vx + vy * vy
+    def _clamp_body_speed(body: Body, max_speed: float) -> bool:
+        """Scale `body` down to `max_speed`; True if it was faster."""
+        speed_sq = body.vx * body.vx + body.vy * body.vy
         if speed_sq <= max_speed * max_speed:
-            return velocity
+            return False
         scale = max_speed / (speed_sq ** 0.5)
-        return (vx * scale, vy * scale)
+        body.vx *= scale
+        body.vy *= scale
+        return True
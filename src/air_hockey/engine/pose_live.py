@@ -0,0 +1,129 @@
+"""Asynchronous pose tracking on the MediaPipe Tasks PoseLandmarker in live-stream mode."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from air_hockey.engine.hand_tracking import (
+    HandPositions,
+    mp,
+    scaled_size,
+    unscale_position,
+    wrist_positions,
+)
+
+DEFAULT_MODEL_NAME = "pose_landmarker_lite.task"
+MODEL_URL = (
+    "https://storage.googleapis.com/mediapipe-models/pose_landmarker/"
+    "pose_landmarker_lite/float16/latest/pose_landmarker_lite.task"
+)
+
+
+def resolve_model_path(model_path: str = "") -> Path:
+    """`model_path`, or `models/pose_landmarker_lite.task` in the user data directory."""
+    if model_path:
+        return Path(model_path).expanduser()
+    from air_hockey.config.io import get_user_data_dir
+
+    return get_user_data_dir() / "models" / DEFAULT_MODEL_NAME
+
+
+class LiveStreamHandTracker:
+    """Drop-in `HandTracker` replacement that never waits for inference.
+
+    `detect` hands the frame to `detect_async` with a monotonic millisecond
+    timestamp and returns the newest completed result. MediaPipe drops frames
+    on its own while the previous one is still in inference; those are counted
+    in `dropped` once a later result arrives. Results land on a MediaPipe thread
+    and are published under a lock.
+    """
+
+    def __init__(self, model_path: str = "", process_every: int = 1) -> None:
+        if mp is None or not hasattr(mp, "tasks"):
+            raise RuntimeError(
+                "mediapipe with the Tasks API is required for the live_stream pose backend."
+            )
+        path = resolve_model_path(model_path)
+        if not path.is_file():
+            raise RuntimeError(
+                f"Pose landmarker model not found at {path}. Download {MODEL_URL} "
+                "there or set pose_model_path in settings.json."
+            )
+        self.process_every = max(1, process_every)
+        self._frame_index = 0
+        self._last_timestamp_ms = -1
+        self._lock = threading.Lock()
+        self._last_positions = HandPositions(left=None, right=None)
+        # timestamp_ms -> (frame_id, timestamp, scale, width, height) of in-flight frames
+        self._pending: dict[int, tuple[int, float, float, int, int]] = {}
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0
+        vision = mp.tasks.vision
+        options = vision.PoseLandmarkerOptions(
+            base_options=mp.tasks.BaseOptions(model_asset_path=str(path)),
+            running_mode=vision.RunningMode.LIVE_STREAM,
+            num_poses=1,
+            min_pose_detection_confidence=0.5,
+            min_tracking_confidence=0.5,
+            result_callback=self._on_result,
+        )
+        self._landmarker = vision.PoseLandmarker.create_from_options(options)
+
+    def detect(
+        self,
+        frame_bgr: np.ndarray,
+        scale: float = 1.0,
+        frame_id: int = -1,
+        timestamp: float = 0.0,
+    ) -> HandPositions:
+        self._frame_index += 1
+        if self._frame_index % self.process_every == 0:
+            self._submit(frame_bgr, scale, frame_id, timestamp)
+        with self._lock:
+            return self._last_positions
+
+    def close(self) -> None:
+        self._landmarker.close()
+
+    def _submit(self, frame_bgr: np.ndarray, scale: float, frame_id: int, timestamp: float) -> None:
+        width, height = scaled_size(frame_bgr.shape[1], frame_bgr.shape[0], scale)
+        frame = frame_bgr
+        if (width, height) != (frame_bgr.shape[1], frame_bgr.shape[0]):
+            frame = cv2.resize(frame_bgr, (width, height), interpolation=cv2.INTER_AREA)
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # MediaPipe rejects timestamps that do not strictly increase.
+        timestamp_ms = int((timestamp or time.perf_counter()) * 1000.0)
+        timestamp_ms = max(timestamp_ms, self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+        with self._lock:
+            self._pending[timestamp_ms] = (frame_id, timestamp, scale, width, height)
+        self._landmarker.detect_async(
+            mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb), timestamp_ms
+        )
+        self.submitted += 1
+
+    def _on_result(self, result, image, timestamp_ms: int) -> None:
+        with self._lock:
+            stale = [key for key in self._pending if key < timestamp_ms]
+            for key in stale:
+                del self._pending[key]
+            self.dropped += len(stale)
+            entry = self._pending.pop(timestamp_ms, None)
+            if entry is None:
+                return
+            frame_id, timestamp, scale, width, height = entry
+            landmarks = result.pose_landmarks[0] if result.pose_landmarks else None
+            left, right = wrist_positions(landmarks, width, height)
+            if scale < 1.0:
+                left = unscale_position(left, scale)
+                right = unscale_position(right, scale)
+            self._last_positions = HandPositions(
+                left=left, right=right, frame_id=frame_id, timestamp=timestamp
+            )
+            self.completed += 1
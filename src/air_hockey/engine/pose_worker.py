@@ -0,0 +1,327 @@
+"""Out-of-process pose tracking fed through a shared-memory frame ring."""
+
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import time
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from air_hockey.engine.hand_tracking import HandPositions, scaled_size, unscale_position
+
+DEFAULT_SLOTS = 3
+READY = "ready"
+MODEL = "model"
+
+
+def _slot_view(ring: np.ndarray, slot: int, width: int, height: int) -> np.ndarray:
+    """Contiguous (height, width, 3) view at the start of a ring slot."""
+    return ring[slot, : height * width * 3].reshape(height, width, 3)
+
+
+def _worker_main(
+    shm_name: str,
+    slot_bytes: int,
+    slots: int,
+    requests: multiprocessing.Queue,
+    results: multiprocessing.Queue,
+    model_complexity: int,
+) -> None:
+    import mediapipe
+
+    from air_hockey.engine.hand_tracking import wrist_positions
+
+    def create_pose(complexity: int):
+        return mediapipe.solutions.pose.Pose(
+            model_complexity=complexity,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5,
+        )
+
+    def switch_model(pose, complexity: int):
+        try:
+            replacement = create_pose(complexity)
+        except Exception:
+            results.put((MODEL, complexity, False))
+            return pose
+        pose.close()
+        results.put((MODEL, complexity, True))
+        return replacement
+
+    shm = SharedMemory(name=shm_name)
+    ring = np.ndarray((slots, slot_bytes), dtype=np.uint8, buffer=shm.buf)
+    pose = create_pose(model_complexity)
+    results.put((READY,))
+    try:
+        while True:
+            item = requests.get()
+            if item is None:
+                break
+            if item[0] == MODEL:
+                pose = switch_model(pose, item[1])
+                continue
+            # Only the newest frame matters; hand stale slots straight back. A model
+            # switch queued behind frames is applied after the frame in hand.
+            stop = False
+            model = None
+            while True:
+                try:
+                    newer = requests.get_nowait()
+                except queue.Empty:
+                    break
+                if newer is None:
+                    stop = True
+                    break
+                if newer[0] == MODEL:
+                    model = newer[1]
+                    continue
+                results.put((item[0], item[1], item[2], None, None, False))
+                item = newer
+            slot, frame_id, timestamp, width, height = item
+            rgb = cv2.cvtColor(_slot_view(ring, slot, width, height), cv2.COLOR_BGR2RGB)
+            output = pose.process(rgb)
+            left, right = wrist_positions(output.pose_landmarks, width, height)
+            results.put((slot, frame_id, timestamp, left, right, True))
+            if model is not None:
+                pose = switch_model(pose, model)
+            if stop:
+                break
+    finally:
+        pose.close()
+        del ring
+        shm.close()
+
+
+class ProcessHandTracker:
+    """Drop-in `HandTracker` replacement that runs MediaPipe Pose in a worker process.
+
+    `detect` never waits for inference: it copies (or downscales) the frame into a
+    free shared-memory slot, queues the slot index, and returns the newest result
+    the worker has published, tagged with the frame id and timestamp it came from.
+    Frames are dropped when every slot is still in flight. A worker that crashes,
+    or has not reported ready within `start_timeout` seconds, is restarted up to
+    `max_restarts` times; after that `failed` is set and frames are no longer sent.
+    """
+
+    def __init__(
+        self,
+        process_every: int = 1,
+        slots: int = DEFAULT_SLOTS,
+        model_complexity: int = 1,
+        max_restarts: int = 3,
+        start_timeout: float = 30.0,
+    ) -> None:
+        self.process_every = max(1, process_every)
+        self.slots = max(2, slots)
+        self.model_complexity = model_complexity
+        self._loaded_complexity = model_complexity
+        self.max_restarts = max_restarts
+        self.start_timeout = start_timeout
+        self._context = multiprocessing.get_context("spawn")
+        self._frame_index = 0
+        self._last_positions = HandPositions(left=None, right=None)
+        self._shm: Optional[SharedMemory] = None
+        self._ring: Optional[np.ndarray] = None
+        self._slot_bytes = 0
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._requests: Optional[multiprocessing.Queue] = None
+        self._results: Optional[multiprocessing.Queue] = None
+        self._ready = False
+        self._started_at = 0.0
+        self._pending: dict[int, float] = {}
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0
+        self.restarts = 0
+        self.failed = False
+
+    def detect(
+        self,
+        frame_bgr: np.ndarray,
+        scale: float = 1.0,
+        frame_id: int = -1,
+        timestamp: float = 0.0,
+    ) -> HandPositions:
+        self._collect()
+        self._frame_index += 1
+        if self._frame_index % self.process_every == 0 and not self.failed:
+            self._submit(frame_bgr, scale, frame_id, timestamp)
+        return self._last_positions
+
+    def close(self) -> None:
+        self._stop_worker()
+        self._release_ring()
+
+    def set_model_complexity(self, model_complexity: int) -> bool:
+        """Ask the worker to switch models; it rebuilds its Pose graph between frames.
+
+        Never waits: the worker reports back through the results queue, and a
+        failed build reverts `model_complexity` there. A worker started later
+        uses the new complexity directly.
+        """
+        if model_complexity == self.model_complexity:
+            return True
+        self._loaded_complexity = self.model_complexity
+        self.model_complexity = model_complexity
+        if self._process is not None:
+            try:
+                self._requests.put((MODEL, model_complexity))
+            except (OSError, ValueError):
+                pass
+        return True
+
+    def _submit(self, frame_bgr: np.ndarray, scale: float, frame_id: int, timestamp: float) -> None:
+        width, height = scaled_size(frame_bgr.shape[1], frame_bgr.shape[0], scale)
+        if width * height * 3 > self._slot_bytes:
+            self._stop_worker()
+            self._release_ring()
+            self._allocate_ring(width * height * 3)
+        if self._process is None and not self._start_worker():
+            return
+        if not self._ready:
+            self.dropped += 1
+            return
+        slot = next((index for index in range(self.slots) if index not in self._pending), None)
+        if slot is None:
+            self.dropped += 1
+            return
+        view = _slot_view(self._ring, slot, width, height)
+        if (width, height) == (frame_bgr.shape[1], frame_bgr.shape[0]):
+            np.copyto(view, frame_bgr)
+        else:
+            cv2.resize(frame_bgr, (width, height), dst=view, interpolation=cv2.INTER_AREA)
+        self._pending[slot] = scale
+        self._requests.put((slot, frame_id, timestamp, width, height))
+        self.submitted += 1
+
+    def _collect(self) -> None:
+        if self._results is None:
+            return
+        while True:
+            try:
+                message = self._results.get_nowait()
+            except (queue.Empty, OSError, ValueError):
+                break
+            self._handle(message)
+        if self._process is None:
+            return
+        if not self._process.is_alive() or (
+            not self._ready and time.monotonic() - self._started_at > self.start_timeout
+        ):
+            self._handle_crash()
+
+    def _handle(self, message: tuple) -> None:
+        if message[0] == READY:
+            self._ready = True
+            return
+        if message[0] == MODEL:
+            _, complexity, loaded = message
+            if loaded:
+                self._loaded_complexity = complexity
+            elif complexity == self.model_complexity:
+                self.model_complexity = self._loaded_complexity
+            return
+        slot, frame_id, timestamp, left, right, processed = message
+        scale = self._pending.pop(slot, 1.0)
+        if not processed:
+            self.dropped += 1
+            return
+        if scale < 1.0:
+            left = unscale_position(left, scale)
+            right = unscale_position(right, scale)
+        self._last_positions = HandPositions(
+            left=left, right=right, frame_id=frame_id, timestamp=timestamp
+        )
+        self.completed += 1
+
+    def _handle_crash(self) -> None:
+        self._stop_worker()
+        if self.restarts >= self.max_restarts:
+            self.failed = True
+            return
+        self.restarts += 1
+        self._start_worker()
+
+    def _allocate_ring(self, slot_bytes: int) -> None:
+        self._slot_bytes = slot_bytes
+        self._shm = SharedMemory(create=True, size=slot_bytes * self.slots)
+        self._ring = np.ndarray((self.slots, slot_bytes), dtype=np.uint8, buffer=self._shm.buf)
+
+    def _release_ring(self) -> None:
+        if self._shm is None:
+            return
+        self._ring = None
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+        self._slot_bytes = 0
+
+    def _start_worker(self) -> bool:
+        if self._shm is None:
+            return False
+        self._requests = self._context.Queue()
+        self._results = self._context.Queue()
+        self._pending.clear()
+        self._ready = False
+        self._loaded_complexity = self.model_complexity
+        self._process = self._context.Process(
+            target=_worker_main,
+            args=(
+                self._shm.name,
+                self._slot_bytes,
+                self.slots,
+                self._requests,
+                self._results,
+                self.model_complexity,
+            ),
+            name="air-hockey-pose",
+            daemon=True,
+        )
+        self._process.start()
+        self._started_at = time.monotonic()
+        return True
+
+    def _stop_worker(self) -> None:
+        process = self._process
+        if process is None:
+            return
+        if process.is_alive():
+            try:
+                self._requests.put(None)
+            except (OSError, ValueError):
+                pass
+            process.join(timeout=2.0)
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=1.0)
+        for channel in (self._requests, self._results):
+            channel.close()
+            channel.cancel_join_thread()
+        self._process = None
+        self._requests = None
+        self._results = None
+        self._pending.clear()
+        self._ready = False
+
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        """Block until the worker has loaded the model (used by tests and warm-up).
+
+        Results and model reports that arrive first are handled as `detect` would.
+        """
+        if self._results is None:
+            return False
+        deadline = time.monotonic() + (self.start_timeout if timeout is None else timeout)
+        while not self._ready:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                message = self._results.get(timeout=remaining)
+            except (queue.Empty, OSError, ValueError):
+                return False
+            self._handle(message)
+        return True
@@ -0,0 +1,170 @@
+"""Camera preview window drawn by its own thread from a single-slot mailbox."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from typing import Optional
+
+import cv2
+import numpy as np
+
+WINDOW_TITLE = "Air Hockey Camera"
+
+Marker = tuple[tuple[int, int], tuple[int, int, int]]
+
+
+class PreviewWindow:
+    """OpenCV HighGUI window that never blocks the game loop.
+
+    `post` copies the annotated frame into a spare buffer and swaps it into a
+    one-frame mailbox; a frame still waiting there is replaced and counted in
+    `dropped`. The display thread takes the newest frame at most `max_fps` times
+    per second, draws the markers and pumps HighGUI events. All HighGUI calls
+    (create, show, destroy) happen on that thread. If the OpenCV build has no GUI
+    support the window marks itself `failed` and `post` becomes a no-op.
+
+    Cocoa only allows UI calls from the main thread, so on macOS (`threaded`
+    False) `post` draws and shows the frame itself, still limited to `max_fps`.
+    """
+
+    def __init__(
+        self, title: str = WINDOW_TITLE, max_fps: float = 30.0, threaded: Optional[bool] = None
+    ) -> None:
+        self.title = title
+        self.max_fps = max_fps
+        self.threaded = sys.platform != "darwin" if threaded is None else threaded
+        self._opened = False
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._mail: Optional[np.ndarray] = None
+        self._markers: tuple[Marker, ...] = ()
+        self._spare: Optional[np.ndarray] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._last_post = 0.0
+        self.shown = 0
+        self.dropped = 0
+        self.failed = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        if self._running or self.failed:
+            return
+        self._running = True
+        if not self.threaded:
+            return
+        self._thread = threading.Thread(target=self._run, name="air-hockey-preview", daemon=True)
+        self._thread.start()
+
+    def post(self, frame_bgr: np.ndarray, markers: tuple[Marker, ...] = ()) -> None:
+        """Queue `frame_bgr` (copied) with circle markers; never waits for the display.
+
+        Frames posted faster than `max_fps` are skipped before the copy.
+        """
+        if not self._running:
+            return
+        now = time.perf_counter()
+        if self.max_fps > 0 and now - self._last_post < 1.0 / self.max_fps:
+            return
+        self._last_post = now
+        if not self.threaded:
+            self._show_inline(frame_bgr, markers)
+            return
+        with self._lock:
+            buffer, self._spare = self._spare, None
+        if buffer is None or buffer.shape != frame_bgr.shape:
+            buffer = np.empty_like(frame_bgr)
+        np.copyto(buffer, frame_bgr)
+        with self._wake:
+            if self._mail is not None:
+                self.dropped += 1
+                self._spare = self._mail
+            self._mail = buffer
+            self._markers = markers
+            self._wake.notify()
+
+    def close(self) -> None:
+        self._running = False
+        with self._wake:
+            self._wake.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self._thread = None
+        with self._lock:
+            self._mail = None
+        if self._opened:
+            self._opened = False
+            try:
+                self._destroy()
+            except cv2.error:
+                pass
+
+    def _show(self, image: np.ndarray) -> None:
+        cv2.imshow(self.title, image)
+        cv2.waitKey(1)
+
+    def _pump(self) -> None:
+        cv2.waitKey(1)
+
+    def _destroy(self) -> None:
+        cv2.destroyWindow(self.title)
+
+    def _show_inline(self, frame_bgr: np.ndarray, markers: tuple[Marker, ...]) -> None:
+        if self._spare is None or self._spare.shape != frame_bgr.shape:
+            self._spare = np.empty_like(frame_bgr)
+        np.copyto(self._spare, frame_bgr)
+        _draw_markers(self._spare, markers)
+        try:
+            self._show(self._spare)
+        except cv2.error:
+            self.failed = True
+            self._running = False
+            return
+        self._opened = True
+        self.shown += 1
+
+    def _run(self) -> None:
+        interval = 1.0 / self.max_fps if self.max_fps > 0 else 0.0
+        opened = False
+        try:
+            while self._running:
+                with self._wake:
+                    self._wake.wait_for(
+                        lambda: self._mail is not None or not self._running, timeout=0.1
+                    )
+                    image, self._mail = self._mail, None
+                    markers = self._markers
+                if image is None:
+                    if opened:
+                        self._pump()
+                    continue
+                shown_at = time.perf_counter()
+                _draw_markers(image, markers)
+                self._show(image)
+                opened = True
+                self.shown += 1
+                with self._lock:
+                    if self._spare is None:
+                        self._spare = image
+                delay = shown_at + interval - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+        except cv2.error:
+            self.failed = True
+            self._running = False
+        finally:
+            if opened:
+                try:
+                    self._destroy()
+                except cv2.error:
+                    pass
+
+
+def _draw_markers(image: np.ndarray, markers: tuple[Marker, ...]) -> None:
+    for center, color in markers:
+        cv2.circle(image, center, 8, color, 2)
@@ -0,0 +1,174 @@
+"""Runtime vision quality governor that holds a target frame rate."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+SCALE_STEP = 0.25
+# Rough inference cost of one model complexity step (MediaPipe Pose 0 -> 1 -> 2).
+COMPLEXITY_COST = 2.0
+EWMA_ALPHA = 0.1
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    scale: float
+    process_every: int
+    model_complexity: int
+
+    def label(self) -> str:
+        return f"scale {self.scale:.2f}  every {self.process_every}  model {self.model_complexity}"
+
+
+def build_levels(
+    min_scale: float = 0.5,
+    max_scale: float = 1.0,
+    max_process_every: int = 3,
+    min_complexity: int = 1,
+    max_complexity: int = 1,
+) -> list[QualityLevel]:
+    """Quality ladder from best (index 0) to cheapest.
+
+    Detection scale drops first because it costs the least accuracy per
+    millisecond saved, then the model gets lighter, then inference runs on fewer
+    frames, which adds the most latency.
+    """
+    max_complexity = max(min_complexity, max_complexity)
+    scales = []
+    scale = max_scale
+    while scale > min_scale + 1e-6:
+        scales.append(round(scale, 2))
+        scale -= SCALE_STEP
+    scales.append(round(min(min_scale, max_scale), 2))
+    levels = [QualityLevel(scale, 1, max_complexity) for scale in scales]
+    for complexity in range(max_complexity - 1, min_complexity - 1, -1):
+        levels.append(QualityLevel(scales[-1], 1, complexity))
+    for every in range(2, max(1, max_process_every) + 1):
+        levels.append(QualityLevel(scales[-1], every, min_complexity))
+    return levels
+
+
+def nearest_level(levels: list[QualityLevel], scale: float, process_every: int) -> int:
+    """Index of the level closest to a static `scale` / `process_every` setting."""
+    return min(
+        range(len(levels)),
+        key=lambda index: (
+            abs(levels[index].process_every - process_every),
+            abs(levels[index].scale - scale),
+            index,
+        ),
+    )
+
+
+def _relative_cost(level: QualityLevel) -> float:
+    return (
+        level.scale * level.scale * COMPLEXITY_COST**level.model_complexity / level.process_every
+    )
+
+
+class QualityGovernor:
+    """Steps through `levels` to keep the busy time per frame inside the frame budget.
+
+    Feed it the measured work time of every frame (update, render and flip,
+    without the frame limiter's sleep) and the amortised inference time of that
+    frame. It steps down one level when smoothed work time exceeds the budget by
+    `down_margin` for `down_frames` frames, and steps up only when the frame has
+    `up_margin` headroom and the next level's predicted extra inference still
+    fits. After every change it holds for `hold_frames`. A step down that follows
+    an upgrade within `up_frames` doubles the wait before that upgrade is tried
+    again (up to `max_backoff` times the base), so an unsustainable level is not
+    retried every few seconds.
+    """
+
+    def __init__(
+        self,
+        levels: list[QualityLevel],
+        target_fps: float = 60.0,
+        start_index: int = 0,
+        down_margin: float = 0.1,
+        up_margin: float = 0.25,
+        down_frames: int = 30,
+        up_frames: int = 180,
+        hold_frames: int = 60,
+        max_backoff: int = 8,
+    ) -> None:
+        self.levels = levels
+        self.budget = 1.0 / max(1.0, target_fps)
+        self.index = max(0, min(start_index, len(levels) - 1))
+        self.down_margin = down_margin
+        self.up_margin = up_margin
+        self.down_frames = down_frames
+        self.up_frames = up_frames
+        self.hold_frames = hold_frames
+        self.max_backoff = max_backoff
+        self.frame_time = 0.0
+        self.inference_time = 0.0
+        self.changes = 0
+        self._samples = 0
+        self._over = 0
+        self._under = 0
+        self._hold = 0
+        self._backoff = 1
+        self._since_upgrade: Optional[int] = None
+
+    @property
+    def level(self) -> QualityLevel:
+        return self.levels[self.index]
+
+    def label(self) -> str:
+        return f"Quality {self.index + 1}/{len(self.levels)}  {self.level.label()}"
+
+    def observe(self, frame_time: float, inference_time: float = 0.0) -> Optional[QualityLevel]:
+        """Record one frame; return the new level when the governor changes it."""
+        if self._samples == 0:
+            self.frame_time = frame_time
+            self.inference_time = inference_time
+        else:
+            self.frame_time += EWMA_ALPHA * (frame_time - self.frame_time)
+            self.inference_time += EWMA_ALPHA * (inference_time - self.inference_time)
+        self._samples += 1
+        if self._since_upgrade is not None:
+            self._since_upgrade += 1
+            if self._since_upgrade > self.up_frames:
+                self._since_upgrade = None
+                self._backoff = 1
+        if self._hold > 0:
+            self._hold -= 1
+            return None
+
+        if self.frame_time > self.budget * (1.0 + self.down_margin):
+            self._over += 1
+            self._under = 0
+        elif self._fits_upgrade():
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = 0
+            self._under = 0
+
+        if self._over >= self.down_frames and self.index < len(self.levels) - 1:
+            if self._since_upgrade is not None:
+                self._backoff = min(self._backoff * 2, self.max_backoff)
+                self._since_upgrade = None
+            return self._change(self.index + 1)
+        if self._under >= self.up_frames * self._backoff and self.index > 0:
+            self._since_upgrade = 0
+            return self._change(self.index - 1)
+        return None
+
+    def _fits_upgrade(self) -> bool:
+        if self.index == 0:
+            return False
+        current = _relative_cost(self.level)
+        upgraded = _relative_cost(self.levels[self.index - 1])
+        extra = self.inference_time * (upgraded / current - 1.0) if current > 0 else 0.0
+        return self.frame_time + extra < self.budget * (1.0 - self.up_margin)
+
+    def _change(self, index: int) -> QualityLevel:
+        self.index = index
+        self.changes += 1
+        self._over = 0
+        self._under = 0
+        self._hold = self.hold_frames
+        return self.level
@@ -0,0 +1,120 @@
+"""Velocity-padded regions of interest that confine detection to where a target was."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+# x0, y0, x1, y1 in frame pixels, end-exclusive.
+Box = tuple[int, int, int, int]
+
+DEFAULT_PADDING = 0.1
+DEFAULT_VELOCITY_GAIN = 2.0
+DEFAULT_MAX_MISSES = 5
+# A region covering more of the frame than this is searched as the full frame.
+FULL_FRAME_FRACTION = 0.75
+VELOCITY_ALPHA = 0.5
+
+
+def point_box(point: Optional[tuple[int, int]], radius: float = 0.0) -> Optional[Box]:
+    if point is None:
+        return None
+    r = int(round(radius))
+    return (point[0] - r, point[1] - r, point[0] + r + 1, point[1] + r + 1)
+
+
+def crop(frame: np.ndarray, region: Optional[Box]) -> np.ndarray:
+    """View of `frame` inside `region`; the whole frame for None."""
+    if region is None:
+        return frame
+    x0, y0, x1, y1 = region
+    return frame[y0:y1, x0:x1]
+
+
+def to_frame(
+    point: Optional[tuple[int, int]], region: Optional[Box]
+) -> Optional[tuple[int, int]]:
+    """Map a point found inside `region` back to frame pixels."""
+    if point is None or region is None:
+        return point
+    return (point[0] + region[0], point[1] + region[1])
+
+
+class RoiTracker:
+    """Search region around one target, sized by how fast the target moves.
+
+    After every detection call `update` with the target's box in frame pixels,
+    or None for a miss. `region` then returns the last box moved by the
+    smoothed per-update velocity and padded by `padding` times the frame width
+    plus `velocity_gain` times the speed on each axis. Each consecutive miss
+    widens the region by one more velocity step. After `max_misses` misses in a
+    row, or when the padded region would cover most of the frame anyway,
+    `region` returns None and the caller searches the full frame until the
+    target is found again.
+    """
+
+    def __init__(
+        self,
+        padding: float = DEFAULT_PADDING,
+        velocity_gain: float = DEFAULT_VELOCITY_GAIN,
+        max_misses: int = DEFAULT_MAX_MISSES,
+    ) -> None:
+        self.padding = padding
+        self.velocity_gain = velocity_gain
+        self.max_misses = max(1, max_misses)
+        self.misses = 0
+        self.roi_searches = 0
+        self.full_searches = 0
+        self._box: Optional[Box] = None
+        self._velocity = (0.0, 0.0)
+
+    @property
+    def locked(self) -> bool:
+        return self._box is not None and self.misses < self.max_misses
+
+    def region(self, frame_size: tuple[int, int]) -> Optional[Box]:
+        """Box to search in the next frame, or None for the full frame."""
+        width, height = frame_size
+        if not self.locked:
+            self.full_searches += 1
+            return None
+        x0, y0, x1, y1 = self._box
+        steps = 1 + self.misses
+        vx, vy = self._velocity
+        pad_x = self.padding * width + self.velocity_gain * abs(vx) * steps
+        pad_y = self.padding * width + self.velocity_gain * abs(vy) * steps
+        region = (
+            max(0, int(x0 + vx * steps - pad_x)),
+            max(0, int(y0 + vy * steps - pad_y)),
+            min(width, int(x1 + vx * steps + pad_x) + 1),
+            min(height, int(y1 + vy * steps + pad_y) + 1),
+        )
+        area = max(0, region[2] - region[0]) * max(0, region[3] - region[1])
+        if area == 0 or area >= FULL_FRAME_FRACTION * width * height:
+            self.full_searches += 1
+            return None
+        self.roi_searches += 1
+        return region
+
+    def update(self, box: Optional[Box]) -> None:
+        if box is None:
+            self.misses += 1
+            if self.misses >= self.max_misses:
+                self._velocity = (0.0, 0.0)
+            return
+        if self._box is not None and self.misses < self.max_misses:
+            dx = (box[0] + box[2] - self._box[0] - self._box[2]) / 2.0 / (1 + self.misses)
+            dy = (box[1] + box[3] - self._box[1] - self._box[3]) / 2.0 / (1 + self.misses)
+            vx, vy = self._velocity
+            self._velocity = (
+                vx + VELOCITY_ALPHA * (dx - vx),
+                vy + VELOCITY_ALPHA * (dy - vy),
+            )
+        self._box = box
+        self.misses = 0
+
+    def reset(self) -> None:
+        self._box = None
+        self._velocity = (0.0, 0.0)
+        self.misses = 0
@@ -0,0 +1,74 @@
+"""Fixed-step accumulator with a per-frame catch-up cap."""
+
+from __future__ import annotations
+
+import math
+from enum import Enum
+
+
+class OverrunPolicy(str, Enum):
+    DROP = "drop"
+    SLOW_MOTION = "slow_motion"
+
+
+class FixedStepClock:
+    """Converts variable frame times into a bounded number of fixed simulation steps.
+
+    At most `max_catchup_steps` steps run per frame. Time beyond that is handled by
+    `policy`: `DROP` discards the backlog so the table resyncs with the wall clock,
+    `SLOW_MOTION` carries up to one more frame's worth of steps into the next frames
+    so short hitches are still simulated, only slower than real time. Discarded time
+    is accumulated in `dropped_time`.
+    """
+
+    def __init__(
+        self,
+        time_step: float,
+        max_catchup_steps: int = 4,
+        policy: OverrunPolicy = OverrunPolicy.DROP,
+    ) -> None:
+        self.time_step = time_step
+        self.max_catchup_steps = max(1, max_catchup_steps)
+        self.policy = policy
+        self.accumulator = 0.0
+        self.last_steps = 0
+        self.total_steps = 0
+        self.capped_frames = 0
+        self.dropped_time = 0.0
+
+    @property
+    def backlog(self) -> float:
+        """Simulation time still owed beyond the current partial step."""
+        return max(0.0, self.accumulator - self.time_step)
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a step left in the accumulator, for render interpolation."""
+        return min(self.accumulator / self.time_step, 1.0)
+
+    def advance(self, dt: float) -> int:
+        """Add a frame's elapsed time and return how many fixed steps to run now."""
+        time_step = self.time_step
+        self.accumulator += max(0.0, dt)
+        steps = int(self.accumulator / time_step)
+        if steps > self.max_catchup_steps:
+            steps = self.max_catchup_steps
+            self.capped_frames += 1
+        self.accumulator -= steps * time_step
+
+        if self.accumulator >= time_step:
+            if self.policy == OverrunPolicy.SLOW_MOTION:
+                keep = self.max_catchup_steps * time_step + math.fmod(self.accumulator, time_step)
+            else:
+                keep = math.fmod(self.accumulator, time_step)
+            if self.accumulator > keep:
+                self.dropped_time += self.accumulator - keep
+                self.accumulator = keep
+
+        self.last_steps = steps
+        self.total_steps += steps
+        return steps
+
+    def reset(self) -> None:
+        self.accumulator = 0.0
+        self.last_steps = 0
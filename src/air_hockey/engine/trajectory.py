@@ -0,0 +1,187 @@
+"""Closed-form puck trajectory prediction (no simulator ticks)."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Optional
+
+from air_hockey.game.field import FieldSpec
+
+Vec2 = tuple[float, float]
+
+MAX_BOUNCES = 16
+
+
+@dataclass(frozen=True)
+class TrajectorySegment:
+    start_time: float
+    end_time: float
+    start: Vec2
+    velocity: Vec2
+    end: Vec2
+
+
+@dataclass
+class TrajectoryPrediction:
+    """Piecewise path of the puck between wall contacts.
+
+    Within a segment the puck moves along `velocity` with exponential speed
+    decay, so its displacement after local time t is velocity * (1 - e^-kt) / k.
+    `goal` is "left" or "right" when the puck enters that goal within the horizon.
+    """
+
+    decay_rate: float
+    segments: list[TrajectorySegment] = field(default_factory=list)
+    goal: Optional[str] = None
+    goal_time: Optional[float] = None
+
+    @property
+    def end_time(self) -> float:
+        return self.segments[-1].end_time if self.segments else 0.0
+
+    def position_at(self, time: float) -> Vec2:
+        for segment in self.segments:
+            if time <= segment.end_time:
+                travel = _travel(self.decay_rate, max(0.0, time - segment.start_time))
+                return (
+                    segment.start[0] + segment.velocity[0] * travel,
+                    segment.start[1] + segment.velocity[1] * travel,
+                )
+        return self.segments[-1].end if self.segments else (0.0, 0.0)
+
+    def time_to_reach_x(self, x: float) -> Optional[float]:
+        for segment in self.segments:
+            vx = segment.velocity[0]
+            if vx == 0.0:
+                continue
+            travel = (x - segment.start[0]) / vx
+            if travel < 0.0:
+                continue
+            local = _time_for_travel(self.decay_rate, travel)
+            if local is None:
+                continue
+            time = segment.start_time + local
+            if time <= segment.end_time:
+                return time
+        return None
+
+
+def decay_rate(damping: float, time_step: float | None = None) -> float:
+    """Continuous decay rate matching `PhysicsWorld._apply_damping`.
+
+    With a `time_step`, the rate reproduces the per-tick factor (1 - damping * dt);
+    otherwise the damping coefficient is used directly.
+    """
+    if damping <= 0.0:
+        return 0.0
+    if time_step is None or time_step <= 0.0:
+        return damping
+    factor = 1.0 - damping * time_step
+    if factor <= 0.0:
+        return math.inf
+    return -math.log(factor) / time_step
+
+
+def predict_trajectory(
+    field_spec: FieldSpec,
+    position: Vec2,
+    velocity: Vec2,
+    radius: float,
+    restitution: float,
+    damping: float,
+    horizon_s: float,
+    max_speed: float | None = None,
+    time_step: float | None = None,
+    max_bounces: int = MAX_BOUNCES,
+) -> TrajectoryPrediction:
+    k = decay_rate(damping, time_step)
+    prediction = TrajectoryPrediction(decay_rate=k)
+    restitution = max(0.0, min(1.0, restitution))
+    half_width = field_spec.width / 2.0
+    half_height = field_spec.height / 2.0
+    goal_half = field_spec.goal_height / 2.0
+    x_limit = half_width - radius
+    y_limit = half_height - radius
+
+    px, py = position
+    vx, vy = velocity
+    speed_sq = vx * vx + vy * vy
+    if max_speed and max_speed > 0.0 and speed_sq > max_speed * max_speed:
+        scale = max_speed / math.sqrt(speed_sq)
+        vx *= scale
+        vy *= scale
+
+    time = 0.0
+    for _ in range(max_bounces + 1):
+        remaining = horizon_s - time
+        if remaining <= 0.0 or math.isinf(k):
+            break
+        travel_x = _travel_to_limit(px, vx, x_limit)
+        travel_y = _travel_to_limit(py, vy, y_limit)
+        travel = min(travel_x, travel_y)
+        local = _time_for_travel(k, travel) if math.isfinite(travel) else None
+
+        if local is None or local > remaining:
+            end_travel = _travel(k, remaining)
+            end = (px + vx * end_travel, py + vy * end_travel)
+            prediction.segments.append(
+                TrajectorySegment(time, horizon_s, (px, py), (vx, vy), end)
+            )
+            break
+
+        hit = (px + vx * travel, py + vy * travel)
+        if travel_x <= travel_y and abs(hit[1]) < goal_half:
+            goal_travel = (math.copysign(half_width, vx) - px) / vx
+            goal_local = _time_for_travel(k, goal_travel)
+            if goal_local is not None and goal_local <= remaining:
+                end = (px + vx * goal_travel, py + vy * goal_travel)
+                prediction.segments.append(
+                    TrajectorySegment(time, time + goal_local, (px, py), (vx, vy), end)
+                )
+                prediction.goal = "left" if vx < 0.0 else "right"
+                prediction.goal_time = time + goal_local
+                break
+            end_travel = _travel(k, remaining)
+            end = (px + vx * end_travel, py + vy * end_travel)
+            prediction.segments.append(
+                TrajectorySegment(time, horizon_s, (px, py), (vx, vy), end)
+            )
+            break
+
+        prediction.segments.append(TrajectorySegment(time, time + local, (px, py), (vx, vy), hit))
+        decay = math.exp(-k * local)
+        vx *= decay
+        vy *= decay
+        if travel_x <= travel_y:
+            vx = -vx
+        if travel_y <= travel_x:
+            vy = -vy
+        vx *= restitution
+        vy *= restitution
+        px, py = hit
+        time += local
+    return prediction
+
+
+def _travel(k: float, time: float) -> float:
+    if k <= 0.0:
+        return time
+    return -math.expm1(-k * time) / k
+
+
+def _time_for_travel(k: float, travel: float) -> Optional[float]:
+    if k <= 0.0:
+        return travel
+    fraction = k * travel
+    if fraction >= 1.0:
+        return None
+    return -math.log1p(-fraction) / k
+
+
+def _travel_to_limit(position: float, velocity: float, limit: float) -> float:
+    if velocity > 0.0:
+        return max(0.0, limit - position) / velocity
+    if velocity < 0.0:
+        return max(0.0, position + limit) / -velocity
+    return math.inf
@@ -0,0 +1,158 @@
+"""Two-player wrist tracking with one Pose graph per half of the frame."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from air_hockey.engine.hand_tracking import (
+    HandPositions,
+    HandTracker,
+    PoseLoader,
+    mp,
+    scaled_size,
+    unscale_position,
+)
+from air_hockey.engine.optical_flow import WristFlow
+
+# Fraction of the frame width each half extends past the centre line, so a
+# player leaning over the middle is still seen whole by their own graph.
+DEFAULT_OVERLAP = 0.1
+MIN_VISIBILITY = 0.5
+
+
+class TwoPlayerTracker:
+    """Drop-in `HandTracker` replacement that follows one wrist of each of two players.
+
+    The mirrored frame is split into an overlapping left and right crop and both
+    run through their own MediaPipe Pose graph concurrently on a two-thread pool
+    (MediaPipe releases the GIL during inference), so a detect costs roughly one
+    half-frame inference rather than two full ones.
+
+    Each player's controlling wrist is the one they used last time, as long as it
+    stays visible; otherwise the more visible wrist takes over. Identity is then
+    kept across frames by matching the two wrists to the previous left/right
+    positions with the cheaper of the two possible assignments, so players near
+    the centre line do not swap mallets when both crops see both of them.
+    """
+
+    def __init__(
+        self,
+        process_every: int = 1,
+        model_complexity: int = 1,
+        overlap: float = DEFAULT_OVERLAP,
+        flow: bool = False,
+    ) -> None:
+        if mp is None or not hasattr(mp, "solutions"):
+            raise RuntimeError(
+                "mediapipe with the solutions API is required for two-player tracking."
+            )
+        self.process_every = max(1, process_every)
+        self.overlap = overlap
+        self._frame_index = 0
+        self._last_positions = HandPositions(left=None, right=None)
+        self._poses = [HandTracker._create_pose(model_complexity) for _ in range(2)]
+        self._wrist_choice: list[Optional[int]] = [None, None]
+        self._flow = WristFlow() if flow else None
+        self.model_complexity = model_complexity
+        self._loader = PoseLoader(HandTracker._create_pose, count=2)
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="air-hockey-pose")
+
+    def set_model_complexity(self, model_complexity: int) -> bool:
+        """Build both Pose graphs for another complexity in the background, as `HandTracker`."""
+        if model_complexity == self.model_complexity:
+            self._loader.cancel()
+            return True
+        return self._loader.request(model_complexity)
+
+    def detect(
+        self,
+        frame_bgr: np.ndarray,
+        scale: float = 1.0,
+        frame_id: int = -1,
+        timestamp: float = 0.0,
+    ) -> HandPositions:
+        self._swap_loaded_poses()
+        self._frame_index += 1
+        if self._frame_index % self.process_every != 0:
+            if self._flow is None:
+                return self._last_positions
+            left, right = self._flow.track(frame_bgr)
+            return HandPositions(left=left, right=right, frame_id=frame_id, timestamp=timestamp)
+        frame = frame_bgr
+        if scale < 1.0:
+            new_size = scaled_size(frame_bgr.shape[1], frame_bgr.shape[0], scale)
+            frame = cv2.resize(frame_bgr, new_size, interpolation=cv2.INTER_AREA)
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        width = rgb.shape[1]
+        margin = int(width * self.overlap)
+        crops = ((0, width // 2 + margin), (width // 2 - margin, width))
+        futures = [
+            self._pool.submit(self._detect_half, player, rgb, start, end)
+            for player, (start, end) in enumerate(crops)
+        ]
+        left, right = self._assign([future.result() for future in futures])
+        if scale < 1.0:
+            left = unscale_position(left, scale)
+            right = unscale_position(right, scale)
+        if self._flow is not None:
+            self._flow.anchor(frame_bgr, left, right)
+        self._last_positions = HandPositions(
+            left=left, right=right, frame_id=frame_id, timestamp=timestamp
+        )
+        return self._last_positions
+
+    def close(self) -> None:
+        self._loader.close()
+        self._pool.shutdown(wait=True)
+        for pose in self._poses:
+            pose.close()
+
+    def _swap_loaded_poses(self) -> None:
+        loaded = self._loader.take()
+        if loaded is None:
+            return
+        for pose in self._poses:
+            pose.close()
+        self.model_complexity, self._poses = loaded
+        self._wrist_choice = [None, None]
+
+    def _detect_half(
+        self, player: int, rgb: np.ndarray, start: int, end: int
+    ) -> Optional[tuple[int, int]]:
+        crop = np.ascontiguousarray(rgb[:, start:end])
+        results = self._poses[player].process(crop)
+        if not results.pose_landmarks:
+            return None
+        points = results.pose_landmarks.landmark
+        pose_landmark = mp.solutions.pose.PoseLandmark
+        wrists = (pose_landmark.LEFT_WRIST, pose_landmark.RIGHT_WRIST)
+        choice = self._wrist_choice[player]
+        if choice is None or points[choice].visibility < MIN_VISIBILITY:
+            choice = max(wrists, key=lambda index: points[index].visibility)
+        landmark = points[choice]
+        if landmark.visibility < MIN_VISIBILITY:
+            return None
+        self._wrist_choice[player] = choice
+        return (start + int(landmark.x * (end - start)), int(landmark.y * rgb.shape[0]))
+
+    def _assign(
+        self, found: list[Optional[tuple[int, int]]]
+    ) -> tuple[Optional[tuple[int, int]], Optional[tuple[int, int]]]:
+        left, right = found
+        previous = (self._last_positions.left, self._last_positions.right)
+        if None in (left, right) or None in previous:
+            return left, right
+        keep = _distance2(left, previous[0]) + _distance2(right, previous[1])
+        swap = _distance2(left, previous[1]) + _distance2(right, previous[0])
+        if swap < keep:
+            self._wrist_choice.reverse()
+            return right, left
+        return left, right
+
+
+def _distance2(a: tuple[int, int], b: tuple[int, int]) -> int:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2
@@ -8,6 +8,8 @@ from typing import Optional
 import cv2
 import numpy as np
 
+from air_hockey.engine.roi import Box, RoiTracker, crop, point_box, to_frame
+
 
 @dataclass(frozen=True)
 class HsvRange:
@@ -38,11 +40,12 @@ def resolve_hsv_range(
 
 
 def detect_largest_ball(
-    frame: np.ndarray, hsv_range: HsvRange, min_area: float = 0.0
+    frame: np.ndarray, hsv_range: HsvRange, min_area: float = 0.0, roi: Optional[Box] = None
 ) -> DetectionResult:
-    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+    """Largest blob in `hsv_range`, searched only inside `roi` when one is given."""
+    hsv = cv2.cvtColor(crop(frame, roi), cv2.COLOR_BGR2HSV)
     mask = cv2.inRange(hsv, np.array(hsv_range.lower), np.array(hsv_range.upper))
-    return _detect_from_mask(mask, min_area=min_area)
+    return _in_frame(_detect_from_mask(mask, min_area=min_area), roi)
 
 
 def detect_largest_ball_masked(
@@ -50,11 +53,19 @@ def detect_largest_ball_masked(
     hsv_range: HsvRange,
     motion_mask: np.ndarray,
     min_area: float = 0.0,
+    roi: Optional[Box] = None,
 ) -> DetectionResult:
-    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+    """`detect_largest_ball` on moving pixels; `motion_mask` covers the full frame."""
+    hsv = cv2.cvtColor(crop(frame, roi), cv2.COLOR_BGR2HSV)
     color_mask = cv2.inRange(hsv, np.array(hsv_range.lower), np.array(hsv_range.upper))
-    combined = cv2.bitwise_and(color_mask, motion_mask)
-    return _detect_from_mask(combined, min_area=min_area)
+    combined = cv2.bitwise_and(color_mask, crop(motion_mask, roi))
+    return _in_frame(_detect_from_mask(combined, min_area=min_area), roi)
+
+
+def _in_frame(result: DetectionResult, roi: Optional[Box]) -> DetectionResult:
+    if roi is None or result.center is None:
+        return result
+    return DetectionResult(center=to_frame(result.center, roi), contour_area=result.contour_area)
 
 
 def _detect_from_mask(mask: np.ndarray, min_area: float = 0.0) -> DetectionResult:
@@ -89,3 +100,39 @@ class MotionMasker:
         mask = self.subtractor.apply(frame)
         _, mask = cv2.threshold(mask, 200, 255, cv2.THRESH_BINARY)
         return mask
+
+
+class BallTracker:
+    """Ball detection that searches a `RoiTracker` region once the ball is found.
+
+    With a `masker` the motion-masked detector is used. The background model
+    still sees every pixel of every frame, since it would otherwise learn
+    only the region, but the color conversion, masking, morphology and
+    contour search all run on the region alone.
+    """
+
+    def __init__(
+        self,
+        hsv_range: HsvRange,
+        min_area: float = 0.0,
+        masker: Optional[MotionMasker] = None,
+        roi: Optional[RoiTracker] = None,
+    ) -> None:
+        self.hsv_range = hsv_range
+        self.min_area = min_area
+        self.masker = masker
+        self.roi = roi
+
+    def detect(self, frame: np.ndarray) -> DetectionResult:
+        region = self.roi.region((frame.shape[1], frame.shape[0])) if self.roi else None
+        if self.masker is not None:
+            mask = self.masker.apply(frame)
+            result = detect_largest_ball_masked(
+                frame, self.hsv_range, mask, min_area=self.min_area, roi=region
+            )
+        else:
+            result = detect_largest_ball(frame, self.hsv_range, min_area=self.min_area, roi=region)
+        if self.roi is not None:
+            radius = (result.contour_area / np.pi) ** 0.5
+            self.roi.update(point_box(result.center, radius))
+        return result
@@ -0,0 +1,170 @@
+"""CPU opponent that plans puck intercepts within a per-tick time budget."""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable
+
+from air_hockey.engine.physics import PhysicsWorld
+from air_hockey.game.entities import MalletSpec
+from air_hockey.game.field import FieldSpec, clamp_mallet_position
+
+
+class Difficulty(str, Enum):
+    EASY = "easy"
+    MEDIUM = "medium"
+    HARD = "hard"
+
+
+@dataclass(frozen=True)
+class DifficultyProfile:
+    replan_ticks: int
+    speed_factor: float
+    aim_error: float
+    horizon_s: float
+    max_bounces: int
+
+
+DIFFICULTY_PROFILES: dict[Difficulty, DifficultyProfile] = {
+    Difficulty.EASY: DifficultyProfile(
+        replan_ticks=12, speed_factor=0.55, aim_error=0.08, horizon_s=1.0, max_bounces=1
+    ),
+    Difficulty.MEDIUM: DifficultyProfile(
+        replan_ticks=6, speed_factor=0.8, aim_error=0.04, horizon_s=1.5, max_bounces=2
+    ),
+    Difficulty.HARD: DifficultyProfile(
+        replan_ticks=2, speed_factor=1.0, aim_error=0.01, horizon_s=2.0, max_bounces=4
+    ),
+}
+
+DEFAULT_BUDGET_US = 50.0
+# Trajectory segments (one more than wall bounces) a single plan may predict. A segment
+# costs a few microseconds, so a plan at the quota stays well inside the default budget.
+DEFAULT_SEGMENT_QUOTA = 5
+
+
+class AiController:
+    """Drives one mallet from puck state in `PhysicsWorld.entities`.
+
+    Each tick costs one bounded move toward the current target. Planning
+    (trajectory prediction + target choice) runs every `replan_ticks` ticks and
+    predicts at most `segment_quota` trajectory segments, so the work of a tick
+    is bounded regardless of the clock; plans whose prediction stopped at the
+    quota are counted in `truncated`. Tick cost is measured with `clock`, the
+    thread CPU time by default, so preemption by other threads and processes
+    is not charged to the controller. If a plan still overruns `budget_us`, the
+    overrun is paid back by skipping plans on the following ticks.
+    `budget_us=None` disables that accounting, making the controller
+    deterministic.
+    """
+
+    def __init__(
+        self,
+        field: FieldSpec,
+        left: bool,
+        difficulty: Difficulty = Difficulty.MEDIUM,
+        mallet_speed: float = 2.0,
+        budget_us: float | None = DEFAULT_BUDGET_US,
+        seed: int | None = None,
+        segment_quota: int = DEFAULT_SEGMENT_QUOTA,
+        clock: Callable[[], int] = time.thread_time_ns,
+    ) -> None:
+        self.field = field
+        self.left = left
+        self.difficulty = difficulty
+        self.profile = DIFFICULTY_PROFILES[difficulty]
+        self.mallet_speed = mallet_speed
+        self.mallet_radius = MalletSpec().radius
+        self.budget_ns = int(budget_us * 1000) if budget_us is not None else None
+        self.segment_quota = max(1, segment_quota)
+        self._clock = clock
+        self._rng = random.Random(seed)
+        self._side = -1.0 if left else 1.0
+        half_width = field.width / 2.0
+        self._home = (self._side * half_width * 0.75, 0.0)
+        self._defense_x = self._side * half_width * 0.6
+        self._target = self._home
+        self._ticks_until_plan = 0
+        self._debt_ns = 0
+        self.last_tick_ns = 0
+        self.max_tick_ns = 0
+        self.plan_count = 0
+        self.overruns = 0
+        self.truncated = 0
+
+    def reset(self) -> None:
+        self._target = self._home
+        self._ticks_until_plan = 0
+        self._debt_ns = 0
+
+    def update(self, world: PhysicsWorld, time_step: float) -> tuple[float, float]:
+        start = self._clock()
+        mallet = world.entities.mallet_left if self.left else world.entities.mallet_right
+        self._ticks_until_plan -= 1
+        if self._ticks_until_plan <= 0:
+            if self._debt_ns > 0:
+                self._debt_ns -= self.budget_ns
+            else:
+                self._plan(world, mallet.position)
+                self._ticks_until_plan = self.profile.replan_ticks
+                cost = self._clock() - start
+                if self.budget_ns is not None and cost > self.budget_ns:
+                    self.overruns += 1
+                    self._debt_ns = cost - self.budget_ns
+        position = self._move_toward(mallet.position, time_step)
+        self.last_tick_ns = self._clock() - start
+        if self.last_tick_ns > self.max_tick_ns:
+            self.max_tick_ns = self.last_tick_ns
+        return position
+
+    def _plan(self, world: PhysicsWorld, mallet_pos: tuple[float, float]) -> None:
+        self.plan_count += 1
+        puck = world.entities.puck
+        side = self._side
+        heading_home = puck.vx * side > 0.0
+        in_own_half = puck.x * side > 0.0
+        target = self._home
+
+        if heading_home and abs(puck.vx) > 0.2:
+            segments = min(self.profile.max_bounces + 1, self.segment_quota)
+            prediction = world.predict_trajectory(self.profile.horizon_s, max_bounces=segments - 1)
+            if (
+                len(prediction.segments) == self.segment_quota
+                and prediction.goal is None
+                and prediction.end_time < self.profile.horizon_s
+            ):
+                self.truncated += 1
+            intercept_time = prediction.time_to_reach_x(self._defense_x)
+            if intercept_time is not None:
+                intercept = prediction.position_at(intercept_time)
+                target = (self._defense_x, intercept[1])
+            elif prediction.goal is not None:
+                target = (self._home[0], prediction.position_at(prediction.end_time)[1])
+        elif in_own_half:
+            behind = (puck.x - mallet_pos[0]) * side < 0.0
+            if behind:
+                target = (puck.x, puck.y)
+            else:
+                target = (puck.x + side * (puck.radius + self.mallet_radius) * 1.5, puck.y)
+        else:
+            target = (self._home[0], puck.y * 0.5)
+
+        if self.profile.aim_error > 0.0:
+            target = (target[0], target[1] + self._rng.uniform(-1.0, 1.0) * self.profile.aim_error)
+        self._target = clamp_mallet_position(self.field, self.mallet_radius, target, self.left)
+
+    def _move_toward(self, current: tuple[float, float], time_step: float) -> tuple[float, float]:
+        dx = self._target[0] - current[0]
+        dy = self._target[1] - current[1]
+        max_step = self.mallet_speed * self.profile.speed_factor * time_step
+        distance_sq = dx * dx + dy * dy
+        if distance_sq > max_step * max_step:
+            scale = max_step / distance_sq ** 0.5
+            dx *= scale
+            dy *= scale
+        return clamp_mallet_position(
+            self.field, self.mallet_radius, (current[0] + dx, current[1] + dy), self.left
+        )
@@ -11,3 +11,26 @@ class FieldSpec:
     height: float = 1.0
     wall_thickness: float = 0.05
     goal_height: float = 0.35
+
+
+def clamp_mallet_position(
+    field: FieldSpec, radius: float, position: tuple[float, float], left: bool
+) -> tuple[float, float]:
+    x, y = position
+    half_width = field.width / 2.0
+    half_height = field.height / 2.0
+
+    if left:
+        x_min = -half_width + radius
+        x_max = -radius
+    else:
+        x_min = radius
+        x_max = half_width - radius
+
+    y_min = -half_height + radius
+    y_max = half_height - radius
+
+    x = max(x_min, min(x, x_max))
+    y = max(y_min, min(y, y_max))
+
+    return (x, y)
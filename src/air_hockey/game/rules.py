@@ -0,0 +1,51 @@
+"""Match rules: goal detection, scoring, serve and reset."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from air_hockey.engine.physics import PhysicsWorld
+from air_hockey.game.field import FieldSpec
+
+
+class MatchRules:
+    """Scoring and serve rules shared by Play and the headless simulator.
+
+    Traditional serve rule: the player who was scored on serves next from their side.
+    """
+
+    def __init__(self, field: FieldSpec, physics: PhysicsWorld, time_step: float) -> None:
+        self.field = field
+        self.physics = physics
+        self.time_step = time_step
+        self.score_left = 0
+        self.score_right = 0
+        self.serve_side = "left"
+
+    def check_goal(self) -> Optional[str]:
+        """Return the scoring side ("left"/"right") if the puck crossed a goal line."""
+        puck = self.physics.entities.puck
+        half_width = self.field.width / 2.0
+        if puck.x < -half_width:
+            self.score_right += 1
+            self.serve_side = "left"
+            return "right"
+        if puck.x > half_width:
+            self.score_left += 1
+            self.serve_side = "right"
+            return "left"
+        return None
+
+    def reset_positions(self, mallet_speed: float | None = None) -> None:
+        puck_x = -self.field.width * 0.25 if self.serve_side == "left" else self.field.width * 0.25
+        self.physics.entities.puck.position = (puck_x, 0.0)
+        self.physics.entities.puck.linearVelocity = (0.0, 0.0)
+        left_pos = (-self.field.width * 0.25, 0.0)
+        right_pos = (self.field.width * 0.25, 0.0)
+        self.physics.set_mallet_positions(
+            left_pos,
+            right_pos,
+            time_step=self.time_step,
+            teleport=False,
+            max_speed=mallet_speed,
+        )
@@ -1,9 +1,34 @@
 """Main entry point for the Air Hockey game."""
 
+import argparse
 import sys
 
 
-def main() -> int:
+def _frame_source(spec: str) -> str:
+    from air_hockey.engine.frame_sources import validate_frame_source
+
+    try:
+        return validate_frame_source(spec)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="air-hockey")
+    parser.add_argument(
+        "--source",
+        type=_frame_source,
+        default=None,
+        help=(
+            "Frame source overriding the frame_source setting: camera[:index], video:PATH, "
+            "video-fast:PATH, images:PATH or synthetic[:WxH@FPS[,skeleton]]"
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
     try:
         import pygame
     except ImportError as exc:
@@ -14,7 +39,7 @@ def main() -> int:
     pygame.init()
     from air_hockey.app import App
 
-    app = App(window_size=(960, 540))
+    app = App(window_size=(960, 540), frame_source=args.source)
     exit_code = app.run()
     pygame.quit()
     return exit_code
@@ -0,0 +1 @@
+"""Headless simulation (no display, camera or audio)."""
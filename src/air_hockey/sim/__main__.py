@@ -0,0 +1,74 @@
+"""Command line entry point: `python -m air_hockey.sim`."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from air_hockey.config.settings import Settings
+from air_hockey.sim.runner import SimulationConfig, run_match
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m air_hockey.sim",
+        description="Run headless air hockey matches as fast as the CPU allows.",
+    )
+    parser.add_argument("--duration", type=float, default=60.0, help="simulated seconds per match")
+    parser.add_argument("--matches", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    input_help = "idle | script[:period] | cpu[:easy|medium|hard]"
+    parser.add_argument("--left", default="cpu:medium", help=input_help)
+    parser.add_argument("--right", default="cpu:medium", help=input_help)
+    parser.add_argument("--max-goals", type=int, default=None)
+    parser.add_argument("--tick-rate", type=float, default=120.0)
+    parser.add_argument(
+        "--saved-settings",
+        action="store_true",
+        help="use physics values from the saved user settings instead of defaults",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="write results as JSON")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.saved_settings:
+        from air_hockey.config.io import load_settings
+
+        settings = load_settings()
+    else:
+        settings = Settings()
+    config = SimulationConfig.from_settings(
+        settings,
+        duration_s=args.duration,
+        time_step=1.0 / args.tick_rate,
+        max_goals=args.max_goals,
+    )
+
+    matches = []
+    for index in range(args.matches):
+        result = run_match(config, left=args.left, right=args.right, seed=args.seed + index)
+        matches.append(result.to_dict())
+        print(
+            f"match {index}: {result.score_left}-{result.score_right} "
+            f"ticks={result.ticks} rally={result.average_rally_hits:.1f} "
+            f"top_speed={result.top_speed:.2f} stalls={result.stalls} "
+            f"({result.ticks_per_second:,.0f} ticks/s)"
+        )
+
+    if args.output is not None:
+        payload = {
+            "config": vars(config),
+            "left": args.left,
+            "right": args.right,
+            "matches": matches,
+        }
+        args.output.write_text(json.dumps(payload, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+"""Headless match runner driving PhysicsWorld with scripted or bot inputs."""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Optional, Protocol
+
+from air_hockey.config.settings import Settings
+from air_hockey.engine.contacts import ContactKind
+from air_hockey.engine.physics import PhysicsWorld
+from air_hockey.game.ai import AiController, Difficulty
+from air_hockey.game.entities import MalletSpec
+from air_hockey.game.field import FieldSpec, clamp_mallet_position
+from air_hockey.game.rules import MatchRules
+
+# Gap between puck and mallet below which they still count as touching, so a mallet
+# pushing the puck across several ticks is one hit rather than one per tick.
+SEPARATION_MARGIN = 0.002
+
+
+class MalletInput(Protocol):
+    def update(self, world: PhysicsWorld, time_step: float) -> tuple[float, float]:
+        ...
+
+    def reset(self) -> None:
+        ...
+
+
+class IdleInput:
+    """Holds the mallet at its home position."""
+
+    def __init__(self, field_spec: FieldSpec, left: bool) -> None:
+        self.position = (field_spec.width * (-0.25 if left else 0.25), 0.0)
+
+    def update(self, world: PhysicsWorld, time_step: float) -> tuple[float, float]:
+        return self.position
+
+    def reset(self) -> None:
+        pass
+
+
+class ScriptedInput:
+    """Deterministic figure-eight sweep around the home position."""
+
+    def __init__(
+        self,
+        field_spec: FieldSpec,
+        left: bool,
+        period_s: float = 2.4,
+        phase: float = 0.0,
+    ) -> None:
+        self.field = field_spec
+        self.left = left
+        self.period_s = period_s
+        self.phase = phase
+        self.radius = MalletSpec().radius
+        self._time = 0.0
+        side = -1.0 if left else 1.0
+        self._center = (side * field_spec.width * 0.3, 0.0)
+        self._amplitude = (field_spec.width * 0.15, field_spec.height * 0.35)
+
+    def update(self, world: PhysicsWorld, time_step: float) -> tuple[float, float]:
+        self._time += time_step
+        angle = 2.0 * math.pi * self._time / self.period_s + self.phase
+        x = self._center[0] + self._amplitude[0] * math.sin(2.0 * angle)
+        y = self._center[1] + self._amplitude[1] * math.sin(angle)
+        return clamp_mallet_position(self.field, self.radius, (x, y), self.left)
+
+    def reset(self) -> None:
+        pass
+
+
+@dataclass
+class SimulationConfig:
+    duration_s: float = 60.0
+    time_step: float = 1.0 / 120.0
+    puck_restitution: float = Settings.puck_restitution
+    puck_damping: float = Settings.puck_damping
+    max_puck_speed: float = Settings.max_puck_speed
+    mallet_speed_limit: float = Settings.mallet_speed_limit
+    max_goals: Optional[int] = None
+    stall_speed: float = 0.05
+    stall_s: float = 3.0
+    continuous_collision: bool = True
+
+    @classmethod
+    def from_settings(cls, settings: Settings, **overrides: object) -> "SimulationConfig":
+        values: dict[str, object] = {
+            "puck_restitution": settings.puck_restitution,
+            "puck_damping": settings.puck_damping,
+            "max_puck_speed": settings.max_puck_speed,
+            "mallet_speed_limit": settings.mallet_speed_limit,
+        }
+        values.update(overrides)
+        return cls(**values)
+
+
+@dataclass
+class SimulationResult:
+    ticks: int = 0
+    sim_time_s: float = 0.0
+    wall_time_s: float = 0.0
+    score_left: int = 0
+    score_right: int = 0
+    goals: list[tuple[float, str]] = field(default_factory=list)
+    wall_hits: int = 0
+    # Mallet contacts that began after the puck and that mallet had separated.
+    mallet_hits: int = 0
+    top_speed: float = 0.0
+    stalls: int = 0
+    rally_hits: list[int] = field(default_factory=list)
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.wall_time_s if self.wall_time_s > 0 else 0.0
+
+    @property
+    def average_rally_hits(self) -> float:
+        return sum(self.rally_hits) / len(self.rally_hits) if self.rally_hits else 0.0
+
+    def to_dict(self) -> dict[str, object]:
+        data = asdict(self)
+        data["ticks_per_second"] = self.ticks_per_second
+        data["average_rally_hits"] = self.average_rally_hits
+        return data
+
+
+def create_input(spec: str, field_spec: FieldSpec, left: bool, seed: int = 0) -> MalletInput:
+    """Build an input from a CLI-style spec: idle, script[:period], cpu[:difficulty].
+
+    CPU inputs run without the wall-clock budget so results are reproducible.
+    """
+    kind, _, arg = spec.partition(":")
+    if kind == "idle":
+        return IdleInput(field_spec, left)
+    if kind == "script":
+        period = float(arg) if arg else 2.4
+        phase = 0.7 * seed + (0.0 if left else 1.9)
+        return ScriptedInput(field_spec, left, period_s=period, phase=phase)
+    if kind == "cpu":
+        difficulty = Difficulty(arg) if arg else Difficulty.MEDIUM
+        return AiController(
+            field_spec,
+            left=left,
+            difficulty=difficulty,
+            budget_us=None,
+            seed=seed * 2 + int(left),
+        )
+    raise ValueError(f"unknown input spec: {spec!r}")
+
+
+class MatchSimulator:
+    def __init__(
+        self,
+        config: SimulationConfig,
+        left_input: MalletInput,
+        right_input: MalletInput,
+        field_spec: FieldSpec | None = None,
+    ) -> None:
+        self.config = config
+        self.field = field_spec or FieldSpec()
+        self.left_input = left_input
+        self.right_input = right_input
+        self.result = SimulationResult()
+        self._rally_hits = 0
+        self._touching = {ContactKind.MALLET_LEFT: False, ContactKind.MALLET_RIGHT: False}
+        self.physics = PhysicsWorld(
+            self.field,
+            puck_restitution=config.puck_restitution,
+            puck_damping=config.puck_damping,
+            max_puck_speed=config.max_puck_speed,
+            continuous_collision=config.continuous_collision,
+        )
+        self.rules = MatchRules(self.field, self.physics, config.time_step)
+        self._reset_positions()
+
+    def _count_contacts(self) -> None:
+        """Tally this tick's contacts, counting a mallet hit only when a new contact starts."""
+        result = self.result
+        struck = set()
+        for event in self.physics.contacts.drain():
+            if event.kind == ContactKind.WALL:
+                result.wall_hits += 1
+            else:
+                struck.add(event.kind)
+        entities = self.physics.entities
+        for kind, mallet in (
+            (ContactKind.MALLET_LEFT, entities.mallet_left),
+            (ContactKind.MALLET_RIGHT, entities.mallet_right),
+        ):
+            if kind in struck and not self._touching[kind]:
+                result.mallet_hits += 1
+                self._rally_hits += 1
+            self._touching[kind] = kind in struck or (
+                self._touching[kind] and _touching(entities.puck, mallet)
+            )
+
+    def _reset_positions(self) -> None:
+        self.rules.reset_positions(mallet_speed=self.config.mallet_speed_limit)
+        self.left_input.reset()
+        self.right_input.reset()
+        for kind in self._touching:
+            self._touching[kind] = False
+
+    def _end_rally(self) -> None:
+        self.result.rally_hits.append(self._rally_hits)
+        self._rally_hits = 0
+        self._reset_positions()
+
+    def run(self) -> SimulationResult:
+        config = self.config
+        result = self.result
+        time_step = config.time_step
+        total_ticks = int(round(config.duration_s / time_step))
+        stall_ticks_limit = int(round(config.stall_s / time_step))
+        stall_speed_sq = config.stall_speed * config.stall_speed
+        stall_ticks = 0
+        top_speed_sq = 0.0
+        puck = self.physics.entities.puck
+        start = time.perf_counter()
+
+        for tick in range(total_ticks):
+            left_pos = self.left_input.update(self.physics, time_step)
+            right_pos = self.right_input.update(self.physics, time_step)
+            self.physics.set_mallet_positions(
+                left_pos,
+                right_pos,
+                time_step=time_step,
+                teleport=False,
+                max_speed=config.mallet_speed_limit,
+            )
+            self.physics.step(time_step)
+            self._count_contacts()
+            result.ticks = tick + 1
+
+            speed_sq = puck.vx * puck.vx + puck.vy * puck.vy
+            if speed_sq > top_speed_sq:
+                top_speed_sq = speed_sq
+
+            scorer = self.rules.check_goal()
+            if scorer is not None:
+                result.goals.append((result.ticks * time_step, scorer))
+                stall_ticks = 0
+                self._end_rally()
+                if config.max_goals is not None and len(result.goals) >= config.max_goals:
+                    break
+                continue
+
+            stall_ticks = stall_ticks + 1 if speed_sq < stall_speed_sq else 0
+            if stall_ticks >= stall_ticks_limit:
+                result.stalls += 1
+                stall_ticks = 0
+                self._end_rally()
+
+        if self._rally_hits:
+            result.rally_hits.append(self._rally_hits)
+            self._rally_hits = 0
+        result.wall_time_s = time.perf_counter() - start
+        result.sim_time_s = result.ticks * time_step
+        result.score_left = self.rules.score_left
+        result.score_right = self.rules.score_right
+        result.top_speed = top_speed_sq ** 0.5
+        return result
+
+
+def _touching(puck, mallet) -> bool:
+    dx = puck.x - mallet.x
+    dy = puck.y - mallet.y
+    reach = puck.radius + mallet.radius + SEPARATION_MARGIN
+    return dx * dx + dy * dy <= reach * reach
+
+
+def run_match(
+    config: SimulationConfig,
+    left: str = "cpu:medium",
+    right: str = "cpu:medium",
+    seed: int = 0,
+) -> SimulationResult:
+    field_spec = FieldSpec()
+    simulator = MatchSimulator(
+        config,
+        create_input(left, field_spec, left=True, seed=seed),
+        create_input(right, field_spec, left=False, seed=seed),
+        field_spec=field_spec,
+    )
+    return simulator.run()
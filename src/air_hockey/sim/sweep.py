@@ -0,0 +1,201 @@
+"""Process-pool parameter sweep over physics settings.
+
+Run with `python -m air_hockey.sim.sweep`. Each axis accepts a comma list
+(`0.5,0.7,0.9`) or an inclusive range (`start:stop:step`). Rally length counts
+mallet hits, one per contact however long the mallet pushes the puck.
+`--apply-best` saves the top combination only if its matches were played out:
+goals were scored and the puck stalled less often than it was scored.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+
+from air_hockey.config.settings import Settings
+from air_hockey.sim.runner import SimulationConfig, run_match
+
+SWEEP_FIELDS = ("puck_restitution", "puck_damping", "max_puck_speed", "mallet_speed_limit")
+RANK_KEYS = ("rally", "top_speed", "wall_rate", "stalls")
+
+
+@dataclass(frozen=True)
+class SweepMetrics:
+    puck_restitution: float
+    puck_damping: float
+    max_puck_speed: float
+    mallet_speed_limit: float
+    matches: int
+    average_rally_hits: float
+    top_speed: float
+    wall_hit_rate: float
+    stalls_per_minute: float
+    goals_per_minute: float
+
+    def rank_value(self, key: str) -> float:
+        if key == "top_speed":
+            return self.top_speed
+        if key == "wall_rate":
+            return self.wall_hit_rate
+        if key == "stalls":
+            return -self.stalls_per_minute
+        return self.average_rally_hits
+
+
+def parse_axis(text: str) -> list[float]:
+    if ":" in text:
+        start, stop, step = (float(part) for part in text.split(":"))
+        if step <= 0:
+            raise argparse.ArgumentTypeError("range step must be positive")
+        count = int((stop - start) / step + 1e-9) + 1
+        return [round(start + index * step, 10) for index in range(count)]
+    return [float(part) for part in text.split(",") if part]
+
+
+def evaluate(
+    combo: dict[str, float],
+    base: SimulationConfig,
+    seeds: list[int],
+    left: str,
+    right: str,
+) -> SweepMetrics:
+    config = replace(base, **combo)
+    rally_total = 0
+    rally_count = 0
+    top_speed = 0.0
+    wall_hits = 0
+    stalls = 0
+    goals = 0
+    sim_time = 0.0
+    for seed in seeds:
+        result = run_match(config, left=left, right=right, seed=seed)
+        rally_total += sum(result.rally_hits)
+        rally_count += len(result.rally_hits)
+        top_speed = max(top_speed, result.top_speed)
+        wall_hits += result.wall_hits
+        stalls += result.stalls
+        goals += len(result.goals)
+        sim_time += result.sim_time_s
+    minutes = sim_time / 60.0 if sim_time > 0 else 1.0
+    return SweepMetrics(
+        matches=len(seeds),
+        average_rally_hits=rally_total / rally_count if rally_count else 0.0,
+        top_speed=top_speed,
+        wall_hit_rate=wall_hits / sim_time if sim_time > 0 else 0.0,
+        stalls_per_minute=stalls / minutes,
+        goals_per_minute=goals / minutes,
+        **{name: getattr(config, name) for name in SWEEP_FIELDS},
+    )
+
+
+def run_sweep(
+    grid: dict[str, list[float]],
+    base: SimulationConfig,
+    seeds: list[int],
+    left: str,
+    right: str,
+    workers: int | None = None,
+    rank_by: str = "rally",
+) -> list[SweepMetrics]:
+    names = list(grid)
+    combos = [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(evaluate, combo, base, seeds, left, right) for combo in combos]
+        results = [future.result() for future in futures]
+    results.sort(key=lambda metrics: metrics.rank_value(rank_by), reverse=True)
+    return results
+
+
+def write_results(path: Path, results: list[SweepMetrics]) -> None:
+    names = [item.name for item in fields(SweepMetrics)]
+    with path.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["rank", *names])
+        for rank, metrics in enumerate(results, start=1):
+            row = [getattr(metrics, name) for name in names]
+            formatted = [f"{value:.4g}" if isinstance(value, float) else value for value in row]
+            writer.writerow([rank, *formatted])
+
+
+def validate_for_settings(metrics: SweepMetrics) -> None:
+    """Raise ValueError if `metrics` describe matches too degenerate to rank by."""
+    combo = ", ".join(f"{name}={getattr(metrics, name):g}" for name in SWEEP_FIELDS)
+    if metrics.goals_per_minute <= 0.0:
+        raise ValueError(f"{combo} scored no goals, so its rallies never ended in play")
+    if metrics.stalls_per_minute > metrics.goals_per_minute:
+        raise ValueError(
+            f"{combo} stalled {metrics.stalls_per_minute:.2f}/min but scored only "
+            f"{metrics.goals_per_minute:.2f}/min"
+        )
+
+
+def apply_to_settings(metrics: SweepMetrics) -> Settings:
+    """Save the physics values of `metrics`; raises ValueError if they fail validation."""
+    from air_hockey.config.io import load_settings, save_settings
+
+    validate_for_settings(metrics)
+    settings = load_settings()
+    for name in SWEEP_FIELDS:
+        setattr(settings, name, getattr(metrics, name))
+    save_settings(settings)
+    return settings
+
+
+def main(argv: list[str] | None = None) -> int:
+    defaults = Settings()
+    parser = argparse.ArgumentParser(
+        prog="python -m air_hockey.sim.sweep", description=__doc__.splitlines()[0]
+    )
+    for name in SWEEP_FIELDS:
+        parser.add_argument(
+            "--" + name.replace("_", "-"),
+            type=parse_axis,
+            default=[getattr(defaults, name)],
+            metavar="VALUES",
+        )
+    parser.add_argument("--matches", type=int, default=8, help="matches (seeds) per combination")
+    parser.add_argument("--duration", type=float, default=60.0, help="simulated seconds per match")
+    parser.add_argument("--left", default="script")
+    parser.add_argument("--right", default="script")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--rank-by", choices=RANK_KEYS, default="rally")
+    parser.add_argument("--output", type=Path, default=Path("sweep_results.csv"))
+    parser.add_argument(
+        "--apply-best",
+        action="store_true",
+        help="save the top combination to user settings if its matches were played out",
+    )
+    args = parser.parse_args(argv)
+
+    grid = {name: getattr(args, name) for name in SWEEP_FIELDS}
+    base = SimulationConfig(duration_s=args.duration)
+    seeds = list(range(args.matches))
+    results = run_sweep(grid, base, seeds, args.left, args.right, args.workers, args.rank_by)
+    write_results(args.output, results)
+
+    for rank, metrics in enumerate(results[:5], start=1):
+        combo = ", ".join(f"{name}={getattr(metrics, name):g}" for name in SWEEP_FIELDS)
+        print(
+            f"#{rank} {combo} rally={metrics.average_rally_hits:.1f} "
+            f"top={metrics.top_speed:.2f} walls/s={metrics.wall_hit_rate:.2f} "
+            f"stalls/min={metrics.stalls_per_minute:.2f} goals/min={metrics.goals_per_minute:.2f}"
+        )
+    print(f"{len(results)} combinations written to {args.output}")
+
+    if args.apply_best and results:
+        try:
+            apply_to_settings(results[0])
+        except ValueError as exc:
+            print(f"Not saving the best combination: {exc}.", file=sys.stderr)
+            return 1
+        print("Saved best combination to user settings.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,13 +5,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable
 
-import cv2
 import pygame
 
 from air_hockey.config.io import load_settings, save_calibration
 from air_hockey.engine.calibration import CalibrationData, PlayerCalibration
-from air_hockey.engine.camera import CameraCapture
-from air_hockey.engine.hand_tracking import HandTracker
+from air_hockey.engine.detection import DetectionStage, create_hand_tracker
+from air_hockey.engine.frame_cache import FrameCache
+from air_hockey.engine.frame_sources import create_frame_source
 from air_hockey.ui.fonts import get_font
 from air_hockey.ui.widgets import Button
 
@@ -24,7 +24,12 @@ class CalibrationStep:
 
 
 class CalibrationScreen:
-    def __init__(self, window_size: tuple[int, int], on_back: Callable[[], None]) -> None:
+    def __init__(
+        self,
+        window_size: tuple[int, int],
+        on_back: Callable[[], None],
+        frame_source: str | None = None,
+    ) -> None:
         self.window_size = window_size
         self.on_back = on_back
         self.font = get_font(26)
@@ -42,10 +47,21 @@ class CalibrationScreen:
             on_click=self._capture_step,
             font=self.font,
         )
-        self.camera = CameraCapture()
-        self.camera_active = self.camera.start()
         settings = load_settings()
-        self.hand_tracker = HandTracker(process_every=settings.hand_process_every)
+        self.camera = create_frame_source(settings, frame_source)
+        self.camera_active = self.camera.start()
+        self.frames = FrameCache()
+        self.detection = DetectionStage(
+            create_hand_tracker(
+                settings.pose_backend,
+                settings.hand_process_every,
+                settings.pose_model_path,
+                flow=settings.flow_interpolation,
+            ),
+            scale=settings.detection_scale,
+            max_jump_px=settings.max_jump_px,
+            frames=self.frames,
+        )
         self.detection_scale = settings.detection_scale
         self.max_jump_px = settings.max_jump_px
         self.hand_process_every = settings.hand_process_every
@@ -74,6 +90,7 @@ class CalibrationScreen:
     def _exit(self) -> None:
         if self.camera_active:
             self.camera.stop()
+        self.detection.close()
         self.on_back()
 
     def handle_event(self, event: pygame.event.Event) -> None:
@@ -121,17 +138,10 @@ class CalibrationScreen:
     def _update_detection(self) -> None:
         if not self.camera_active:
             return
-        frame = self.camera.get_latest()
-        if frame is None:
+        if not self.detection.poll(self.camera.get_latest()):
             return
-        frame_bgr = cv2.flip(frame.frame, 1)
-        positions = self.hand_tracker.detect(frame_bgr, scale=self.detection_scale)
-        self.last_detection_left = self._apply_jump_filter(
-            self.last_detection_left, positions.left
-        )
-        self.last_detection_right = self._apply_jump_filter(
-            self.last_detection_right, positions.right
-        )
+        self.last_detection_left = self.detection.latest.left
+        self.last_detection_right = self.detection.latest.right
 
     def _capture_step(self) -> None:
         if self.step_index >= len(self.steps):
@@ -171,17 +181,9 @@ class CalibrationScreen:
         return self.last_detection_right
 
     def _draw_preview(self, surface: pygame.Surface) -> None:
-        frame = self.camera.get_latest()
-        if frame is None:
+        if not self.frames.available:
             return
-        frame_bgr = cv2.flip(frame.frame, 1)
-        frame_rgb = frame_bgr[:, :, ::-1]
-        preview_width = 320
-        preview_height = int(preview_width * frame_rgb.shape[0] / frame_rgb.shape[1])
-        preview = pygame.transform.smoothscale(
-            pygame.surfarray.make_surface(frame_rgb.swapaxes(0, 1)),
-            (preview_width, preview_height),
-        )
+        preview = self.frames.preview_surface(self.frames.scaled_size(320))
         preview_rect = preview.get_rect()
         preview_rect.center = (self.window_size[0] // 2, self.window_size[1] // 2 + 60)
         surface.blit(preview, preview_rect)
@@ -212,11 +214,7 @@ class CalibrationScreen:
         detection: tuple[int, int],
         left: bool,
     ) -> None:
-        frame = self.camera.get_latest()
-        if frame is None:
-            return
-        frame_bgr = cv2.flip(frame.frame, 1)
-        frame_height, frame_width = frame_bgr.shape[:2]
+        frame_width, frame_height = self.detection.latest.frame_size
         if left:
             x_norm = detection[0] / max(1, frame_width)
             x_pos = preview_rect.left + int(x_norm * preview_rect.width)
@@ -228,16 +226,3 @@ class CalibrationScreen:
         y_norm = detection[1] / max(1, frame_height)
         y_pos = preview_rect.top + int(y_norm * preview_rect.height)
         pygame.draw.circle(surface, color, (x_pos, y_pos), 8, width=2)
-
-    def _apply_jump_filter(
-        self, previous: tuple[int, int] | None, current: tuple[int, int] | None
-    ) -> tuple[int, int] | None:
-        if current is None:
-            return previous
-        if previous is None:
-            return current
-        dx = current[0] - previous[0]
-        dy = current[1] - previous[1]
-        if (dx * dx + dy * dy) ** 0.5 > self.max_jump_px:
-            return previous
-        return current
@@ -12,9 +12,27 @@ class Hud:
         self.window_size = window_size
         self.score_color = score_color
         self.score_font = get_font(28, bold=True)
+        self.small_font = get_font(18)
 
     def render_score(self, surface: pygame.Surface, score_left: int, score_right: int) -> None:
         score_text = f"{score_left}   :   {score_right}"
         score_surf = self.score_font.render(score_text, True, self.score_color)
         score_rect = score_surf.get_rect(center=(self.window_size[0] // 2, 36))
         surface.blit(score_surf, score_rect)
+
+    def render_latency(self, surface: pygame.Surface, summary: dict[str, dict[str, float]]) -> None:
+        lines = ["latency since capture (ms)   p50    p95    p99"]
+        for stage, values in summary.items():
+            lines.append(
+                f"{stage:<12} {values['p50_ms']:6.1f} {values['p95_ms']:6.1f} {values['p99_ms']:6.1f}"
+            )
+        x = self.window_size[0] - 16
+        for index, line in enumerate(lines):
+            line_surf = self.small_font.render(line, True, (180, 190, 205))
+            line_rect = line_surf.get_rect(topright=(x, 16 + index * 20))
+            surface.blit(line_surf, line_rect)
+
+    def render_quality(self, surface: pygame.Surface, label: str) -> None:
+        label_surf = self.small_font.render(label, True, (180, 190, 205))
+        label_rect = label_surf.get_rect(bottomleft=(16, self.window_size[1] - 16))
+        surface.blit(label_surf, label_rect)
@@ -2,25 +2,37 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from typing import Callable
 
-import cv2
 import pygame
 
 from air_hockey.config.io import load_calibration, load_settings
+from air_hockey.config.settings import Settings
 from air_hockey.engine.audio import AudioManager
-from air_hockey.engine.camera import CameraCapture
-from air_hockey.engine.hand_tracking import HandTracker
+from air_hockey.engine.contacts import ContactKind
+from air_hockey.engine.detection import DetectionStage, create_hand_tracker
+from air_hockey.engine.frame_cache import FrameCache
+from air_hockey.engine.frame_sources import create_frame_source
+from air_hockey.engine.latency import LatencyTracker
 from air_hockey.engine.physics import PhysicsWorld
+from air_hockey.engine.preview_window import PreviewWindow
+from air_hockey.engine.quality import QualityGovernor, QualityLevel, build_levels, nearest_level
+from air_hockey.engine.timestep import FixedStepClock, OverrunPolicy
 from air_hockey.engine.windowing import ScoreboardMode, WebcamViewMode, WindowOptions
+from air_hockey.game.ai import AiController, Difficulty
 from air_hockey.game.entities import MalletSpec
-from air_hockey.game.field import FieldSpec
+from air_hockey.game.field import FieldSpec, clamp_mallet_position
+from air_hockey.game.rules import MatchRules
 from air_hockey.game.themes import ThemeManager
 from air_hockey.ui.fonts import get_font
 from air_hockey.ui.screens.hud import Hud
 from air_hockey.ui.screens.scoreboard import ScoreboardWindow
 
+CONTACT_SOUND_MIN_SPEED = 0.2
+CONTACT_SOUND_FULL_SPEED = 3.0
+
 
 @dataclass
 class RenderConfig:
@@ -34,15 +46,19 @@ class PlayScreen:
         window_size: tuple[int, int],
         on_back: Callable[[], None],
         on_pause: Callable[[], None],
+        use_camera: bool = True,
+        frame_source: str | None = None,
+        settings: Settings | None = None,
     ) -> None:
         self.window_size = window_size
         self.on_back = on_back
         self.on_pause = on_pause
         self.field = FieldSpec()
         self.mallet_spec = MalletSpec()
-        settings = load_settings()
+        if settings is None:
+            settings = load_settings()
         self.audio = AudioManager(sound_pack=settings.sound_pack)
-        self.camera = CameraCapture()
+        self.camera = create_frame_source(settings, frame_source)
         self.camera_active = False
         self.window_options = WindowOptions(
             webcam_view_mode=settings.webcam_view_mode,
@@ -51,7 +67,24 @@ class PlayScreen:
             display_index=settings.display_index,
         )
         self.settings = settings
-        self.hand_tracker = HandTracker(process_every=settings.hand_process_every)
+        self.use_camera = use_camera
+        self.frames = FrameCache()
+        self.preview_window: PreviewWindow | None = None
+        self.detection = (
+            DetectionStage(
+                create_hand_tracker(
+                    settings.pose_backend,
+                    settings.hand_process_every,
+                    settings.pose_model_path,
+                    flow=settings.flow_interpolation,
+                ),
+                scale=settings.detection_scale,
+                max_jump_px=settings.max_jump_px,
+                frames=self.frames,
+            )
+            if use_camera
+            else None
+        )
         self.last_detection_left: tuple[int, int] | None = None
         self.last_detection_right: tuple[int, int] | None = None
         self.use_camera_control = True
@@ -62,20 +95,26 @@ class PlayScreen:
         self.max_jump_px = settings.max_jump_px
         self.hand_process_every = settings.hand_process_every
         self.calibration = load_calibration()
+        self.latency = LatencyTracker()
+        self.show_latency = settings.show_latency
+        self._latency_sample_time = 0.0
+        self._latency_pending: float | None = None
+        self._latency_on_screen: float | None = None
+        self._frame_started = 0.0
+        self._frame_inference = 0.0
+        self.quality = self._create_quality_governor(settings)
         self.physics = PhysicsWorld(
             self.field,
-            on_puck_wall=self.audio.play_wall,
-            on_puck_mallet=self.audio.play_mallet,
             puck_restitution=settings.puck_restitution,
             puck_damping=settings.puck_damping,
             max_puck_speed=settings.max_puck_speed,
+            continuous_collision=True,
         )
-        self.clock_accumulator = 0.0
         self.fixed_time_step = 1.0 / 120.0
+        self.step_clock = self._create_step_clock(settings)
         self.mallet_speed = settings.mallet_speed_limit
-        self.score_left = 0
-        self.score_right = 0
-        self.serve_side = "left"
+        self.ai_controller = self._create_ai_controller(settings)
+        self.rules = MatchRules(self.field, self.physics, self.fixed_time_step)
         self.trail_positions: list[tuple[float, float]] = []
         self.trail_max = 12
         self.theme_manager = ThemeManager(theme_name=settings.theme)
@@ -83,7 +122,8 @@ class PlayScreen:
         self.font = get_font(22)
         self.hud = Hud(window_size=window_size, score_color=self.theme_manager.theme.hud_score)
         self.scoreboard_window: ScoreboardWindow | None = None
-        self.start_camera()
+        if use_camera:
+            self.start_camera()
         self._reset_positions()
 
     def _build_render_config(self) -> RenderConfig:
@@ -93,40 +133,119 @@ class PlayScreen:
         table_rect.center = (self.window_size[0] // 2, self.window_size[1] // 2)
         return RenderConfig(pixels_per_meter=400.0, table_rect=table_rect)
 
+    def _create_ai_controller(self, settings: Settings) -> AiController | None:
+        if settings.cpu_opponent not in {level.value for level in Difficulty}:
+            return None
+        return AiController(
+            self.field,
+            left=settings.cpu_side == "left",
+            difficulty=Difficulty(settings.cpu_opponent),
+            mallet_speed=settings.mallet_speed_limit,
+        )
+
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             self.on_pause()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.show_latency = not self.show_latency
 
     def start_camera(self) -> None:
-        if not self.camera_active:
+        if self.use_camera and not self.camera_active:
             self.camera_active = self.camera.start()
 
     def stop_camera(self) -> None:
         if self.camera_active:
             self.camera.stop()
             self.camera_active = False
-        if self.window_options.webcam_view_mode == WebcamViewMode.WINDOW:
-            cv2.destroyWindow("Air Hockey Camera")
+        self._close_preview_window()
+
+    def _close_preview_window(self) -> None:
+        if self.preview_window is not None:
+            self.preview_window.close()
+            self.preview_window = None
 
     def stop(self) -> None:
         self.stop_camera()
+        if self.detection is not None:
+            self.detection.close()
         if self.scoreboard_window is not None:
             self.scoreboard_window.close()
 
+    def _create_quality_governor(self, settings: Settings) -> QualityGovernor | None:
+        if not settings.adaptive_quality or self.detection is None:
+            return None
+        levels = build_levels(
+            min_scale=settings.quality_min_scale,
+            max_scale=settings.quality_max_scale,
+            max_process_every=settings.quality_max_process_every,
+            min_complexity=settings.quality_min_complexity,
+            max_complexity=settings.quality_max_complexity,
+        )
+        start = nearest_level(levels, settings.detection_scale, settings.hand_process_every)
+        governor = QualityGovernor(levels, target_fps=settings.target_fps, start_index=start)
+        self._apply_quality(governor.level)
+        return governor
+
+    def _apply_quality(self, level: QualityLevel) -> None:
+        self.detection_scale = level.scale
+        self.hand_process_every = level.process_every
+        self.detection.scale = level.scale
+        tracker = self.detection.tracker
+        tracker.process_every = level.process_every
+        set_model_complexity = getattr(tracker, "set_model_complexity", None)
+        if set_model_complexity is not None:
+            set_model_complexity(level.model_complexity)
+
+    def _create_step_clock(self, settings: Settings) -> FixedStepClock:
+        try:
+            policy = OverrunPolicy(settings.overrun_policy)
+        except ValueError:
+            policy = OverrunPolicy.DROP
+        return FixedStepClock(
+            self.fixed_time_step,
+            max_catchup_steps=settings.max_catchup_steps,
+            policy=policy,
+        )
+
     def update(self, dt: float) -> None:
-        self.clock_accumulator += dt
+        self._frame_started = time.perf_counter()
         keys = pygame.key.get_pressed()
-        while self.clock_accumulator >= self.fixed_time_step:
-            self._update_detection()
+        self._update_detection()
+        steps = self.step_clock.advance(dt)
+        for _ in range(steps):
             self._update_mallets(keys, self.fixed_time_step)
             self.physics.step(self.fixed_time_step)
             self._check_goal()
-            self.clock_accumulator -= self.fixed_time_step
             self._update_trail()
+        self._play_contact_sounds()
         puck_velocity = self.physics.entities.puck.linearVelocity
         speed = (puck_velocity[0] ** 2 + puck_velocity[1] ** 2) ** 0.5
         self.audio.update_puck_movement(speed)
 
+    def _play_contact_sounds(self) -> None:
+        """Drain this frame's contacts and play at most one sound per kind, scaled by impulse."""
+        wall_impulse = 0.0
+        mallet_impulse = 0.0
+        for event in self.physics.contacts.drain():
+            if event.kind == ContactKind.WALL:
+                wall_impulse = max(wall_impulse, event.impulse)
+            else:
+                mallet_impulse = max(mallet_impulse, event.impulse)
+        inv_mass = self.physics.entities.puck.inv_mass
+        wall_volume = self._contact_volume(wall_impulse * inv_mass)
+        if wall_volume > 0.0:
+            self.audio.play_wall(wall_volume)
+        mallet_volume = self._contact_volume(mallet_impulse * inv_mass)
+        if mallet_volume > 0.0:
+            self.audio.play_mallet(mallet_volume)
+
+    @staticmethod
+    def _contact_volume(delta_speed: float) -> float:
+        if delta_speed < CONTACT_SOUND_MIN_SPEED:
+            return 0.0
+        span = CONTACT_SOUND_FULL_SPEED - CONTACT_SOUND_MIN_SPEED
+        return min(0.25 + 0.75 * (delta_speed - CONTACT_SOUND_MIN_SPEED) / span, 1.0)
+
     def apply_settings(self) -> None:
         settings = load_settings()
         old_webcam_mode = self.window_options.webcam_view_mode
@@ -142,7 +261,18 @@ class PlayScreen:
         self.theme_manager = ThemeManager(theme_name=settings.theme)
         self.hud.score_color = self.theme_manager.theme.hud_score
         self.mallet_speed = settings.mallet_speed_limit
+        if (
+            settings.cpu_opponent != self.settings.cpu_opponent
+            or settings.cpu_side != self.settings.cpu_side
+            or settings.mallet_speed_limit != self.settings.mallet_speed_limit
+        ):
+            self.ai_controller = self._create_ai_controller(settings)
         self.smoothing = settings.smoothing
+        self.show_latency = settings.show_latency
+        clock = self._create_step_clock(settings)
+        self.step_clock.max_catchup_steps = clock.max_catchup_steps
+        self.step_clock.policy = clock.policy
+        self.step_clock.reset()
         self.physics.update_puck_settings(
             restitution=settings.puck_restitution,
             damping=settings.puck_damping,
@@ -151,14 +281,22 @@ class PlayScreen:
         self.detection_scale = settings.detection_scale
         self.max_jump_px = settings.max_jump_px
         self.hand_process_every = settings.hand_process_every
-        if self.hand_tracker.process_every != self.hand_process_every:
-            self.hand_tracker.process_every = max(1, self.hand_process_every)
+        if self.detection is not None:
+            self.detection.tracker.process_every = max(1, self.hand_process_every)
+            self.detection.scale = self.detection_scale
+            self.detection.max_jump_px = self.max_jump_px
+        if self._quality_settings(settings) != self._quality_settings(self.settings):
+            self.quality = self._create_quality_governor(settings)
+        elif self.quality is not None:
+            self._apply_quality(self.quality.level)
 
         if old_sound_pack != settings.sound_pack:
             self.audio.reload(settings.sound_pack)
 
         if old_webcam_mode == WebcamViewMode.WINDOW and settings.webcam_view_mode != WebcamViewMode.WINDOW:
-            cv2.destroyWindow("Air Hockey Camera")
+            self._close_preview_window()
+        elif self.preview_window is not None:
+            self.preview_window.max_fps = settings.camera_window_fps
 
         if old_scoreboard_mode == ScoreboardMode.WINDOW and settings.scoreboard_mode == ScoreboardMode.HUD:
             if self.scoreboard_window is not None:
@@ -167,17 +305,33 @@ class PlayScreen:
 
         self.settings = settings
 
+    @staticmethod
+    def _quality_settings(settings: Settings) -> tuple[object, ...]:
+        return (
+            settings.adaptive_quality,
+            settings.target_fps,
+            settings.quality_min_scale,
+            settings.quality_max_scale,
+            settings.quality_max_process_every,
+            settings.quality_min_complexity,
+            settings.quality_max_complexity,
+        )
+
     def render(self, surface: pygame.Surface) -> None:
         surface.fill((10, 16, 22))
         self._draw_table(surface)
         self._draw_entities(surface)
         if self.window_options.scoreboard_mode == ScoreboardMode.HUD:
-            self.hud.render_score(surface, self.score_left, self.score_right)
+            self.hud.render_score(surface, self.rules.score_left, self.rules.score_right)
         else:
             self._render_scoreboard_window(surface)
         self._draw_webcam_overlay(surface)
         hint = self.font.render("ESC to return to menu", True, (180, 190, 205))
         surface.blit(hint, (16, 16))
+        if self.show_latency:
+            self.hud.render_latency(surface, self.latency.summary())
+        if self.quality is not None:
+            self.hud.render_quality(surface, self.quality.label())
 
     def _world_to_screen(self, position: tuple[float, float]) -> tuple[int, int]:
         px = position[0] * self.render_config.pixels_per_meter
@@ -223,32 +377,15 @@ class PlayScreen:
         self._draw_detection_marker(surface)
 
     def _check_goal(self) -> None:
-        puck = self.physics.entities.puck
-        half_width = self.field.width / 2.0
-        if puck.position[0] < -half_width:
-            self.score_right += 1
-            self.audio.play_goal()
-            self.serve_side = "left"
-            self._reset_positions()
-        elif puck.position[0] > half_width:
-            self.score_left += 1
-            self.audio.play_goal()
-            self.serve_side = "right"
-            self._reset_positions()
+        if self.rules.check_goal() is None:
+            return
+        self.audio.play_goal()
+        self._reset_positions()
 
     def _reset_positions(self) -> None:
-        puck_x = -self.field.width * 0.25 if self.serve_side == "left" else self.field.width * 0.25
-        self.physics.entities.puck.position = (puck_x, 0.0)
-        self.physics.entities.puck.linearVelocity = (0.0, 0.0)
-        left_pos = (-self.field.width * 0.25, 0.0)
-        right_pos = (self.field.width * 0.25, 0.0)
-        self.physics.set_mallet_positions(
-            left_pos,
-            right_pos,
-            time_step=self.fixed_time_step,
-            teleport=False,
-            max_speed=self.mallet_speed,
-        )
+        self.rules.reset_positions(mallet_speed=self.mallet_speed)
+        if self.ai_controller is not None:
+            self.ai_controller.reset()
         self.trail_positions.clear()
 
     def _update_trail(self) -> None:
@@ -271,34 +408,40 @@ class PlayScreen:
             self._draw_circle(surface, position, 0.028, color)
 
     def _update_detection(self) -> None:
-        if not self.camera_active:
+        if not self.camera_active or self.detection is None:
             return
         frame = self.camera.get_latest()
-        if frame is None:
+        picked_up = time.perf_counter()
+        if not self.detection.poll(frame):
             return
-        frame_bgr = cv2.flip(frame.frame, 1)
-        positions = self.hand_tracker.detect(frame_bgr, scale=self.detection_scale)
-        self.last_detection_left = self._apply_jump_filter(
-            self.last_detection_left, positions.left
-        )
-        self.last_detection_right = self._apply_jump_filter(
-            self.last_detection_right, positions.right
-        )
+        detected = time.perf_counter()
+        self._frame_inference = detected - picked_up
+        sample = self.detection.latest
+        self.latency.record("capture", frame.timestamp, picked_up)
+        if sample.timestamp != self._latency_sample_time:
+            self._latency_sample_time = sample.timestamp
+            self.latency.record("detect", sample.timestamp, detected)
+            self._latency_pending = sample.timestamp
+        self.last_detection_left = sample.left
+        self.last_detection_right = sample.right
         if self.window_options.webcam_view_mode == WebcamViewMode.WINDOW:
-            preview = frame_bgr.copy()
-            if self.last_detection_left:
-                cv2.circle(preview, self.last_detection_left, 8, (0, 200, 255), 2)
-            if self.last_detection_right:
-                cv2.circle(preview, self.last_detection_right, 8, (120, 255, 120), 2)
-            cv2.imshow("Air Hockey Camera", preview)
-            cv2.waitKey(1)
+            self._post_preview()
+
+    def _post_preview(self) -> None:
+        if self.preview_window is None:
+            self.preview_window = PreviewWindow(max_fps=self.settings.camera_window_fps)
+            self.preview_window.start()
+        markers = []
+        if self.last_detection_left:
+            markers.append((self.last_detection_left, (0, 200, 255)))
+        if self.last_detection_right:
+            markers.append((self.last_detection_right, (120, 255, 120)))
+        self.preview_window.post(self.detection.frame_bgr, tuple(markers))
 
     def _draw_detection_marker(self, surface: pygame.Surface) -> None:
-        frame = self.camera.get_latest()
-        if frame is None:
+        if self.detection is None or self.detection.frame_bgr is None:
             return
-        frame_bgr = cv2.flip(frame.frame, 1)
-        frame_height, frame_width = frame_bgr.shape[:2]
+        frame_width, frame_height = self.detection.latest.frame_size
 
         if self.last_detection_left:
             world_pos = self._map_detection_to_world(
@@ -312,34 +455,15 @@ class PlayScreen:
             )
             self._draw_circle(surface, world_pos, 0.03, (160, 220, 120))
 
-    def _apply_jump_filter(
-        self, previous: tuple[int, int] | None, current: tuple[int, int] | None
-    ) -> tuple[int, int] | None:
-        if current is None:
-            return previous
-        if previous is None:
-            return current
-        dx = current[0] - previous[0]
-        dy = current[1] - previous[1]
-        if (dx * dx + dy * dy) ** 0.5 > self.max_jump_px:
-            return previous
-        return current
-
     def _draw_webcam_overlay(self, surface: pygame.Surface) -> None:
         if self.window_options.webcam_view_mode != WebcamViewMode.OVERLAY:
             return
-        frame = self.camera.get_latest()
-        if frame is None:
+        if self.detection is None:
+            self.frames.update(self.camera.get_latest())
+        if not self.frames.available:
             return
-        frame_bgr = cv2.flip(frame.frame, 1)
-        frame_height, frame_width = frame_bgr.shape[:2]
-        frame_rgb = frame_bgr[:, :, ::-1]
-        overlay_width = 240
-        overlay_height = int(overlay_width * frame_rgb.shape[0] / frame_rgb.shape[1])
-        overlay = pygame.transform.smoothscale(
-            pygame.surfarray.make_surface(frame_rgb.swapaxes(0, 1)),
-            (overlay_width, overlay_height),
-        )
+        frame_width, frame_height = self.frames.frame_size
+        overlay = self.frames.preview_surface(self.frames.scaled_size(240))
         overlay_rect = overlay.get_rect()
         overlay_rect.midbottom = (self.window_size[0] // 2, self.window_size[1] - 10)
         surface.blit(overlay, overlay_rect)
@@ -371,12 +495,12 @@ class PlayScreen:
         if self.scoreboard_window is None:
             self.scoreboard_window = ScoreboardWindow()
         if not self.scoreboard_window.available:
-            self.hud.render_score(surface, self.score_left, self.score_right)
+            self.hud.render_score(surface, self.rules.score_left, self.rules.score_right)
             return
-        rendered = self.scoreboard_window.render(self.score_left, self.score_right)
+        rendered = self.scoreboard_window.render(self.rules.score_left, self.rules.score_right)
         if not rendered:
             self.scoreboard_window.available = False
-            self.hud.render_score(surface, self.score_left, self.score_right)
+            self.hud.render_score(surface, self.rules.score_left, self.rules.score_right)
 
     def _update_mallets(self, keys: pygame.key.ScancodeWrapper, dt: float) -> None:
         left_pos = self._move_mallet(
@@ -391,6 +515,7 @@ class PlayScreen:
             dt,
             left=False,
         )
+        captured_at = None
         if self.use_camera_control:
             left_cam = self._camera_position(left=True)
             right_cam = self._camera_position(left=False)
@@ -398,6 +523,15 @@ class PlayScreen:
                 left_pos = left_cam
             if right_cam is not None:
                 right_pos = right_cam
+            captured_at = self._latency_pending
+            if captured_at is not None:
+                self.latency.record("filter", captured_at, time.perf_counter())
+        if self.ai_controller is not None:
+            ai_pos = self.ai_controller.update(self.physics, dt)
+            if self.ai_controller.left:
+                left_pos = ai_pos
+            else:
+                right_pos = ai_pos
         self.physics.set_mallet_positions(
             left_pos,
             right_pos,
@@ -405,6 +539,21 @@ class PlayScreen:
             teleport=False,
             max_speed=self.mallet_speed,
         )
+        if captured_at is not None:
+            self.latency.record("physics", captured_at, time.perf_counter())
+            self._latency_pending = None
+            self._latency_on_screen = captured_at
+
+    def on_frame_presented(self, presented_at: float) -> None:
+        """Called by the app right after `pygame.display.flip()`."""
+        if self._latency_on_screen is not None:
+            self.latency.record("display", self._latency_on_screen, presented_at)
+            self._latency_on_screen = None
+        if self.quality is not None and self._frame_started:
+            level = self.quality.observe(presented_at - self._frame_started, self._frame_inference)
+            if level is not None:
+                self._apply_quality(level)
+        self._frame_inference = 0.0
 
     def _move_mallet(
         self,
@@ -426,31 +575,12 @@ class PlayScreen:
         return self._clamp_mallet_position((x, y), left=left)
 
     def _clamp_mallet_position(self, position: tuple[float, float], left: bool) -> tuple[float, float]:
-        x, y = position
-        half_width = self.field.width / 2.0
-        half_height = self.field.height / 2.0
-        radius = self.mallet_spec.radius
-
-        if left:
-            x_min = -half_width + radius
-            x_max = -radius
-        else:
-            x_min = radius
-            x_max = half_width - radius
-
-        y_min = -half_height + radius
-        y_max = half_height - radius
-
-        x = max(x_min, min(x, x_max))
-        y = max(y_min, min(y, y_max))
-
-        return (x, y)
+        return clamp_mallet_position(self.field, self.mallet_spec.radius, position, left)
 
     def _camera_position(self, left: bool) -> tuple[float, float] | None:
-        frame = self.camera.get_latest()
-        if frame is None:
+        if self.detection is None or self.detection.frame_bgr is None:
             return None
-        frame_height, frame_width = frame.frame.shape[:2]
+        frame_width, frame_height = self.detection.latest.frame_size
         if left:
             detection = self.last_detection_left
             if detection is None:
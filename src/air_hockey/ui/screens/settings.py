@@ -7,6 +7,8 @@ from typing import Callable
 import pygame
 
 from air_hockey.config.io import load_settings, save_settings
+from air_hockey.engine.camera import CAPTURE_PROFILES, load_probe
+from air_hockey.engine.frame_sources import camera_device
 from air_hockey.engine.windowing import ScoreboardMode, WebcamViewMode
 from air_hockey.ui.fonts import get_font
 from air_hockey.ui.widgets import Button
@@ -58,6 +60,8 @@ class SettingsScreen:
             ("Sound Pack", self._toggle_sound_pack),
             ("Fullscreen", self._toggle_fullscreen),
             ("Display", self._cycle_display),
+            ("CPU Opponent", self._cycle_cpu_opponent),
+            ("Camera", self._cycle_camera_profile),
             ("Vision Tuning", self._enter_vision),
             ("Physics Tuning", self._enter_physics),
         ]
@@ -198,6 +202,24 @@ class SettingsScreen:
         self.settings.display_index = (self.settings.display_index + 1) % display_count
         self.message = "Display index updated. Restart app to apply."
 
+    def _cycle_cpu_opponent(self) -> None:
+        levels = ["off", "easy", "medium", "hard"]
+        current = self.settings.cpu_opponent
+        index = levels.index(current) if current in levels else 0
+        self.settings.cpu_opponent = levels[(index + 1) % len(levels)]
+        self.message = "CPU opponent updated."
+
+    def _cycle_camera_profile(self) -> None:
+        profiles = list(CAPTURE_PROFILES)
+        current = self.settings.camera_profile
+        index = profiles.index(current) if current in profiles else 0
+        self.settings.camera_profile = profiles[(index + 1) % len(profiles)]
+        self.message = "Camera profile updated. Re-enter Play."
+        device = camera_device(self.settings.frame_source)
+        probe = load_probe(self.settings, device) if device is not None else None
+        if probe is not None:
+            self.message += f" Last granted: {probe.describe()}."
+
     def _inc_puck_restitution(self) -> None:
         self.settings.puck_restitution = self._clamp(
             self.settings.puck_restitution + 0.05, 0.0, 1.0
@@ -363,6 +385,8 @@ class SettingsScreen:
             "Sound Pack": f"Sound Pack: {self.settings.sound_pack.upper()}",
             "Fullscreen": f"Fullscreen: {'ON' if self.settings.fullscreen else 'OFF'}",
             "Display": f"Display: {self.settings.display_index}",
+            "CPU Opponent": f"CPU Opponent: {self.settings.cpu_opponent.upper()}",
+            "Camera": f"Camera: {self.settings.camera_profile.upper()}",
             "Vision Tuning": "Vision Tuning",
             "Physics Tuning": "Physics Tuning",
         }
@@ -0,0 +1,79 @@
+from air_hockey.engine.physics import PhysicsWorld
+from air_hockey.game.ai import AiController, Difficulty
+from air_hockey.game.field import FieldSpec
+
+TIME_STEP = 1.0 / 120.0
+
+
+def test_ai_blocks_straight_shot_and_stays_on_its_half():
+    field = FieldSpec()
+    world = PhysicsWorld(field, puck_damping=0.0, max_puck_speed=0.0, continuous_collision=True)
+    world.entities.puck.position = (-0.3, 0.25)
+    world.entities.puck.linearVelocity = (2.5, 0.0)
+    controller = AiController(field, left=False, difficulty=Difficulty.HARD, seed=0)
+    max_step = controller.mallet_speed * TIME_STEP + 1e-9
+
+    previous = world.entities.mallet_right.position
+    for _ in range(120):
+        target = controller.update(world, TIME_STEP)
+        assert target[0] > 0.0
+        assert ((target[0] - previous[0]) ** 2 + (target[1] - previous[1]) ** 2) ** 0.5 <= max_step
+        world.set_mallet_positions(world.entities.mallet_left.position, target, TIME_STEP)
+        world.step(TIME_STEP)
+        previous = world.entities.mallet_right.position
+
+    assert world.entities.puck.position[0] < field.width / 2.0
+    assert controller.plan_count > 0
+
+
+class _StepClock:
+    """Fake CPU clock that advances a fixed amount on every read."""
+
+    def __init__(self, step_ns: int) -> None:
+        self.step_ns = step_ns
+        self.now = 0
+
+    def __call__(self) -> int:
+        self.now += self.step_ns
+        return self.now
+
+
+def _bouncing_world(field: FieldSpec) -> PhysicsWorld:
+    world = PhysicsWorld(field, puck_damping=0.0, max_puck_speed=0.0, continuous_collision=True)
+    world.entities.puck.position = (-0.3, 0.25)
+    world.entities.puck.linearVelocity = (0.6, 3.0)
+    return world
+
+
+def test_ai_pays_back_overruns_measured_by_its_clock():
+    field = FieldSpec()
+    cheap = AiController(
+        field, left=False, difficulty=Difficulty.HARD, seed=0, clock=_StepClock(1000)
+    )
+    slow = AiController(
+        field, left=False, difficulty=Difficulty.HARD, seed=0, clock=_StepClock(100_000)
+    )
+    for controller in (cheap, slow):
+        world = _bouncing_world(field)
+        for _ in range(40):
+            controller.update(world, TIME_STEP)
+
+    assert cheap.overruns == 0
+    assert cheap.plan_count == 20
+    assert slow.overruns > 0
+    assert slow.plan_count < cheap.plan_count
+    assert slow.max_tick_ns <= 200_000
+
+
+def test_ai_prediction_stops_at_the_segment_quota():
+    field = FieldSpec()
+    limited = AiController(
+        field, left=False, difficulty=Difficulty.HARD, budget_us=None, seed=0, segment_quota=1
+    )
+    full = AiController(field, left=False, difficulty=Difficulty.HARD, budget_us=None, seed=0)
+    for controller in (limited, full):
+        controller.update(_bouncing_world(field), TIME_STEP)
+
+    assert limited.plan_count == full.plan_count == 1
+    assert limited.truncated == 1
+    assert full.truncated == 0
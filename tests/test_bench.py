@@ -0,0 +1,47 @@
+from air_hockey.bench import physics, vision
+from air_hockey.bench.common import compare
+
+
+def test_compare_flags_only_regressions_beyond_threshold():
+    baseline = [
+        {"case": "step", "ticks_per_second": 1000.0, "p50_us": 1.0, "p99_us": 2.0},
+        {"case": "gone", "ticks_per_second": 10.0, "p50_us": 1.0, "p99_us": 1.0},
+    ]
+    current = [{"case": "step", "ticks_per_second": 850.0, "p50_us": 1.3, "p99_us": 9.0}]
+    regressions = compare(current, baseline, threshold=0.2)
+    assert len(regressions) == 1 and regressions[0].startswith("step: p50_us")
+    assert compare(current, baseline, threshold=0.6) == []
+
+
+def test_compare_gates_tail_only_over_repeats_with_wider_threshold():
+    baseline = [{"case": "step", "p50_us": 1.0, "p99_us": 2.0, "repeats": 3}]
+    noisy = [{"case": "step", "p50_us": 1.0, "p99_us": 3.0, "repeats": 3}]
+    assert compare(noisy, baseline, threshold=0.2) == []
+    slow = [{"case": "step", "p50_us": 1.0, "p99_us": 5.0, "repeats": 3}]
+    assert compare(slow, baseline, threshold=0.2)[0].startswith("step: p99_us")
+    single = [{"case": "step", "p50_us": 1.0, "p99_us": 5.0, "repeats": 1}]
+    assert compare(single, baseline, threshold=0.2) == []
+
+
+def test_physics_cases_produce_percentiles():
+    results = physics.run(ticks=300, cases=["step_continuous", "collision_heavy"], repeat=1)
+    assert [result["case"] for result in results] == ["step_continuous", "collision_heavy"]
+    for result in results:
+        assert result["samples"] == 300
+        assert 0.0 < result["p50_us"] <= result["p99_us"] <= result["max_us"]
+        assert result["ticks_per_second"] > 0.0
+
+
+def test_vision_sweep_reports_hit_rate_per_configuration():
+    results = vision.run(
+        frames=20,
+        detectors=("ball",),
+        resolutions=((320, 240),),
+        min_areas=(0.0, 5000.0),
+    )
+    assert [result["case"] for result in results] == ["ball_320x240_a0", "ball_320x240_a5000"]
+    assert results[0]["hit_rate"] == 1.0 and results[1]["hit_rate"] == 0.0
+    for result in results:
+        assert result["targets"] == 20
+        assert result["p50_us"] <= result["p95_us"] <= result["p99_us"]
+        assert result["frames_per_second"] > 0.0 and result["cpu_us"] > 0.0
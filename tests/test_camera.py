@@ -0,0 +1,75 @@
+import time
+
+import cv2
+import numpy as np
+
+from air_hockey.engine.camera import CAPTURE_PROFILES, CameraCapture, ProbeResult
+
+
+def _write_video(path, frames: int) -> None:
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 30.0, (64, 48))
+    for index in range(frames):
+        writer.write(np.full((48, 64, 3), index * 8, dtype=np.uint8))
+    writer.release()
+
+
+def test_capture_ring_sequences_and_stats(tmp_path):
+    path = tmp_path / "clip.avi"
+    _write_video(path, frames=20)
+    camera = CameraCapture(str(path))
+    read = camera._read
+
+    def paced_read(buffer):
+        # A file decodes faster than a camera delivers; without pacing the whole clip can be
+        # read before the first wait, leaving no newer frame to wait for.
+        time.sleep(0.005)
+        return read(buffer)
+
+    camera._read = paced_read
+    assert camera.start()
+    try:
+        first = camera.wait_for_next(0, timeout=5.0)
+        assert first is not None and first.sequence >= 1
+        buffer = first.frame
+        second = camera.wait_for_next(first.sequence, timeout=5.0)
+        assert second is not None and second.sequence > first.sequence
+        assert second.timestamp >= first.timestamp
+        assert second.frame is not buffer
+
+        last_seen = second.sequence
+        while True:
+            frame = camera.wait_for_next(last_seen, timeout=0.5)
+            if frame is None:
+                break
+            last_seen = frame.sequence
+        buffers = {id(frame_slot.frame) for frame_slot in camera._frames}
+        assert len(buffers) == camera.ring_size
+    finally:
+        camera.stop()
+    stats = camera.stats()
+    assert stats.captured == 20
+    assert stats.consumed + stats.dropped == stats.captured
+
+
+def test_profile_is_applied_and_probe_reported(tmp_path):
+    path = tmp_path / "clip.avi"
+    _write_video(path, frames=3)
+    probes = []
+    camera = CameraCapture(
+        str(path), profile=CAPTURE_PROFILES["low_latency"], on_probe=probes.append
+    )
+    assert camera.start()
+    camera.stop()
+    assert len(probes) == 1 and camera.probe == probes[0]
+    assert (camera.probe.width, camera.probe.height) == (64, 48)
+    assert ProbeResult.from_dict(camera.probe.to_dict()) == camera.probe
+
+    cached = CameraCapture(str(path), cached_probe=camera.probe, on_probe=probes.append)
+    # The ring is sized from the cached probe before the first read.
+    cached._open()
+    assert all(buffer.shape == (48, 64, 3) for buffer in cached._buffers)
+    cached._close()
+    assert cached.start()
+    cached.stop()
+    assert len(probes) == 1
+    assert camera.probe.describe().startswith("64x48 @ ")
@@ -0,0 +1,38 @@
+import numpy as np
+
+from air_hockey.engine.camera import CameraFrame
+from air_hockey.engine.detection import DetectionStage
+from air_hockey.engine.hand_tracking import HandPositions
+
+
+class _FakeTracker:
+    def __init__(self, positions):
+        self.positions = list(positions)
+        self.calls = 0
+
+    def detect(self, frame_bgr, scale=1.0, frame_id=-1, timestamp=0.0):
+        self.calls += 1
+        return self.positions.pop(0)
+
+
+def test_detection_runs_once_per_camera_frame_and_filters_jumps():
+    tracker = _FakeTracker(
+        [
+            HandPositions(left=(10, 10), right=None),
+            HandPositions(left=(500, 10), right=(30, 40)),
+        ]
+    )
+    stage = DetectionStage(tracker, max_jump_px=50.0)
+    image = np.zeros((48, 64, 3), dtype=np.uint8)
+
+    first = CameraFrame(frame=image, timestamp=1.0, sequence=1)
+    assert stage.poll(first)
+    assert not stage.poll(first)
+    assert not stage.poll(None)
+    assert tracker.calls == 1 and stage.repeated == 1
+    assert stage.latest.frame_size == (64, 48)
+
+    assert stage.poll(CameraFrame(frame=image, timestamp=1.03, sequence=2))
+    assert stage.latest.left == (10, 10)
+    assert stage.latest.right == (30, 40)
+    assert stage.latest.sequence == 2 and stage.latest.timestamp == 1.03
@@ -0,0 +1,44 @@
+import cv2
+import numpy as np
+
+from air_hockey.engine.camera import CameraFrame
+from air_hockey.engine.frame_cache import FrameCache
+
+
+def _frame(sequence: int, seed: int) -> CameraFrame:
+    image = np.random.default_rng(seed).integers(0, 255, (48, 64, 3), dtype=np.uint8)
+    return CameraFrame(frame=image, timestamp=float(sequence), sequence=sequence)
+
+
+def test_derivatives_are_computed_once_per_sequence():
+    cache = FrameCache()
+    frame = _frame(1, seed=1)
+    assert cache.update(frame)
+    flipped = cache.flipped_bgr()
+    assert np.array_equal(flipped, cv2.flip(frame.frame, 1))
+    assert np.array_equal(cache.hsv(), cv2.cvtColor(flipped, cv2.COLOR_BGR2HSV))
+    small = cache.rgb((32, 24))
+    expected = cv2.cvtColor(
+        cv2.flip(cv2.resize(frame.frame, (32, 24), interpolation=cv2.INTER_LINEAR), 1),
+        cv2.COLOR_BGR2RGB,
+    )
+    assert np.array_equal(small, expected)
+    misses = cache.misses
+
+    assert not cache.update(frame)
+    assert cache.flipped_bgr() is flipped and cache.rgb((32, 24)) is small
+    assert cache.misses == misses
+
+    assert cache.update(_frame(2, seed=2))
+    assert not np.array_equal(cache.flipped_bgr(), cv2.flip(frame.frame, 1))
+    assert cache.misses == misses + 1
+
+
+def test_preview_surface_is_persistent_and_tracks_new_frames():
+    cache = FrameCache()
+    cache.update(_frame(1, seed=1))
+    surface = cache.preview_surface((32, 24))
+    assert tuple(surface.get_at((0, 0)))[:3] == tuple(cache.rgb((32, 24))[0, 0])
+    cache.update(_frame(2, seed=2))
+    assert cache.preview_surface((32, 24)) is surface
+    assert tuple(surface.get_at((5, 7)))[:3] == tuple(cache.rgb((32, 24))[7, 5])
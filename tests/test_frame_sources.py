@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from air_hockey.config.settings import Settings
+from air_hockey.engine.camera import CameraCapture
+from air_hockey.engine.frame_sources import (
+    ImageSequenceSource,
+    SyntheticSource,
+    VideoFileSource,
+    create_frame_source,
+)
+from air_hockey.main import parse_args
+
+
+def _drain(source, timeout: float = 2.0) -> list[int]:
+    sequences = []
+    last_seen = 0
+    while True:
+        frame = source.wait_for_next(last_seen, timeout=timeout)
+        if frame is None:
+            return sequences
+        sequences.append(frame.sequence)
+        last_seen = frame.sequence
+
+
+def test_image_sequence_plays_once_without_loop(tmp_path):
+    frames = np.stack([np.full((24, 32, 3), index, dtype=np.uint8) for index in range(5)])
+    path = tmp_path / "clip.npz"
+    np.savez(path, frames=frames)
+    source = ImageSequenceSource(path, fps=200.0, loop=False)
+    assert source.start()
+    try:
+        first = source.wait_for_next(0, timeout=2.0)
+        assert first is not None and first.frame.shape == (24, 32, 3)
+        _drain(source)
+        assert source.exhausted and not source.running
+    finally:
+        source.stop()
+    assert source.stats().captured == 5
+
+
+def test_synthetic_source_reports_ground_truth():
+    source = SyntheticSource(width=160, height=120, fps=120.0, balls=2, seed=3)
+    assert source.start()
+    try:
+        frame = source.wait_for_next(0, timeout=2.0)
+        assert frame is not None and frame.frame.shape == (120, 160, 3)
+        points = source.truth(frame.sequence)
+        assert points is not None and len(points) == 2
+        x, y = points[0]
+        assert tuple(frame.frame[y, x]) == (0, 140, 255)
+    finally:
+        source.stop()
+
+
+def test_factory_parses_specs(tmp_path):
+    settings = Settings()
+    assert isinstance(create_frame_source(settings), CameraCapture)
+    synthetic = create_frame_source(settings, "synthetic:320x240@90,skeleton")
+    assert isinstance(synthetic, SyntheticSource)
+    assert (synthetic.width, synthetic.height, synthetic.fps, synthetic.mode) == (
+        320,
+        240,
+        90.0,
+        "skeleton",
+    )
+    video = create_frame_source(settings, f"video-fast:{tmp_path / 'clip.avi'}")
+    assert isinstance(video, VideoFileSource) and not video.realtime
+    assert not video.start()
+
+
+def test_bad_source_specs_are_rejected_or_fall_back(caplog):
+    with pytest.raises(ValueError, match="WxH@FPS"):
+        create_frame_source(Settings(), "synthetic:wide@fast")
+    with pytest.raises(ValueError, match="unknown frame source"):
+        create_frame_source(Settings(), "webcam")
+    with pytest.raises(SystemExit):
+        parse_args(["--source", "synthetic:0x240"])
+    assert parse_args(["--source", "synthetic:320x240@60"]).source == "synthetic:320x240@60"
+
+    source = create_frame_source(Settings(frame_source="synthetic:abc"))
+    assert isinstance(source, CameraCapture)
+    assert "Ignoring frame_source setting" in caplog.text
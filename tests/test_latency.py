@@ -0,0 +1,24 @@
+import math
+
+from air_hockey.engine.latency import LatencyHistogram, LatencyTracker
+
+
+def test_histogram_percentiles_within_bucket_resolution():
+    histogram = LatencyHistogram()
+    for index in range(1, 101):
+        histogram.record(index / 1000.0)
+    assert histogram.count == 100
+    assert math.isclose(histogram.mean, 0.0505)
+    assert 0.050 <= histogram.percentile(0.5) <= 0.050 * 1.1
+    assert 0.099 <= histogram.percentile(0.99) <= 0.100
+    assert histogram.percentile(1.0) == histogram.max == 0.1
+
+
+def test_tracker_summarizes_each_stage_in_milliseconds():
+    tracker = LatencyTracker()
+    tracker.record("capture", captured_at=10.0, now=10.004)
+    tracker.record("display", captured_at=10.0, now=10.060)
+    summary = tracker.summary()
+    assert list(summary) == ["capture", "detect", "filter", "physics", "display"]
+    assert summary["detect"]["count"] == 0
+    assert 60.0 <= summary["display"]["p50_ms"] <= 60.0 * 1.1
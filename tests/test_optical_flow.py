@@ -0,0 +1,33 @@
+import numpy as np
+
+from air_hockey.engine.optical_flow import WristFlow
+
+
+def _textured(shift_x: int, shift_y: int) -> np.ndarray:
+    rng = np.random.default_rng(7)
+    texture = rng.integers(0, 255, size=(60, 80), dtype=np.uint8)
+    texture = np.kron(texture, np.ones((4, 4), dtype=np.uint8))
+    gray = np.roll(texture, (shift_y, shift_x), axis=(0, 1))
+    return np.repeat(gray[:, :, None], 3, axis=2)
+
+
+def test_wrist_flow_follows_motion_until_reanchored():
+    flow = WristFlow()
+    flow.anchor(_textured(0, 0), (100, 80), None)
+    left, right = flow.track(_textured(5, 3))
+    assert right is None
+    assert abs(left[0] - 105) <= 1 and abs(left[1] - 83) <= 1
+    left, _ = flow.track(_textured(10, 6))
+    assert abs(left[0] - 110) <= 1 and abs(left[1] - 86) <= 1
+
+    flow.anchor(_textured(10, 6), (200, 150), (40, 40))
+    left, right = flow.track(_textured(12, 6))
+    assert abs(left[0] - 202) <= 1 and abs(right[0] - 42) <= 1
+
+
+def test_wrist_flow_drops_wrist_on_unrelated_frame():
+    flow = WristFlow()
+    flow.anchor(_textured(0, 0), (100, 80), None)
+    noise = np.random.default_rng(1).integers(0, 255, size=(240, 320, 3), dtype=np.uint8)
+    assert flow.track(noise) == (None, None)
+    assert flow.lost == 1
@@ -0,0 +1,185 @@
+import math
+import random
+
+import numpy as np
+
+from air_hockey.engine.batch_physics import BatchPhysicsWorld
+from air_hockey.engine.contacts import ContactBuffer, ContactKind
+from air_hockey.engine.physics import PhysicsWorld
+from air_hockey.game.field import FieldSpec
+
+
+def _random_worlds(count: int, seed: int) -> list[PhysicsWorld]:
+    rng = random.Random(seed)
+    field = FieldSpec()
+    worlds = []
+    for _ in range(count):
+        world = PhysicsWorld(
+            field,
+            puck_restitution=rng.uniform(0.3, 1.0),
+            puck_damping=rng.choice([0.0, rng.uniform(0.1, 1.5)]),
+            max_puck_speed=rng.choice([0.0, rng.uniform(0.5, 4.0)]),
+        )
+        world.entities.puck.position = (rng.uniform(-0.9, 0.9), rng.uniform(-0.45, 0.45))
+        world.entities.puck.linearVelocity = (rng.uniform(-3, 3), rng.uniform(-3, 3))
+        worlds.append(world)
+    return worlds
+
+
+def _mallet_targets(tick: int, table: int) -> tuple[tuple[float, float], tuple[float, float]]:
+    phase = tick * 0.05 + table
+    left = (-0.5 + 0.35 * math.sin(phase), 0.3 * math.cos(phase * 1.3))
+    right = (0.5 + 0.35 * math.cos(phase * 0.7), 0.3 * math.sin(phase * 1.1))
+    return left, right
+
+
+def _assert_table_matches(batch: BatchPhysicsWorld, index: int, world: PhysicsWorld, tick: int):
+    entities = world.entities
+    bodies = {
+        "puck": (entities.puck, batch.puck_position[index], batch.puck_velocity[index]),
+        "mallet_left": (
+            entities.mallet_left,
+            batch.mallet_position[index, 0],
+            batch.mallet_velocity[index, 0],
+        ),
+        "mallet_right": (
+            entities.mallet_right,
+            batch.mallet_position[index, 1],
+            batch.mallet_velocity[index, 1],
+        ),
+    }
+    for name, (body, position, velocity) in bodies.items():
+        assert np.allclose(position, body.position, atol=1e-9), (tick, index, name, "position")
+        assert np.allclose(velocity, body.linearVelocity, atol=1e-9), (tick, index, name, "velocity")
+
+
+def test_batch_step_matches_scalar_worlds():
+    worlds = _random_worlds(16, seed=3)
+    batch = BatchPhysicsWorld.from_worlds(worlds)
+    time_step = 1.0 / 120.0
+    wall_hits = [0] * len(worlds)
+    mallet_hits = [0] * len(worlds)
+
+    for tick in range(600):
+        targets = [_mallet_targets(tick, index) for index in range(len(worlds))]
+        for index, (world, (left, right)) in enumerate(zip(worlds, targets)):
+            world.set_mallet_positions(left, right, time_step, max_speed=2.0)
+            world.step(time_step)
+            for event in world.contacts.drain():
+                if event.kind == ContactKind.WALL:
+                    wall_hits[index] += 1
+                else:
+                    mallet_hits[index] += 1
+        batch.set_mallet_positions(
+            np.array([left for left, _ in targets]),
+            np.array([right for _, right in targets]),
+            time_step,
+            max_speed=2.0,
+        )
+        batch.step(time_step)
+        for index, world in enumerate(worlds):
+            _assert_table_matches(batch, index, world, tick)
+
+    assert batch.wall_hits.tolist() == wall_hits
+    assert batch.mallet_hits.tolist() == mallet_hits
+    assert sum(mallet_hits) > 0
+
+
+def _fast_puck_world(continuous: bool) -> PhysicsWorld:
+    world = PhysicsWorld(
+        FieldSpec(), puck_damping=0.0, max_puck_speed=0.0, continuous_collision=continuous
+    )
+    world.entities.puck.position = (-0.2, 0.0)
+    world.entities.puck.linearVelocity = (30.0, 0.0)
+    world.entities.mallet_left.position = (-0.8, 0.4)
+    world.entities.mallet_right.position = (0.5, 0.0)
+    return world
+
+
+def test_discrete_step_tunnels_through_mallet():
+    world = _fast_puck_world(continuous=False)
+    for _ in range(4):
+        world.step(1.0 / 60.0)
+    assert world.entities.puck.linearVelocity[0] > 0.0
+
+
+def test_swept_step_hits_fast_mallet_and_wall():
+    world = _fast_puck_world(continuous=True)
+    for _ in range(4):
+        world.step(1.0 / 60.0)
+    events = list(world.contacts)
+    assert events and events[0].kind == ContactKind.MALLET_RIGHT
+    assert events[0].tick == 2
+    assert events[0].nx < 0.0 and events[0].impulse > 0.0
+    assert world.entities.puck.linearVelocity[0] < 0.0
+
+    world = _fast_puck_world(continuous=True)
+    world.entities.puck.position = (0.0, 0.0)
+    world.entities.puck.linearVelocity = (0.0, 80.0)
+    world.step(1.0 / 60.0)
+    assert abs(world.entities.puck.position[1]) < world.field.height / 2.0
+    assert world.entities.puck.linearVelocity[1] < 0.0
+
+
+def test_sustained_push_of_clamped_puck_sounds_once():
+    from air_hockey.ui.screens.play import PlayScreen
+
+    world = PhysicsWorld(FieldSpec(), max_puck_speed=0.3, continuous_collision=True)
+    world.entities.puck.position = (-0.55, 0.0)
+    world.entities.puck.linearVelocity = (0.0, 0.0)
+    world.set_mallet_positions((-0.7, 0.0), (0.5, 0.0), 1.0 / 120.0, teleport=True)
+    contacts = 0
+    sounds = 0
+    for frame in range(30):
+        for substep in range(4):
+            x = min(-0.15, -0.7 + 1.0 * (frame * 4 + substep + 1) / 120.0)
+            world.set_mallet_positions((x, 0.0), (0.5, 0.0), 1.0 / 120.0)
+            world.step(1.0 / 120.0)
+        mallet_impulse = 0.0
+        for event in world.contacts.drain():
+            if event.kind == ContactKind.MALLET_LEFT:
+                contacts += 1
+                mallet_impulse = max(mallet_impulse, event.impulse)
+        if PlayScreen._contact_volume(mallet_impulse * world.entities.puck.inv_mass) > 0.0:
+            sounds += 1
+
+    assert contacts > 20
+    assert sounds == 1
+
+
+def test_contact_buffer_drains_and_counts_overflow():
+    buffer = ContactBuffer(capacity=2)
+    for tick in range(3):
+        buffer.record(ContactKind.WALL, 0.0, 0.5, 0.0, -1.0, 0.1 * tick, tick)
+    assert len(buffer) == 2 and buffer.dropped == 1
+    assert [event.tick for event in buffer.drain()] == [0, 1]
+    assert len(buffer) == 0 and list(buffer) == []
+
+
+def test_predicted_trajectory_matches_stepping():
+    time_step = 1.0 / 120.0
+    world = PhysicsWorld(FieldSpec(), puck_restitution=0.9, puck_damping=0.4, max_puck_speed=4.0)
+    world.entities.mallet_left.position = (0.0, 5.0)
+    world.entities.mallet_right.position = (0.0, -5.0)
+    world.entities.puck.position = (0.3, 0.1)
+    world.entities.puck.linearVelocity = (2.5, 1.5)
+
+    prediction = world.predict_trajectory(1.5, time_step=time_step)
+    assert len(prediction.segments) > 2
+    assert prediction.goal is None
+    for tick in range(1, 181):
+        world.step(time_step)
+        if tick % 30 == 0:
+            predicted = prediction.position_at(tick * time_step)
+            assert math.dist(predicted, world.entities.puck.position) < 0.02
+
+
+def test_predicted_goal_and_crossing_time():
+    world = PhysicsWorld(FieldSpec(), puck_damping=0.0, max_puck_speed=2.0)
+    world.entities.puck.position = (0.0, 0.0)
+    world.entities.puck.linearVelocity = (-3.0, 0.0)
+    prediction = world.predict_trajectory(2.0)
+    assert prediction.goal == "left"
+    assert math.isclose(prediction.goal_time, 0.5)
+    assert math.isclose(world.time_to_reach_x(-0.5), 0.25)
+    assert world.time_to_reach_x(0.5) is None
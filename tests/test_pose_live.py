@@ -0,0 +1,20 @@
+from types import SimpleNamespace
+
+import pytest
+
+from air_hockey.engine.detection import create_hand_tracker
+from air_hockey.engine.hand_tracking import wrist_positions
+
+
+def test_live_stream_backend_requires_model(tmp_path):
+    with pytest.raises(RuntimeError, match="model not found"):
+        create_hand_tracker("live_stream", model_path=str(tmp_path / "missing.task"))
+
+
+def test_wrist_positions_accepts_task_landmark_lists():
+    points = [SimpleNamespace(x=0.0, y=0.0, visibility=0.0) for _ in range(33)]
+    points[15] = SimpleNamespace(x=0.75, y=0.5, visibility=0.9)  # left wrist
+    points[16] = SimpleNamespace(x=0.25, y=0.5, visibility=0.9)  # right wrist
+    assert wrist_positions(points, 200, 100) == ((50, 50), (150, 50))
+    points[16] = SimpleNamespace(x=0.25, y=0.5, visibility=0.1)
+    assert wrist_positions(points, 200, 100) == (None, (150, 50))
@@ -0,0 +1,69 @@
+import os
+import queue
+import time
+
+import numpy as np
+import pytest
+
+pytest.importorskip("mediapipe")
+
+from air_hockey.engine.pose_worker import READY, ProcessHandTracker
+
+
+def _detect_until(tracker, frame, frame_id, deadline_s=20.0):
+    deadline = time.monotonic() + deadline_s
+    while time.monotonic() < deadline:
+        positions = tracker.detect(frame, scale=0.5, frame_id=frame_id, timestamp=float(frame_id))
+        if positions.frame_id >= frame_id:
+            return positions
+        time.sleep(0.02)
+    raise AssertionError("pose worker produced no result")
+
+
+def test_process_tracker_returns_tagged_results_and_restarts():
+    tracker = ProcessHandTracker()
+    frame = np.zeros((240, 320, 3), dtype=np.uint8)
+    try:
+        tracker.detect(frame, scale=0.5, frame_id=0)
+        assert tracker.wait_ready()
+        positions = _detect_until(tracker, frame, frame_id=1)
+        assert positions.left is None and positions.right is None
+        assert positions.timestamp >= 1.0
+
+        tracker._process.kill()
+        tracker._process.join()
+        tracker.detect(frame, scale=0.5, frame_id=2)
+        assert tracker.restarts == 1
+        assert tracker.wait_ready()
+        _detect_until(tracker, frame, frame_id=3)
+        shm_name = tracker._shm.name
+    finally:
+        tracker.close()
+    assert not os.path.exists(f"/dev/shm/{shm_name.lstrip('/')}")
+
+
+def test_wait_ready_keeps_results_queued_before_ready():
+    tracker = ProcessHandTracker()
+    tracker._results = queue.Queue()
+    tracker._pending[0] = 0.5
+    tracker._results.put((0, 7, 7.0, (10, 20), None, True))
+    tracker._results.put((READY,))
+    assert tracker.wait_ready(timeout=1.0)
+    assert tracker._pending == {}
+    assert tracker.completed == 1
+    assert tracker._last_positions.frame_id == 7
+    assert tracker._last_positions.left == (20, 40)
+
+
+def test_worker_that_never_reports_ready_is_restarted_then_failed():
+    tracker = ProcessHandTracker(max_restarts=1, start_timeout=0.0)
+    frame = np.zeros((240, 320, 3), dtype=np.uint8)
+    try:
+        tracker.detect(frame, scale=0.5, frame_id=0)
+        tracker.detect(frame, scale=0.5, frame_id=1)
+        assert tracker.restarts == 1 and not tracker.failed
+        tracker.detect(frame, scale=0.5, frame_id=2)
+        assert tracker.failed
+        assert tracker._process is None
+    finally:
+        tracker.close()
@@ -0,0 +1,53 @@
+import threading
+import time
+
+import numpy as np
+
+from air_hockey.engine.preview_window import PreviewWindow
+
+
+class SlowWindow(PreviewWindow):
+    def __init__(self) -> None:
+        super().__init__(max_fps=0.0)
+        self.images = []
+
+    def _show(self, image):
+        self.images.append(image.copy())
+        time.sleep(0.05)
+
+    def _pump(self):
+        pass
+
+    def _destroy(self):
+        pass
+
+
+def test_post_never_waits_for_a_slow_display():
+    window = SlowWindow()
+    window.start()
+    try:
+        frame = np.zeros((24, 32, 3), dtype=np.uint8)
+        started = time.perf_counter()
+        for value in range(1, 21):
+            frame[:] = value
+            window.post(frame, markers=(((16, 12), (0, 0, 255)),))
+            time.sleep(0.005)
+        elapsed = time.perf_counter() - started
+        time.sleep(0.2)
+    finally:
+        window.close()
+    assert elapsed < 0.05 + 20 * 0.005
+    assert window.dropped > 0 and window.shown + window.dropped == 20
+    # The newest frame is always the one left for the display.
+    assert window.images[-1][0, 0, 0] == 20
+    assert tuple(window.images[-1][12, 8]) == (0, 0, 255)
+
+
+def test_unthreaded_window_shows_on_the_posting_thread():
+    window = SlowWindow()
+    window.threaded = False
+    window._show = lambda image: window.images.append(threading.get_ident())
+    window.start()
+    window.post(np.zeros((24, 32, 3), dtype=np.uint8))
+    window.close()
+    assert window.images == [threading.get_ident()] and window._thread is None
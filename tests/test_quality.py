@@ -0,0 +1,97 @@
+import threading
+import time
+
+from air_hockey.engine.hand_tracking import PoseLoader
+from air_hockey.engine.quality import QualityGovernor, QualityLevel, build_levels, nearest_level
+
+BUDGET = 1.0 / 60.0
+
+
+def test_levels_degrade_scale_then_model_then_rate():
+    levels = build_levels(min_scale=0.5, max_scale=1.0, max_process_every=2, min_complexity=0)
+    assert levels == [
+        QualityLevel(1.0, 1, 1),
+        QualityLevel(0.75, 1, 1),
+        QualityLevel(0.5, 1, 1),
+        QualityLevel(0.5, 1, 0),
+        QualityLevel(0.5, 2, 0),
+    ]
+    assert nearest_level(levels, 0.7, 1) == 1
+    assert nearest_level(levels, 1.0, 3) == 4
+
+
+def _feed(governor, frames, frame_time, inference_time=0.0):
+    changes = []
+    for _ in range(frames):
+        level = governor.observe(frame_time, inference_time)
+        if level is not None:
+            changes.append(governor.index)
+    return changes
+
+
+def test_governor_steps_down_on_sustained_overload_only():
+    governor = QualityGovernor(build_levels(), down_frames=30, hold_frames=60)
+    assert _feed(governor, 10, BUDGET * 2.0) == []
+    assert _feed(governor, 200, BUDGET * 0.9) == []
+    assert _feed(governor, 60, BUDGET * 2.0) == [1]
+    assert _feed(governor, 59, BUDGET * 2.0) == []
+    assert _feed(governor, 40, BUDGET * 2.0) == [2]
+
+
+def test_governor_backs_off_after_failed_upgrade():
+    governor = QualityGovernor(
+        build_levels(), start_index=2, up_frames=100, down_frames=10, hold_frames=20
+    )
+    # Headroom: upgrade after hold-free dwell of up_frames.
+    assert _feed(governor, 150, BUDGET * 0.5) == [1]
+    # The upgraded level overloads right away: back down and double the next dwell.
+    assert _feed(governor, 25, BUDGET * 2.0) == [2]
+    assert _feed(governor, 150, BUDGET * 0.5) == []
+    assert _feed(governor, 100, BUDGET * 0.5) == [1]
+
+
+def test_upgrade_waits_when_predicted_inference_does_not_fit():
+    governor = QualityGovernor(build_levels(), start_index=1, up_frames=50, hold_frames=0)
+    # 9 ms frames with 8 ms inference: scale 0.75 -> 1.0 adds ~6 ms, which overshoots.
+    assert _feed(governor, 200, 0.009, 0.008) == []
+    assert _feed(governor, 200, 0.009, 0.002) == [0]
+
+
+class FakeGraph:
+    def __init__(self, complexity):
+        self.complexity = complexity
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_pose_loader_builds_off_the_calling_thread():
+    release = threading.Event()
+
+    def build(complexity):
+        if complexity == 2:
+            raise RuntimeError("download failed")
+        release.wait(timeout=5.0)
+        return FakeGraph(complexity)
+
+    loader = PoseLoader(build, count=2)
+    started = time.perf_counter()
+    assert loader.request(0)
+    assert time.perf_counter() - started < 0.05
+    assert loader.take() is None
+    release.set()
+    deadline = time.monotonic() + 5.0
+    loaded = None
+    while loaded is None and time.monotonic() < deadline:
+        loaded = loader.take()
+        time.sleep(0.01)
+    complexity, graphs = loaded
+    assert complexity == 0 and [graph.complexity for graph in graphs] == [0, 0]
+
+    assert loader.request(2)
+    deadline = time.monotonic() + 5.0
+    while not loader.failed and time.monotonic() < deadline:
+        time.sleep(0.01)
+    loader.close()
+    assert loader.failed == {2} and not loader.request(2) and loader.take() is None
@@ -0,0 +1,35 @@
+from air_hockey.bench import vision
+from air_hockey.engine.roi import RoiTracker
+
+
+def test_roi_pads_by_velocity_and_falls_back_after_misses():
+    roi = RoiTracker(padding=0.05, velocity_gain=2.0, max_misses=2)
+    assert roi.region((640, 480)) is None
+    roi.update((100, 100, 110, 110))
+    assert roi.region((640, 480)) == (68, 68, 143, 143)
+
+    roi.update((120, 100, 130, 110))  # smoothed velocity (10, 0)
+    x0, y0, x1, y1 = roi.region((640, 480))
+    assert (x0, x1) == (78, 193) and (y0, y1) == (68, 143)
+
+    roi.update(None)
+    assert roi.region((640, 480))[2] > x1  # widened and moved further along the motion
+    roi.update(None)
+    assert roi.region((640, 480)) is None
+    assert roi.full_searches == 2 and roi.roi_searches == 3
+
+    roi.update((300, 200, 310, 210))
+    assert roi.region((640, 480)) == (268, 168, 343, 243)
+
+
+def test_ball_roi_tracking_keeps_hit_rate():
+    results = vision.run(
+        frames=30,
+        detectors=("ball", "ball_masked"),
+        resolutions=((320, 240),),
+        min_areas=(0.0,),
+        rois=(False, True),
+    )
+    by_case = {result["case"]: result for result in results}
+    assert by_case["ball_320x240_a0_roi"]["hit_rate"] == by_case["ball_320x240_a0"]["hit_rate"]
+    assert by_case["ball_masked_320x240_a0_roi"]["roi"] is True
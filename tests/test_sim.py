@@ -0,0 +1,100 @@
+from dataclasses import replace
+
+import pytest
+
+from air_hockey.engine.contacts import ContactKind
+from air_hockey.game.field import FieldSpec
+from air_hockey.sim.runner import IdleInput, MatchSimulator, SimulationConfig, run_match
+
+
+def test_headless_match_is_deterministic_and_scores():
+    config = SimulationConfig(duration_s=60.0, max_puck_speed=4.0)
+    first = run_match(config, left="cpu:medium", right="script", seed=1)
+    second = run_match(config, left="cpu:medium", right="script", seed=1)
+    assert first.ticks == 7200
+    assert (first.score_left, first.score_right) == (second.score_left, second.score_right)
+    assert first.goals == second.goals
+    assert len(first.goals) == first.score_left + first.score_right > 0
+
+
+def test_headless_match_stops_at_max_goals():
+    config = SimulationConfig(duration_s=120.0, max_puck_speed=4.0, max_goals=1)
+    result = run_match(config, left="cpu:hard", right="idle", seed=0)
+    assert len(result.goals) == 1
+    assert result.ticks < 120 * 120
+
+
+class _PushInput:
+    """Walks the left mallet steadily toward the centre line."""
+
+    def __init__(self) -> None:
+        self.x = -0.7
+
+    def update(self, world, time_step):
+        self.x = min(-0.15, self.x + 0.8 * time_step)
+        return (self.x, 0.0)
+
+    def reset(self) -> None:
+        pass
+
+
+def test_sustained_push_counts_as_one_hit():
+    field_spec = FieldSpec()
+    config = SimulationConfig(duration_s=1.0, max_puck_speed=0.3)
+    simulator = MatchSimulator(config, _PushInput(), IdleInput(field_spec, left=False), field_spec)
+    simulator.physics.set_mallet_positions((-0.7, 0.0), (0.5, 0.0), config.time_step, teleport=True)
+    simulator.physics.entities.puck.position = (-0.55, 0.0)
+    contact_ticks = set()
+    record = simulator.physics.contacts.record
+
+    def spy(kind, *args):
+        if kind == ContactKind.MALLET_LEFT:
+            contact_ticks.add(args[-1])
+        record(kind, *args)
+
+    simulator.physics.contacts.record = spy
+    result = simulator.run()
+
+    assert len(contact_ticks) > 20
+    assert result.mallet_hits == 1
+    assert result.rally_hits == [1]
+
+
+def test_sweep_ranks_and_applies_best(tmp_path, monkeypatch):
+    from air_hockey.config import io
+    from air_hockey.sim import sweep
+
+    monkeypatch.setattr(io, "get_user_data_dir", lambda: tmp_path)
+    assert sweep.parse_axis("0.5:0.9:0.2") == [0.5, 0.7, 0.9]
+    assert sweep.parse_axis("2,4") == [2.0, 4.0]
+
+    base = SimulationConfig(duration_s=10.0)
+    results = [
+        sweep.evaluate({"max_puck_speed": speed}, base, [0, 1], "script", "script")
+        for speed in (1.0, 4.0)
+    ]
+    assert all(metrics.matches == 2 for metrics in results)
+    output = tmp_path / "sweep.csv"
+    sweep.write_results(output, results)
+    assert output.read_text().startswith("rank,")
+
+    sweep.apply_to_settings(results[1])
+    assert io.load_settings().max_puck_speed == 4.0
+
+
+def test_sweep_rally_is_not_won_by_pushing_a_slow_puck(tmp_path, monkeypatch):
+    from air_hockey.config import io
+    from air_hockey.sim import sweep
+
+    monkeypatch.setattr(io, "get_user_data_dir", lambda: tmp_path)
+    base = SimulationConfig(duration_s=60.0)
+    slow, fast = (
+        sweep.evaluate({"max_puck_speed": speed}, base, [0, 1, 2, 3], "script", "script")
+        for speed in (0.3, 3.0)
+    )
+    assert fast.rank_value("rally") > slow.rank_value("rally")
+
+    degenerate = replace(slow, goals_per_minute=0.0)
+    with pytest.raises(ValueError, match="no goals"):
+        sweep.apply_to_settings(degenerate)
+    assert not (tmp_path / "settings.json").exists()
@@ -0,0 +1,34 @@
+import math
+
+from air_hockey.engine.timestep import FixedStepClock, OverrunPolicy
+
+STEP = 1.0 / 120.0
+
+
+def test_regular_frames_run_whole_steps_and_keep_remainder():
+    clock = FixedStepClock(STEP, max_catchup_steps=4)
+    assert [clock.advance(1.0 / 60.0) for _ in range(3)] == [2, 2, 2]
+    assert clock.advance(STEP * 0.5) == 0
+    assert clock.advance(STEP * 0.5) == 1
+    assert clock.dropped_time == 0.0 and clock.capped_frames == 0
+
+
+def test_hitch_is_capped_and_dropped():
+    clock = FixedStepClock(STEP, max_catchup_steps=4, policy=OverrunPolicy.DROP)
+    assert clock.advance(0.5) == 4
+    assert clock.capped_frames == 1
+    assert clock.accumulator < STEP
+    assert math.isclose(clock.dropped_time + clock.accumulator, 0.5 - 4 * STEP)
+    assert clock.advance(1.0 / 60.0) == 2
+
+
+def test_slow_motion_carries_bounded_backlog():
+    clock = FixedStepClock(STEP, max_catchup_steps=4, policy=OverrunPolicy.SLOW_MOTION)
+    assert clock.advance(6 * STEP) == 4
+    assert clock.dropped_time == 0.0
+    assert clock.advance(0.0) == 2
+
+    assert clock.advance(0.5) == 4
+    assert math.isclose(clock.backlog, 3 * STEP)
+    assert clock.dropped_time > 0.0
+    assert [clock.advance(0.0) for _ in range(2)] == [4, 0]
@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from air_hockey.engine.detection import create_hand_tracker
+
+
+class FakePose:
+    def __init__(self, wrists):
+        self.wrists = wrists
+
+    def process(self, rgb):
+        points = [SimpleNamespace(x=0.0, y=0.0, visibility=0.0) for _ in range(33)]
+        for index, (x, y, visibility) in self.wrists.items():
+            points[index] = SimpleNamespace(x=x, y=y, visibility=visibility)
+        return SimpleNamespace(pose_landmarks=SimpleNamespace(landmark=points))
+
+    def close(self):
+        pass
+
+
+def test_two_player_tracker_keeps_wrist_and_player_identity():
+    tracker = create_hand_tracker("two_player")
+    for pose in tracker._poses:
+        pose.close()
+    left_player = FakePose({15: (0.5, 0.5, 0.9), 16: (0.25, 0.5, 0.6)})
+    right_player = FakePose({15: (0.5, 0.25, 0.4), 16: (0.5, 0.75, 0.9)})
+    tracker._poses = [left_player, right_player]
+    frame = np.zeros((100, 200, 3), dtype=np.uint8)
+    try:
+        # Halves overlap by 10% of the width: columns 0..120 and 80..200.
+        positions = tracker.detect(frame)
+        assert (positions.left, positions.right) == ((60, 50), (140, 75))
+
+        # The chosen wrist stays in control while it is visible, even if the other is more so.
+        left_player.wrists[16] = (0.25, 0.5, 1.0)
+        assert tracker.detect(frame).left == (60, 50)
+
+        # Each crop now sees the other player's wrist in the overlap (left crop x=108,
+        # right crop x=92); matching to the previous positions keeps the mallets apart.
+        left_player.wrists[15] = (0.9, 0.75, 0.9)
+        right_player.wrists[16] = (0.1, 0.5, 0.9)
+        positions = tracker.detect(frame)
+        assert (positions.left, positions.right) == ((92, 50), (108, 75))
+    finally:
+        tracker.close()